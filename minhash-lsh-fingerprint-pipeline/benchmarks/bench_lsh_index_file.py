@@ -0,0 +1,120 @@
+"""
+File Name: bench_lsh_index_file.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Benchmark — persisting the corpus LSH index as a pickled
+             MinHashLSH vs the memory-mapped .lshx format: save, load, and
+             load + one query (the cold-start cost a service pays), and Q
+             queries one by one and as one query_batch (the pickle row repeats
+             its loop).  Asserts both return the same candidates.
+
+Note: Run from the minhash-lsh-fingerprint-pipeline directory:
+          python benchmarks/bench_lsh_index_file.py [--docs 20000] [--queries 2000]
+      Timings are the best of --repeat runs (default 3).
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- Python 3.12+
+"""
+
+import argparse
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from bench_near_duplicate_query import make_corpus
+from datasketch import MinHash, MinHashLSH
+
+from docfp.processors.lsh_index_builder import LshIndexBuilder
+from docfp.processors.lsh_index_file import MappedLshIndex
+
+
+def best_of(repeat: int, fn, *args):
+    """Return (min wall seconds, last result) over repeat calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def pickle_save(corpus: dict[str, MinHash], path: Path, threshold: float, num_perm: int) -> Path:
+    lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+    for doc_id, mh in corpus.items():
+        lsh.insert(doc_id, mh)
+    with open(path, "wb") as fh:
+        pickle.dump(lsh, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def lshx_save(builder: LshIndexBuilder, corpus: dict[str, MinHash], out_dir: Path) -> Path:
+    index = MappedLshIndex(threshold=builder.threshold, num_perm=builder.num_perm)
+    index.insert_batch(list(corpus), np.stack([mh.hashvalues for mh in corpus.values()]))
+    return builder.save(index, out_dir)
+
+
+def pickle_load(path: Path) -> MinHashLSH:
+    with open(path, "rb") as fh:
+        return pickle.load(fh)  # noqa: S301 — benchmark's own artifact
+
+
+def query_all(lsh, corpus: dict[str, MinHash], queries: list[str]) -> dict[str, list[str]]:
+    return {q: sorted(lsh.query(corpus[q])) for q in queries}
+
+
+def query_batch(index, corpus: dict[str, MinHash], queries: list[str]) -> dict[str, list[str]]:
+    found = index.query_batch(np.stack([corpus[q].hashvalues for q in queries]))
+    return {q: sorted(candidates) for q, candidates in zip(queries, found)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pickled MinHashLSH vs memory-mapped .lshx")
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.docs, args.num_perm)
+    queries = list(corpus)[: args.queries]
+    builder = LshIndexBuilder(threshold=args.threshold, num_perm=args.num_perm)
+    first = corpus[queries[0]]
+
+    with tempfile.TemporaryDirectory(prefix="docfp_bench_lshx_") as tmp:
+        pkl_path = Path(tmp) / "corpus_lsh_index.pkl"
+        pkl_save_s, _ = best_of(
+            args.repeat, pickle_save, corpus, pkl_path, args.threshold, args.num_perm
+        )
+        lshx_save_s, lshx_path = best_of(args.repeat, lshx_save, builder, corpus, Path(tmp))
+        pkl_load_s, lsh = best_of(args.repeat, pickle_load, pkl_path)
+        lshx_load_s, index = best_of(args.repeat, builder.load, lshx_path)
+        pkl_first_s, _ = best_of(args.repeat, lambda: pickle_load(pkl_path).query(first))
+        lshx_first_s, _ = best_of(args.repeat, lambda: builder.load(lshx_path).query(first))
+        pkl_query_s, expected = best_of(args.repeat, query_all, lsh, corpus, queries)
+        lshx_query_s, actual = best_of(args.repeat, query_all, index, corpus, queries)
+        lshx_batch_s, batched = best_of(args.repeat, query_batch, index, corpus, queries)
+        pkl_mb = pkl_path.stat().st_size / 1e6
+        lshx_mb = lshx_path.stat().st_size / 1e6
+        del index  # release the mapping before the directory is removed
+
+    identical = actual == expected and batched == expected
+    print(f"{'docs':>7} {'step':>18} {'pickle (s)':>11} {'lshx (s)':>10}")
+    for step, pkl_s, lshx_s in (
+        ("save", pkl_save_s, lshx_save_s),
+        ("load", pkl_load_s, lshx_load_s),
+        ("load+first query", pkl_first_s, lshx_first_s),
+        (f"{len(queries)} queries", pkl_query_s, lshx_query_s),
+        ("query_batch", pkl_query_s, lshx_batch_s),
+    ):
+        print(f"{args.docs:>7} {step:>18} {pkl_s:>11.4f} {lshx_s:>10.4f}")
+    print(f"size pickle {pkl_mb:.1f} MB  lshx {lshx_mb:.1f} MB  identical {identical}")
+    assert identical, "LSH index candidates mismatch"
+
+
+if __name__ == "__main__":
+    main()
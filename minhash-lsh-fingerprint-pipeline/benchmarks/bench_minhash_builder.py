@@ -0,0 +1,74 @@
+"""
+File Name: bench_minhash_builder.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Benchmark — per-value MinHash.update loop (the original
+             MinHashSignatureBuilder.build) vs the vectorized
+             MinHashSignatureBuilder.build_batch.  Asserts both produce
+             bit-identical hashvalues for every input size.
+
+Note: Run from the minhash-lsh-fingerprint-pipeline directory:
+          python benchmarks/bench_minhash_builder.py [--sizes 10000 100000]
+      Inputs are seeded random xxhash64-range values with ~20% duplicates,
+      mirroring the repeated shingles of real documents.
+
+Requirements:
+- datasketch>=1.6
+- numpy
+- Python 3.12+
+"""
+
+import argparse
+import time
+
+import numpy as np
+from datasketch import MinHash
+
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 500_000]
+NUM_PERM = 128
+
+
+def legacy_build(shingle_hashes: list[int], num_perm: int) -> MinHash:
+    """Original per-value loop: one SHA-1 + permutation pass per hash."""
+    mh = MinHash(num_perm=num_perm)
+    for h in shingle_hashes:
+        mh.update(h.to_bytes(8, byteorder="little"))
+    return mh
+
+
+def synthetic_hashes(size: int, seed: int = 42) -> np.ndarray:
+    """Seeded uint64 hashes where ~20% of values repeat earlier ones."""
+    rng = np.random.default_rng(seed)
+    distinct = rng.integers(0, np.iinfo(np.uint64).max, size=max(1, size * 4 // 5), dtype=np.uint64)
+    return rng.choice(distinct, size=size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MinHash loop vs batch benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--num-perm", type=int, default=NUM_PERM)
+    args = parser.parse_args()
+
+    builder = MinHashSignatureBuilder(num_perm=args.num_perm)
+    print(f"{'shingles':>10} {'loop (s)':>10} {'batch (s)':>10} {'speedup':>8}  identical")
+    for size in args.sizes:
+        hashes = synthetic_hashes(size)
+        as_list = [int(h) for h in hashes]
+
+        t0 = time.perf_counter()
+        expected = legacy_build(as_list, args.num_perm)
+        loop_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        actual = builder.build_batch(hashes, document_id="bench")
+        batch_s = time.perf_counter() - t0
+
+        identical = np.array_equal(expected.hashvalues, actual.hashvalues)
+        print(f"{size:>10} {loop_s:>10.3f} {batch_s:>10.3f} {loop_s / batch_s:>7.1f}x  {identical}")
+        assert identical, f"signature mismatch at size={size}"
+
+
+if __name__ == "__main__":
+    main()
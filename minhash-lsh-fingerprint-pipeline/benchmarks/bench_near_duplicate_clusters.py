@@ -0,0 +1,122 @@
+"""
+File Name: bench_near_duplicate_clusters.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Benchmark — clustering a corpus by looping MinHashLSH.query +
+             MinHash.jaccard per document with a Python union-find vs one
+             NearDuplicateClusterProcessor.run.  Asserts both produce the
+             same partition of the corpus.
+
+Note: Run from the minhash-lsh-fingerprint-pipeline directory:
+          python benchmarks/bench_near_duplicate_clusters.py [--docs 20000] [--workers 0]
+      The corpus is the synthetic near-duplicate corpus of
+      bench_near_duplicate_query.py.  Index build time is excluded from the
+      loop timing; timings are the best of --repeat runs (default 3).
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- pyarrow>=18
+- Python 3.12+
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow.parquet as pq
+from bench_near_duplicate_query import make_corpus
+from datasketch import MinHash, MinHashLSH
+
+from docfp.processors.minhash_signature_store import MinHashSignatureStore
+from docfp.processors.near_duplicate_cluster_processor import NearDuplicateClusterProcessor
+
+
+def loop_clusters(
+    lsh: MinHashLSH, corpus: dict[str, MinHash], threshold: float
+) -> dict[str, str]:
+    """lsh.query + jaccard per document, merged with a dict union-find."""
+    parent = {doc_id: doc_id for doc_id in corpus}
+
+    def find(doc_id: str) -> str:
+        while parent[doc_id] != doc_id:
+            parent[doc_id] = parent[parent[doc_id]]
+            doc_id = parent[doc_id]
+        return doc_id
+
+    for doc_id, mh in corpus.items():
+        for key in lsh.query(mh):
+            if key != doc_id and mh.jaccard(corpus[key]) >= threshold:
+                a, b = find(doc_id), find(key)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+    return {doc_id: find(doc_id) for doc_id in corpus}
+
+
+def processor_clusters(processor: NearDuplicateClusterProcessor, out_dir: Path) -> dict[str, str]:
+    report = processor.run(out_dir, include_singletons=True)
+    table = pq.read_table(report.parquet_path, columns=["document_id", "cluster_id"])
+    return dict(zip(table["document_id"].to_pylist(), table["cluster_id"].to_pylist()))
+
+
+def partition(labels: dict[str, str]) -> set[frozenset[str]]:
+    """Return the clusters as a set of member sets, ignoring label choice."""
+    groups: dict[str, set[str]] = {}
+    for doc_id, label in labels.items():
+        groups.setdefault(label, set()).add(doc_id)
+    return {frozenset(g) for g in groups.values()}
+
+
+def best_of(repeat: int, fn, *args):
+    """Return (min wall seconds, last result) over repeat calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Looped lsh.query clustering vs cluster processor")
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.docs, args.num_perm)
+    lsh = MinHashLSH(threshold=args.threshold, num_perm=args.num_perm)
+    for doc_id, mh in corpus.items():
+        lsh.insert(doc_id, mh)
+
+    with tempfile.TemporaryDirectory(prefix="docfp_bench_clusters_") as tmp:
+        MinHashSignatureStore(Path(tmp), num_perm=args.num_perm).append(corpus)
+        processor = NearDuplicateClusterProcessor(
+            Path(tmp),
+            threshold=args.threshold,
+            num_perm=args.num_perm,
+            max_workers=args.workers,
+        )
+        loop_s, expected = best_of(args.repeat, loop_clusters, lsh, corpus, args.threshold)
+        batch_s, actual = best_of(
+            args.repeat, processor_clusters, processor, Path(tmp) / "clusters"
+        )
+
+    expected_groups, actual_groups = partition(expected), partition(actual)
+    identical = expected_groups == actual_groups
+    clusters = sum(1 for g in expected_groups if len(g) > 1)
+    print(
+        f"{'docs':>7} {'clusters':>9} {'loop (s)':>9} {'batch (s)':>10} {'speedup':>8}  identical"
+    )
+    print(
+        f"{args.docs:>7} {clusters:>9} {loop_s:>9.3f} {batch_s:>10.3f} "
+        f"{loop_s / batch_s:>7.1f}x  {identical}"
+    )
+    assert identical, "near-duplicate clusters mismatch"
+
+
+if __name__ == "__main__":
+    main()
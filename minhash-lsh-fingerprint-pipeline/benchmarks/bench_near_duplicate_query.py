@@ -0,0 +1,123 @@
+"""
+File Name: bench_near_duplicate_query.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Benchmark — looping MinHashLSH.query + MinHash.jaccard per query
+             document vs one NearDuplicateQueryService.query_documents call over
+             the same corpus.  Asserts identical top-k neighbours and
+             similarities.
+
+Note: Run from the minhash-lsh-fingerprint-pipeline directory:
+          python benchmarks/bench_near_duplicate_query.py [--docs 20000] [--queries 10000]
+      The corpus is synthetic signatures: random base rows plus copies with
+      a random fraction of values replaced, so every query has genuine
+      near-duplicates.  Timings are the best of --repeat runs (default 3).
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- Python 3.12+
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from datasketch import MinHash, MinHashLSH
+
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+from docfp.processors.minhash_signature_store import MinHashSignatureStore
+from docfp.processors.near_duplicate_query_service import NearDuplicateQueryService
+
+
+def make_corpus(docs: int, num_perm: int, seed: int = 42) -> dict[str, MinHash]:
+    """Return docs signatures: quarter random bases, the rest perturbed copies."""
+    rng = np.random.default_rng(seed)
+    bases = rng.integers(0, 2**32 - 1, size=(max(1, docs // 4), num_perm), dtype=np.uint64)
+    rows = bases[rng.integers(0, len(bases), size=docs)].copy()
+    rows[: len(bases)] = bases
+    replace = rng.random(rows.shape) < rng.uniform(0.0, 0.6, size=(docs, 1))
+    replace[: len(bases)] = False
+    rows[replace] = rng.integers(0, 2**32 - 1, size=int(replace.sum()), dtype=np.uint64)
+    builder = MinHashSignatureBuilder(num_perm=num_perm)
+    return {f"{i:064x}": builder.from_hashvalues(row) for i, row in enumerate(rows)}
+
+
+def loop_query(
+    lsh: MinHashLSH, corpus: dict[str, MinHash], queries: list[str], top_k: int, threshold: float
+) -> dict[str, list[tuple[str, float]]]:
+    """lsh.query per document, then jaccard-verify and rank in Python."""
+    results = {}
+    for doc_id in queries:
+        mh = corpus[doc_id]
+        scored = [
+            (key, mh.jaccard(corpus[key])) for key in lsh.query(mh) if key != doc_id
+        ]
+        scored = [s for s in scored if s[1] >= threshold]
+        scored.sort(key=lambda s: (-s[1], s[0]))
+        results[doc_id] = scored[:top_k]
+    return results
+
+
+def batch_query(
+    service: NearDuplicateQueryService, queries: list[str], top_k: int
+) -> dict[str, list[tuple[str, float]]]:
+    return {
+        q: [(m.document_id, m.similarity) for m in matches]
+        for q, matches in service.query_documents(queries, top_k=top_k).items()
+    }
+
+
+def best_of(repeat: int, fn, *args):
+    """Return (min wall seconds, last result) over repeat calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Looped lsh.query vs batch query service")
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.docs, args.num_perm)
+    queries = list(corpus)[: args.queries]
+    lsh = MinHashLSH(threshold=args.threshold, num_perm=args.num_perm)
+    for doc_id, mh in corpus.items():
+        lsh.insert(doc_id, mh)
+
+    with tempfile.TemporaryDirectory(prefix="docfp_bench_query_") as tmp:
+        MinHashSignatureStore(Path(tmp), num_perm=args.num_perm).append(corpus)
+        service = NearDuplicateQueryService(
+            Path(tmp), threshold=args.threshold, num_perm=args.num_perm
+        )
+        loop_s, expected = best_of(
+            args.repeat, loop_query, lsh, corpus, queries, args.top_k, args.threshold
+        )
+        batch_s, actual = best_of(args.repeat, batch_query, service, queries, args.top_k)
+
+    identical = actual == expected
+    matches = sum(len(v) for v in expected.values())
+    print(
+        f"{'docs':>7} {'queries':>8} {'matches':>8} {'loop q/s':>10} {'batch q/s':>10} "
+        f"{'speedup':>8}  identical"
+    )
+    print(
+        f"{args.docs:>7} {len(queries):>8} {matches:>8} {len(queries) / loop_s:>10.0f} "
+        f"{len(queries) / batch_s:>10.0f} {loop_s / batch_s:>7.1f}x  {identical}"
+    )
+    assert identical, "near-duplicate results mismatch"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+File Name: bench_partitioned_fingerprint.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Benchmark — fingerprinting one large document in a single process
+             (hash_batch → hash signature → build_batch) vs
+             PartitionedFingerprintProcessor hashing overlapping token
+             partitions in worker processes.  Asserts identical shingle hashes,
+             hash signature and MinHash.
+
+Note: Run from the minhash-lsh-fingerprint-pipeline directory:
+          python benchmarks/bench_partitioned_fingerprint.py [--tokens 2000000] [--workers 4]
+      Timings are the best of --repeat runs (default 3) and include process
+      pool start-up; the partitioned path only pays off with several cores.
+
+Requirements:
+- datasketch>=1.6
+- numpy
+- Python 3.12+
+"""
+
+import argparse
+
+import numpy as np
+from bench_shingle_hashing import best_of, synthetic_tokens
+
+from docfp.models.partitioned_fingerprint import PartitionedFingerprint
+from docfp.models.shingle_batch import ShingleBatch
+from docfp.processors.hash_signature_processor import DocumentHashSignatureProcessor
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+from docfp.processors.partitioned_fingerprint_processor import PartitionedFingerprintProcessor
+from docfp.processors.shingle_hash_processor import ShingleHashProcessor
+from docfp.processors.word_shingle_generator import WordShingleGenerator
+
+DEFAULT_TOKENS = [500_000, 2_000_000]
+
+
+def single_process(batch: ShingleBatch, num_perm: int) -> tuple:
+    """Unpartitioned path used by the per-document assets."""
+    hashed = ShingleHashProcessor().hash_batch(batch)
+    sig, unique_count = DocumentHashSignatureProcessor().compute(hashed.shingle_hash_sha256)
+    mh = MinHashSignatureBuilder(num_perm=num_perm).build_batch(hashed.shingle_hash64, "bench")
+    return hashed, sig, unique_count, mh
+
+
+def same_result(expected: tuple, actual: PartitionedFingerprint) -> bool:
+    hashed, sig, unique_count, mh = expected
+    return (
+        np.array_equal(hashed.shingle_hash64, actual.shingles.shingle_hash64)
+        and np.array_equal(hashed.shingle_hash_sha256, actual.shingles.shingle_hash_sha256)
+        and sig == actual.hash_signature_sha256
+        and unique_count == actual.unique_shingle_hash_count
+        and np.array_equal(mh.hashvalues, actual.minhash.hashvalues)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Single-process vs partitioned fingerprinting")
+    parser.add_argument("--tokens", type=int, nargs="+", default=DEFAULT_TOKENS)
+    parser.add_argument("--partition-size", type=int, default=250_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'tokens':>10} {'partitions':>10} {'single (s)':>11} "
+        f"{'partitioned (s)':>16} {'speedup':>8}  identical"
+    )
+    for count in args.tokens:
+        batch = WordShingleGenerator().generate_batch(
+            "bench", "bench", "bench.txt", synthetic_tokens(count)
+        )
+        single_s, expected = best_of(args.repeat, single_process, batch, args.num_perm)
+        processor = PartitionedFingerprintProcessor(
+            num_perm=args.num_perm, partition_size=args.partition_size, max_workers=args.workers
+        )
+        partitioned_s, actual = best_of(args.repeat, processor.fingerprint_batch, batch)
+
+        identical = same_result(expected, actual)
+        print(
+            f"{count:>10} {actual.partition_count:>10} {single_s:>11.3f} "
+            f"{partitioned_s:>16.3f} {single_s / partitioned_s:>7.1f}x  {identical}"
+        )
+        assert identical, f"partitioned fingerprint mismatch at tokens={count}"
+
+
+if __name__ == "__main__":
+    main()
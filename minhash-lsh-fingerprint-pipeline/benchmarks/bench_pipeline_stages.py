@@ -0,0 +1,210 @@
+"""
+File Name: bench_pipeline_stages.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Benchmark suite — times every per-document pipeline stage on
+             seeded synthetic corpora (TextNormalizer, FusedTextNormalizer,
+             TokenizerProcessor, WordShingleGenerator, ShingleHashProcessor,
+             ShingleParquetWriter, MinHashSignatureBuilder, LshIndexBuilder
+             build / save and MappedLshIndex query) and compares the timings
+             with a stored baseline.
+
+Note: Run from the minhash-lsh-fingerprint-pipeline directory:
+          python benchmarks/bench_pipeline_stages.py [--tokens 1000 100000 10000000]
+          python benchmarks/bench_pipeline_stages.py --check            # exit 1 on regression
+          python benchmarks/bench_pipeline_stages.py --update-baseline  # re-record
+      Timings are the best of --repeat runs (default 3).  The corpus is
+      Zipf-distributed pseudo-words with capitals, punctuation and line
+      breaks, generated in-process from --seed (generate_docs.py needs the
+      external articles_100.train file), so every run sees the same text.
+      For the LSH stages the shingle hashes are cut into documents of
+      --doc-tokens shingles, one MinHash each.  --check fails a stage when
+      it is slower than baseline × (1 + --tolerance) + --slack-seconds;
+      baselines are machine-specific, so record one per machine.
+
+Requirements:
+- datasketch>=1.6
+- numpy
+- pyarrow>=18
+- Python 3.12+
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+from bench_shingle_hashing import best_of
+
+from docfp.processors.fused_text_normalizer import FusedTextNormalizer
+from docfp.processors.lsh_index_builder import LshIndexBuilder
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+from docfp.processors.shingle_hash_processor import ShingleHashProcessor
+from docfp.processors.text_normalizer import TextNormalizer
+from docfp.processors.tokenizer import TokenizerProcessor
+from docfp.processors.word_shingle_generator import WordShingleGenerator
+from docfp.writers.shingle_parquet_writer import ShingleParquetWriter
+
+DEFAULT_TOKENS = [1_000, 100_000, 1_000_000]
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+VOCABULARY_SIZE = 50_000
+SYLLABLES = ["ka", "ri", "to", "men", "sa", "lu", "ver", "di", "on", "pe", "qua", "ex", "no", "th"]
+SEPARATORS = [" ", ", ", ". ", "; ", " (", ") ", "\n", " - ", "'s "]
+SEPARATOR_WEIGHTS = [80, 6, 5, 1, 1, 1, 3, 1, 2]
+
+
+def synthetic_text(tokens: int, seed: int = 42) -> str:
+    """Seeded prose-like text of Zipf-distributed pseudo-words."""
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4)))
+        for _ in range(VOCABULARY_SIZE)
+    ]
+    vocabulary = [word.capitalize() if i % 7 == 0 else word for i, word in enumerate(vocabulary)]
+    weights = [1 / rank for rank in range(1, VOCABULARY_SIZE + 1)]
+    words = rng.choices(vocabulary, weights=weights, k=tokens)
+    separators = rng.choices(SEPARATORS, weights=SEPARATOR_WEIGHTS, k=tokens)
+    return "".join(w + s for w, s in zip(words, separators))
+
+
+def run_stages(tokens: int, args: argparse.Namespace, out_dir: Path) -> dict[str, float]:
+    """Time each stage on a corpus of tokens words; return stage → best seconds."""
+    text = synthetic_text(tokens, args.seed)
+    timings: dict[str, float] = {}
+
+    timings["text_normalizer"], normalized = best_of(
+        args.repeat, TextNormalizer().normalize, "bench", "bench.txt", text
+    )
+    timings["fused_text_normalizer"], (fused, _) = best_of(
+        args.repeat, FusedTextNormalizer().normalize_tokens, "bench", "bench.txt", text
+    )
+    assert fused.text == normalized.text, f"v2 normalization differs at tokens={tokens}"
+
+    timings["tokenizer"], token_list = best_of(
+        args.repeat, TokenizerProcessor().tokenize, normalized.text, "bench"
+    )
+    timings["word_shingles"], batch = best_of(
+        args.repeat,
+        WordShingleGenerator(shingle_size=args.shingle_size).generate_batch,
+        "bench",
+        "bench.txt",
+        "bench.txt",
+        token_list,
+    )
+    timings["shingle_hash"], hashed = best_of(args.repeat, ShingleHashProcessor().hash_batch, batch)
+    assert len(hashed.shingle_hash64) == max(0, len(token_list) - args.shingle_size + 1)
+
+    timings["shingle_parquet"], parquet_path = best_of(
+        args.repeat, ShingleParquetWriter().write, hashed, out_dir
+    )
+    assert parquet_path.stat().st_size > 0
+
+    builder = MinHashSignatureBuilder(num_perm=args.num_perm)
+    timings["minhash"], _ = best_of(
+        args.repeat, builder.build_batch, hashed.shingle_hash64, "bench"
+    )
+
+    signatures = {
+        f"doc-{start}": builder.build_batch(
+            hashed.shingle_hash64[start : start + args.doc_tokens], f"doc-{start}"
+        )
+        for start in range(0, len(hashed.shingle_hash64), args.doc_tokens)
+    }
+    lsh_builder = LshIndexBuilder(threshold=args.threshold, num_perm=args.num_perm)
+    timings["lsh_build"], lsh = best_of(args.repeat, lsh_builder.build, signatures)
+    timings["lsh_save"], index_path = best_of(args.repeat, lsh_builder.save, lsh, out_dir)
+
+    index = lsh_builder.load(index_path)
+
+    def query_all() -> dict[str, list[str]]:
+        return {doc_id: lsh_builder.query(index, mh) for doc_id, mh in signatures.items()}
+
+    timings["lsh_query"], candidates = best_of(args.repeat, query_all)
+    assert all(doc_id in found for doc_id, found in candidates.items()), "LSH lost a document"
+    return timings
+
+
+def machine_info() -> dict:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def check(results: dict, baseline: dict, tolerance: float, slack: float) -> list[str]:
+    """Return one message per stage slower than its baseline allows."""
+    regressions = []
+    for tokens, stages in results.items():
+        for stage, seconds in stages.items():
+            base = baseline.get("results", {}).get(tokens, {}).get(stage)
+            if base is None:
+                continue
+            limit = base * (1 + tolerance) + slack
+            if seconds > limit:
+                regressions.append(
+                    f"{stage} @ {tokens} tokens: {seconds:.4f}s > limit {limit:.4f}s "
+                    f"(baseline {base:.4f}s)"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-stage pipeline benchmark suite")
+    parser.add_argument("--tokens", type=int, nargs="+", default=DEFAULT_TOKENS)
+    parser.add_argument("--shingle-size", type=int, default=5)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--doc-tokens", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--check", action="store_true", help="exit 1 on a regression")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--slack-seconds", type=float, default=0.005)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    results: dict[str, dict[str, float]] = {}
+
+    print(
+        f"{'stage':>22} {'tokens':>10} {'seconds':>9} {'tokens/s':>12} "
+        f"{'baseline':>9} {'ratio':>6}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.tokens:
+            timings = run_stages(count, args, Path(tmp))
+            results[str(count)] = {stage: round(t, 6) for stage, t in timings.items()}
+            for stage, seconds in timings.items():
+                base = baseline.get("results", {}).get(str(count), {}).get(stage)
+                vs_base = f"{base:>9.4f} {seconds / base:>5.2f}x" if base else f"{'-':>9} {'-':>6}"
+                print(
+                    f"{stage:>22} {count:>10} {seconds:>9.4f} "
+                    f"{count / seconds:>12,.0f} {vs_base}"
+                )
+
+    if args.update_baseline:
+        merged = {**baseline.get("results", {}), **results}
+        payload = {"machine": machine_info(), "repeat": args.repeat, "results": merged}
+        args.baseline.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {args.baseline}")
+
+    if args.check:
+        if not baseline:
+            sys.exit(f"--check needs a baseline; run --update-baseline first ({args.baseline})")
+        regressions = check(results, baseline, args.tolerance, args.slack_seconds)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print("no regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
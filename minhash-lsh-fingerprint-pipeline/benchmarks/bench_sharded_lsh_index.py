@@ -0,0 +1,122 @@
+"""
+File Name: bench_sharded_lsh_index.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Benchmark — the single-snapshot IncrementalLshIndex vs a
+             ShardedLshIndex: building the index from N signatures, then
+             loading it and querying Q signatures.  Asserts both return the
+             same candidates for every query.
+
+Note: Run from the minhash-lsh-fingerprint-pipeline directory:
+          python benchmarks/bench_sharded_lsh_index.py [--docs 20000] [--shards 8] [--workers 0]
+      Shards build, load and answer queries in parallel, so the sharded
+      timings scale with the cores available to --workers; on one core
+      they show the overhead of the fan-out instead.  Timings are the best
+      of --repeat runs (default 3), each in a fresh directory.
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- Python 3.12+
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from bench_near_duplicate_query import make_corpus
+from datasketch import MinHash
+
+from docfp.processors.incremental_lsh_index import IncrementalLshIndex
+from docfp.processors.sharded_lsh_index import ShardedLshIndex
+
+
+def single_run(
+    corpus: dict[str, MinHash], queries: list[str], root: Path, threshold: float, num_perm: int
+) -> tuple[float, float, dict[str, list[str]]]:
+    """Build, then load + query, the single-snapshot index."""
+    index = IncrementalLshIndex(root, threshold=threshold, num_perm=num_perm)
+    t0 = time.perf_counter()
+    index.append(corpus)
+    build_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    lsh = index.load()
+    result = {q: sorted(lsh.query(corpus[q])) for q in queries}
+    return build_s, time.perf_counter() - t0, result
+
+
+def sharded_run(
+    corpus: dict[str, MinHash],
+    queries: list[str],
+    root: Path,
+    threshold: float,
+    num_perm: int,
+    shards: int,
+    workers: int,
+) -> tuple[float, float, dict[str, list[str]]]:
+    """Build, then load + query, the sharded index."""
+    index = ShardedLshIndex(
+        root, shard_count=shards, threshold=threshold, num_perm=num_perm, max_workers=workers
+    )
+    t0 = time.perf_counter()
+    index.append(corpus)
+    build_s = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    result = index.query_batch({q: corpus[q] for q in queries})
+    return build_s, time.perf_counter() - t0, result
+
+
+def best_of(repeat: int, fn, *args):
+    """Return (min build seconds, min query seconds, last result), fresh dir per run."""
+    best_build = best_query = float("inf")
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory(prefix="docfp_bench_shards_") as tmp:
+            build_s, query_s, result = fn(*args[:2], Path(tmp), *args[2:])
+        best_build, best_query = min(best_build, build_s), min(best_query, query_s)
+    return best_build, best_query, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Single-snapshot LSH index vs ShardedLshIndex")
+    parser.add_argument("--docs", type=int, default=20_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.docs, args.num_perm)
+    queries = list(corpus)[: args.queries]
+    single_build, single_query, expected = best_of(
+        args.repeat, single_run, corpus, queries, args.threshold, args.num_perm
+    )
+    sharded_build, sharded_query, actual = best_of(
+        args.repeat,
+        sharded_run,
+        corpus,
+        queries,
+        args.threshold,
+        args.num_perm,
+        args.shards,
+        args.workers,
+    )
+
+    identical = actual == expected
+    print(f"{'docs':>7} {'shards':>6} {'step':>12} {'single (s)':>11} {'sharded (s)':>12}")
+    print(
+        f"{args.docs:>7} {args.shards:>6} {'build':>12} {single_build:>11.3f} "
+        f"{sharded_build:>12.3f}"
+    )
+    print(
+        f"{args.docs:>7} {args.shards:>6} {'load+query':>12} {single_query:>11.3f} "
+        f"{sharded_query:>12.3f}"
+    )
+    print(f"queries {len(queries)}  identical {identical}")
+    assert identical, "sharded candidates mismatch"
+
+
+if __name__ == "__main__":
+    main()
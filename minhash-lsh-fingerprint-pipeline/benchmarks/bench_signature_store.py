@@ -0,0 +1,139 @@
+"""
+File Name: bench_signature_store.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Benchmark — per-document pretty-printed signature JSON
+             (DocumentSignatureWriter: two files per document) vs the binary
+             MinHashSignatureStore, for writing N signatures and for loading
+             all of them back into one (N, num_perm) matrix.  Asserts the
+             loaded matrices are identical.
+
+Note: Run from the minhash-lsh-fingerprint-pipeline directory:
+          python benchmarks/bench_signature_store.py [--docs 5000] [--num-perm 128]
+      Timings are the best of --repeat runs (default 3); every run writes
+      into a fresh temporary directory.
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- Python 3.12+
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from datasketch import MinHash
+
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+from docfp.processors.minhash_signature_store import MinHashSignatureStore
+from docfp.writers.document_signature_writer import DocumentSignatureWriter
+
+
+def make_signatures(count: int, num_perm: int, seed: int = 42) -> dict[str, MinHash]:
+    """Return count seeded random signatures keyed by a fake document_id."""
+    rng = np.random.default_rng(seed)
+    builder = MinHashSignatureBuilder(num_perm=num_perm)
+    values = rng.integers(0, 2**32 - 1, size=(count, num_perm), dtype=np.uint64)
+    return {f"{i:064x}": builder.from_hashvalues(row) for i, row in enumerate(values)}
+
+
+def write_json(signatures: dict[str, MinHash], root: Path) -> None:
+    """Original layout: hash_signature.json + minhash.json per document."""
+    writer = DocumentSignatureWriter()
+    for doc_id, mh in signatures.items():
+        writer.write(
+            document_id=doc_id,
+            source_uri=f"/corpus/{doc_id}.txt",
+            file_name=f"{doc_id}.txt",
+            signature_version="v1",
+            shingle_size=5,
+            total_shingle_count=0,
+            unique_shingle_hash_count=0,
+            hash_signature_sha256=doc_id,
+            minhash=mh,
+            lsh_bucket_keys=[],
+            partition_merge_status="single-partition",
+            output_dir=root / "signatures",
+        )
+
+
+def load_json(root: Path, doc_ids: list[str]) -> np.ndarray:
+    """Parse every {doc}.minhash.json back into one matrix."""
+    rows = []
+    for doc_id in doc_ids:
+        with open(root / "signatures" / f"{doc_id}.minhash.json", encoding="utf-8") as fh:
+            rows.append(json.load(fh)["hashvalues"])
+    return np.asarray(rows, dtype=np.uint64)
+
+
+def write_store(signatures: dict[str, MinHash], root: Path, num_perm: int) -> None:
+    MinHashSignatureStore(root / "indexes", num_perm=num_perm).append(signatures)
+
+
+def load_store(root: Path, num_perm: int) -> np.ndarray:
+    return MinHashSignatureStore(root / "indexes", num_perm=num_perm).matrix()
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    """Return min wall seconds over repeat calls, each in a fresh directory."""
+    best = float("inf")
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory(prefix="docfp_bench_sigstore_") as tmp:
+            t0 = time.perf_counter()
+            fn(*args, Path(tmp))
+            best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Signature JSON vs signature store benchmark")
+    parser.add_argument("--docs", type=int, default=5_000)
+    parser.add_argument("--num-perm", type=int, default=128)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    signatures = make_signatures(args.docs, args.num_perm)
+    doc_ids = list(signatures)
+
+    json_write_s = best_of(args.repeat, write_json, signatures)
+    store_write_s = best_of(
+        args.repeat, lambda sigs, root: write_store(sigs, root, args.num_perm), signatures
+    )
+
+    with tempfile.TemporaryDirectory(prefix="docfp_bench_sigstore_") as tmp:
+        root = Path(tmp)
+        write_json(signatures, root)
+        write_store(signatures, root, args.num_perm)
+        json_bytes = sum(p.stat().st_size for p in (root / "signatures").iterdir())
+        store_bytes = sum(p.stat().st_size for p in (root / "indexes").iterdir())
+
+        json_load_s, store_load_s = float("inf"), float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            expected = load_json(root, doc_ids)
+            json_load_s = min(json_load_s, time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            actual = load_store(root, args.num_perm)
+            np.asarray(actual).sum()  # touch every page
+            store_load_s = min(store_load_s, time.perf_counter() - t0)
+        identical = np.array_equal(expected, actual)
+
+    print(f"{'docs':>6} {'step':>6} {'json (s)':>10} {'store (s)':>10} {'speedup':>8}")
+    print(
+        f"{args.docs:>6} {'write':>6} {json_write_s:>10.3f} {store_write_s:>10.3f} "
+        f"{json_write_s / store_write_s:>7.1f}x"
+    )
+    print(
+        f"{args.docs:>6} {'load':>6} {json_load_s:>10.3f} {store_load_s:>10.3f} "
+        f"{json_load_s / store_load_s:>7.1f}x"
+    )
+    print(f"bytes on disk: json {json_bytes:,}  store {store_bytes:,}  identical {identical}")
+    assert identical, "signature matrix mismatch"
+
+
+if __name__ == "__main__":
+    main()
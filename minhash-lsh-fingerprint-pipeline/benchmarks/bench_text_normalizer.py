@@ -0,0 +1,102 @@
+"""
+File Name: bench_text_normalizer.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Benchmark — v1 TextNormalizer.normalize followed by
+             TokenizerProcessor.tokenize (five regex / string passes plus two
+             splits) vs the single-pass v2 FusedTextNormalizer.normalize_tokens,
+             on ASCII and mixed non-ASCII text.  Asserts identical normalized
+             text, token count, tokens and iter_tokens stream.
+
+Note: Run from the minhash-lsh-fingerprint-pipeline directory:
+          python benchmarks/bench_text_normalizer.py [--words 1000000]
+      Timings are the best of --repeat runs (default 3).  The mixed corpus
+      includes decomposed accents, ligatures, full-width and title-case
+      characters and non-ASCII spaces so NFC and case mapping are exercised;
+      the ASCII corpus takes the str.translate path.
+
+Requirements:
+- Python 3.12+
+"""
+
+import argparse
+import random
+import time
+
+from docfp.processors.fused_text_normalizer import FusedTextNormalizer
+from docfp.processors.text_normalizer import TextNormalizer
+from docfp.processors.tokenizer import TokenizerProcessor
+
+DEFAULT_WORDS = [100_000, 1_000_000]
+ASCII_WORDS = [
+    "The", "quick-brown", "fox's", "(jumps)", "over", "the_lazy", "dog.", "42", "e.g.,",
+    "Section", "3.1:", "\"quoted\"", "C++", "x=y;", "--", "URL:", "https://example.org/a?b=c",
+]
+UNICODE_WORDS = [
+    "Café", "Café", "ÉCOLE", "straße", "İstanbul", "ﬁnance", "Ωmega—", "日本語。",
+    "ＦＵＬＬ", "ǅemal", "naïve", "€100", "«citation»",
+]
+ASCII_SEPARATORS = [" ", " ", " ", "  ", "\n", "\n\n", "\t", " \r\n"]
+UNICODE_SEPARATORS = ASCII_SEPARATORS + ["\u00a0", "\u3000"]
+
+
+def synthetic_text(
+    words: int, vocabulary: list[str], separators: list[str], seed: int = 42
+) -> str:
+    """Seeded text of words drawn from vocabulary, joined by random separators."""
+    rng = random.Random(seed)
+    return "".join(rng.choice(vocabulary) + rng.choice(separators) for _ in range(words))
+
+
+def v1_normalize_tokenize(text: str) -> tuple[str, int, list[str]]:
+    normalized = TextNormalizer().normalize("bench", "bench", text)
+    tokens = TokenizerProcessor().tokenize(normalized.text, "bench")
+    return normalized.text, normalized.token_count, tokens
+
+
+def v2_normalize_tokens(text: str) -> tuple[str, int, list[str]]:
+    normalized, tokens = FusedTextNormalizer().normalize_tokens("bench", "bench", text)
+    return normalized.text, normalized.token_count, tokens
+
+
+def chunks(text: str, size: int = 4096) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def best_of(repeat: int, fn, *args):
+    """Return (min wall seconds, last result) over repeat calls."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="v1 chained normalizer vs fused v2 normalizer")
+    parser.add_argument("--words", type=int, nargs="+", default=DEFAULT_WORDS)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'corpus':>8} {'words':>10} {'v1 (s)':>8} {'v2 (s)':>8} {'speedup':>8}  identical")
+    for count in args.words:
+        for corpus, vocabulary, separators in (
+            ("ascii", ASCII_WORDS, ASCII_SEPARATORS),
+            ("unicode", ASCII_WORDS + UNICODE_WORDS, UNICODE_SEPARATORS),
+        ):
+            text = synthetic_text(count, vocabulary, separators)
+            v1_s, expected = best_of(args.repeat, v1_normalize_tokenize, text)
+            v2_s, actual = best_of(args.repeat, v2_normalize_tokens, text)
+            streamed = list(FusedTextNormalizer().iter_tokens(chunks(text)))
+
+            identical = actual == expected and streamed == expected[2]
+            print(
+                f"{corpus:>8} {count:>10} {v1_s:>8.3f} {v2_s:>8.3f} "
+                f"{v1_s / v2_s:>7.1f}x  {identical}"
+            )
+            assert identical, f"v2 output differs from v1 ({corpus}, words={count})"
+
+
+if __name__ == "__main__":
+    main()
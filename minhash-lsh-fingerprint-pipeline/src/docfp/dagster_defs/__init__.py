@@ -14,6 +14,8 @@ from __future__ import annotations
 from dagster import Definitions
 
 from docfp.dagster_defs.assets import (
+    SHINGLE_IO_MANAGER_KEY,
+    corpus_fingerprint_batch,
     document_fingerprint_summary,
     document_hash_signature,
     document_metadata_json,
@@ -22,18 +24,27 @@ from docfp.dagster_defs.assets import (
     document_shingle_parquet,
     document_shingles,
     lsh_index,
+    near_duplicate_clusters,
     normalized_text,
     ocr_extracted_text,
     raw_extracted_text,
     source_document,
 )
-from docfp.dagster_defs.jobs import fingerprint_pipeline_job
+from docfp.dagster_defs.io_managers import ShingleBatchIOManager
+from docfp.dagster_defs.jobs import (
+    corpus_batch_job,
+    fingerprint_pipeline_job,
+    near_duplicate_cluster_job,
+)
 from docfp.dagster_defs.resources import (
+    OcrProcessorResource,
     ShingleHasherResource,
+    TextCacheResource,
     TextExtractorResource,
     TextNormalizerResource,
 )
 from docfp.dagster_defs.schedules import schedules
+from docfp.dagster_defs.sensors import sensors
 
 defs = Definitions(
     assets=[
@@ -49,12 +60,18 @@ defs = Definitions(
         document_minhash_signature,
         lsh_index,
         document_fingerprint_summary,
+        corpus_fingerprint_batch,
+        near_duplicate_clusters,
     ],
-    jobs=[fingerprint_pipeline_job],
+    jobs=[fingerprint_pipeline_job, corpus_batch_job, near_duplicate_cluster_job],
     resources={
         "extractor": TextExtractorResource(),
+        "ocr": OcrProcessorResource(),
         "normalizer": TextNormalizerResource(),
         "hasher": ShingleHasherResource(),
+        "text_cache": TextCacheResource(),
+        SHINGLE_IO_MANAGER_KEY: ShingleBatchIOManager(),
     },
     schedules=schedules,
+    sensors=sensors,
 )
@@ -4,63 +4,84 @@ Author: Senthilnathan Karuppaiah
 Date: 2026-05-03
 Description: Dagster asset definitions for the document fingerprinting pipeline.
              Each stage is an independently materializable asset (FR-016, ADR-001).
-             All 12 BRD §8.1 assets are defined here.
-
-Note: Assets operate on a single document at a time.  Batch runs are handled
-      by iterating over the input folder outside Dagster or via a sensor.
+             All 12 BRD §8.1 assets are defined here, plus the corpus-level
+             batch asset that fingerprints a whole input folder in one run
+             and the corpus-level near-duplicate clustering asset.
+
+Note: The 12 BRD assets operate on a single document at a time.  Whole-corpus
+      runs use corpus_fingerprint_batch, which fans documents out over a
+      process pool inside a single Dagster run.  near_duplicate_clusters
+      clusters every signature in the store, one LSH band per pool task.
+      document_metadata_json and document_hash_signature consult the
+      FingerprintRegistry: for an exact byte duplicate or an exact
+      normalized-content duplicate they write a summary pointing at the
+      stored signature artifacts and yield no output, so Dagster skips every
+      downstream step.  Every asset runs under instrumented_asset, which
+      records wall / CPU time, peak RSS growth, bytes read / written and
+      items per second as stage_* materialization metadata.
 
 Requirements:
 - dagster>=1.9
 - Python 3.12+
 """
 
-import logging
-import os
+import json
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Iterator
 
-import structlog
-from dagster import AssetIn, Config, MetadataValue, Output, asset
+from dagster import AssetExecutionContext, AssetIn, Config, MetadataValue, Output, asset
 
+from docfp.dagster_defs.instrumentation import instrumented_asset
+from docfp.dagster_defs.partitions import input_file_partitions, input_file_path
 from docfp.dagster_defs.resources import (
+    OcrProcessorResource,
     ShingleHasherResource,
+    TextCacheResource,
     TextExtractorResource,
     TextNormalizerResource,
 )
+from docfp.logging_config import get_logger
+from docfp.models.batch_report import BatchFingerprintReport
+from docfp.models.near_duplicate_cluster_report import NearDuplicateClusterReport
 from docfp.models.document_metadata import DocumentMetadata
 from docfp.models.extracted_text import ExtractedDocumentText
 from docfp.models.normalized_text import NormalizedText
-from docfp.models.shingle_record import ShingleRecord
+from docfp.models.shingle_batch import ShingleBatch
+from docfp.processors.batch_fingerprint_processor import BatchFingerprintProcessor
+from docfp.models.registered_fingerprint import RegisteredFingerprint
 from docfp.processors.checksum_processor import DocumentChecksumProcessor
-from docfp.processors.lsh_index_builder import LshIndexBuilder
+from docfp.processors.fingerprint_registry import FingerprintRegistry, signature_config_key
+from docfp.processors.hash_signature_processor import DocumentHashSignatureProcessor
+from docfp.processors.incremental_lsh_index import IncrementalLshIndex
 from docfp.processors.metadata_extractor import DocumentMetadataExtractor
 from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+from docfp.processors.minhash_signature_store import MinHashSignatureStore
+from docfp.processors.near_duplicate_cluster_processor import NearDuplicateClusterProcessor
 from docfp.processors.ocr_decision_processor import OcrDecisionProcessor
-from docfp.processors.partition_signature_merger import PartitionSignatureMerger
+from docfp.processors.page_segment_processor import PageSegmentProcessor
+from docfp.processors.document_partition_processor import DEFAULT_PARTITION_SIZE
+from docfp.processors.partitioned_fingerprint_processor import PartitionedFingerprintProcessor
+from docfp.processors.sharded_lsh_index import ShardedLshIndex
+from docfp.processors.stage_timer import record_stage
 from docfp.processors.shingle_retention_processor import ShingleRetentionProcessor
 from docfp.processors.tokenizer import TokenizerProcessor
 from docfp.processors.word_shingle_generator import WordShingleGenerator
 from docfp.writers.document_signature_writer import DocumentSignatureWriter
 from docfp.writers.metadata_json_writer import MetadataJsonWriter
-from docfp.writers.shingle_parquet_writer import ShingleParquetWriter
+from docfp.writers.shingle_parquet_writer import (
+    DEFAULT_COMPRESSION,
+    DEFAULT_ROW_GROUP_SIZE,
+    ShingleParquetWriter,
+)
 from docfp.writers.text_writer import NormalizedTextWriter, RawTextWriter
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
+
+
+# Shingle-stage assets carry a ShingleBatch; ShingleBatchIOManager stores it as
+# memory-mapped Arrow IPC instead of pickling it between every stage.
+SHINGLE_IO_MANAGER_KEY = "shingle_io_manager"
 
 
 # ---------------------------------------------------------------------------
@@ -72,48 +93,241 @@ class PipelineConfig(Config):
     """Per-run configuration for the fingerprinting pipeline.
 
     Args:
-        source_uri: Absolute path to the input document.
+        input_dir: Directory the input_files partition keys are relative to.
+        source_uri: Explicit path to the input document; when empty it is
+                    input_dir joined with the run's partition key.
         output_root: Root output directory (sub-folders created automatically).
         shingle_size: Word-shingle window size. Default 5.
         minhash_num_perm: MinHash permutation count. Default 128.
         lsh_threshold: Jaccard similarity threshold for LSH. Default 0.5.
+        lsh_shard_count: Use a ShardedLshIndex with this many shards;
+                         0 keeps the single corpus_lsh_index.lshx.
+        partition_size: Documents with more tokens than this are hashed in
+                        token partitions of this size. Default 50 000.
+        partition_max_workers: Worker processes for partition hashing;
+                               0 uses every available core.
         dlp_safe_mode: When True deletes shingle Parquet after signing.
+        parquet_compression: Shingle Parquet codec ('zstd', 'snappy',
+                             'none', ...). Default 'zstd'.
+        parquet_row_group_size: Rows per shingle Parquet row group.
+                                Default 131 072.
+        ocr_enabled: Force OCR regardless of extracted text length.
+        ocr_min_text_length: Trigger OCR when extracted text is shorter than this.
+        skip_known_duplicates: End early for documents whose bytes or
+                               normalized content were already fingerprinted.
+        export_signature_json: Also write {doc}.hash_signature.json and
+                               {doc}.minhash.json next to the binary
+                               signature store.
+        pipeline_run_id: Optional run ID for traceability.
+    """
+
+    input_dir: str = "data/input"
+    source_uri: str = ""
+    output_root: str = "output"
+    shingle_size: int = 5
+    minhash_num_perm: int = 128
+    lsh_threshold: float = 0.5
+    lsh_shard_count: int = 0
+    partition_size: int = DEFAULT_PARTITION_SIZE
+    partition_max_workers: int = 0
+    dlp_safe_mode: bool = True
+    parquet_compression: str = DEFAULT_COMPRESSION
+    parquet_row_group_size: int = DEFAULT_ROW_GROUP_SIZE
+    ocr_enabled: bool = False
+    ocr_min_text_length: int = 50
+    skip_known_duplicates: bool = True
+    export_signature_json: bool = False
+    pipeline_run_id: str = ""
+
+
+class BatchConfig(Config):
+    """Per-run configuration for the corpus batch fingerprinting asset.
+
+    Args:
+        input_dir: Directory scanned recursively for documents.
+        manifest_path: Optional text file listing one document path per line.
+        file_glob: Glob pattern applied under input_dir. Default '*'.
+        output_root: Root output directory (sub-folders created automatically).
+        shingle_size: Word-shingle window size. Default 5.
+        minhash_num_perm: MinHash permutation count. Default 128.
+        lsh_threshold: Jaccard similarity threshold for LSH. Default 0.5.
+        lsh_shard_count: Use a ShardedLshIndex with this many shards, built
+                         in parallel; 0 keeps the single corpus_lsh_index.lshx.
+        dlp_safe_mode: When True no shingle Parquet is retained.
         ocr_enabled: Force OCR regardless of extracted text length.
         ocr_min_text_length: Trigger OCR when extracted text is shorter than this.
+        ocr_dpi: Page rasterization resolution for OCR. Default 300.
+        ocr_language: Tesseract language code(s). Default 'eng'.
+        ocr_page_timeout_seconds: Per-page OCR timeout. Default 120.
+        max_workers: Worker processes; 0 uses every available core.
+        streaming_min_bytes: Stream plain-text files of at least this size
+                             in bounded memory; 0 disables streaming.
+        skip_known_duplicates: End early for documents whose bytes or
+                               normalized content were already fingerprinted.
+        export_signature_json: Also write {doc}.hash_signature.json and
+                               {doc}.minhash.json next to the binary
+                               signature store.
         pipeline_run_id: Optional run ID for traceability.
     """
 
-    source_uri: str
+    input_dir: str = ""
+    manifest_path: str = ""
+    file_glob: str = "*"
     output_root: str = "output"
     shingle_size: int = 5
     minhash_num_perm: int = 128
     lsh_threshold: float = 0.5
+    lsh_shard_count: int = 0
     dlp_safe_mode: bool = True
     ocr_enabled: bool = False
     ocr_min_text_length: int = 50
+    ocr_dpi: int = 300
+    ocr_language: str = "eng"
+    ocr_page_timeout_seconds: float = 120.0
+    max_workers: int = 0
+    streaming_min_bytes: int = 0
+    skip_known_duplicates: bool = True
+    export_signature_json: bool = False
     pipeline_run_id: str = ""
 
 
+class ClusterConfig(Config):
+    """Per-run configuration for the corpus near-duplicate clustering asset.
+
+    Args:
+        output_root: Root output directory holding indexes/ (the signature
+                     store); clusters are written under clusters/.
+        minhash_num_perm: MinHash permutation count. Default 128.
+        lsh_threshold: Jaccard threshold that sets the LSH banding. Default 0.5.
+        min_similarity: Estimated Jaccard a candidate pair needs to be joined;
+                        0 uses lsh_threshold.
+        max_workers: Band worker processes; 0 uses every available core.
+        max_bucket_size: Buckets larger than this compare each member with
+                         their first max_bucket_size members only.
+        include_singletons: Also write documents that have no near-duplicate.
+    """
+
+    output_root: str = "output"
+    minhash_num_perm: int = 128
+    lsh_threshold: float = 0.5
+    min_similarity: float = 0.0
+    max_workers: int = 0
+    max_bucket_size: int = 2048
+    include_singletons: bool = False
+
+
+def _corpus_lsh_index(config: PipelineConfig) -> IncrementalLshIndex | ShardedLshIndex:
+    """Return the corpus LSH index selected by config.lsh_shard_count."""
+    index_dir = Path(config.output_root) / "indexes"
+    if config.lsh_shard_count:
+        return ShardedLshIndex(
+            index_dir,
+            shard_count=config.lsh_shard_count,
+            threshold=config.lsh_threshold,
+            num_perm=config.minhash_num_perm,
+        )
+    return IncrementalLshIndex(
+        index_dir, threshold=config.lsh_threshold, num_perm=config.minhash_num_perm
+    )
+
+
+def _corpus_lsh_index_path(config: PipelineConfig) -> Path:
+    """Return the canonical file of the corpus LSH index (snapshot or shard manifest)."""
+    index = _corpus_lsh_index(config)
+    return index.manifest_path if isinstance(index, ShardedLshIndex) else index.snapshot_path
+
+
+def _signature_config_key(
+    config: PipelineConfig,
+    normalizer: TextNormalizerResource,
+    hasher: ShingleHasherResource,
+) -> str:
+    """Return the FingerprintRegistry config key for this run's parameters."""
+    return signature_config_key(
+        shingle_size=config.shingle_size,
+        num_perm=config.minhash_num_perm,
+        normalization_key=normalizer.get_normalizer().normalization_key,
+        hash64_algorithm=hasher.hash64_algorithm,
+    )
+
+
+def _partition_fields(asset_value: dict) -> dict:
+    """Return the partition_* entries of a shingle-stage asset dict."""
+    return {key: value for key, value in asset_value.items() if key.startswith("partition_")}
+
+
+def _write_duplicate_summary(
+    config: PipelineConfig,
+    document_id: str,
+    file_name: str,
+    original: RegisteredFingerprint,
+    duplicate_kind: str,
+) -> Path:
+    """Write {doc}.fingerprint_summary.json pointing at reused artifacts.
+
+    Args:
+        config: Pipeline configuration.
+        document_id: SHA-256 checksum of the duplicate document.
+        file_name: Duplicate document file name.
+        original: Registry entry whose artifacts are reused.
+        duplicate_kind: 'document_id' (byte duplicate) or
+                        'hash_signature_sha256' (normalized-content duplicate).
+
+    Returns:
+        Path of the written summary JSON.
+    """
+    out_dir = Path(config.output_root) / "signatures"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    summary = {
+        "document_id": document_id,
+        "file_name": file_name,
+        "hash_signature_sha256": original.hash_signature_sha256,
+        "sig_path": original.sig_path,
+        "minhash_path": original.minhash_path,
+        "lsh_index_path": str(_corpus_lsh_index_path(config)),
+        "duplicate_of": original.duplicate_of or original.document_id,
+        "duplicate_kind": duplicate_kind,
+        "pipeline_run_id": config.pipeline_run_id,
+        "created_at_utc": datetime.now(timezone.utc).isoformat(),
+    }
+    summary_path = out_dir / f"{Path(file_name).stem}.fingerprint_summary.json"
+    with open(summary_path, "w", encoding="utf-8") as fh:
+        json.dump(summary, fh, indent=2)
+    record_stage(bytes_written=summary_path.stat().st_size)
+    log.info(
+        "duplicate_short_circuited",
+        document_id=document_id,
+        duplicate_of=summary["duplicate_of"],
+        duplicate_kind=duplicate_kind,
+    )
+    return summary_path
+
+
 # ---------------------------------------------------------------------------
 # Asset 1 — source_document
 # ---------------------------------------------------------------------------
 
 
-@asset
-def source_document(config: PipelineConfig) -> dict:
-    """Validate that the source document exists and return its path metadata.
+@asset(partitions_def=input_file_partitions)
+@instrumented_asset(unit="documents")
+def source_document(context: AssetExecutionContext, config: PipelineConfig) -> dict:
+    """Resolve the run's input file, validate it exists and return its path metadata.
 
     Args:
-        config: PipelineConfig with source_uri and output_root.
+        context: Asset execution context; its partition key names the file
+                 relative to config.input_dir.
+        config: PipelineConfig with input_dir / source_uri and output_root.
 
     Returns:
         Dict with source_uri and file_name for downstream assets.
     """
-    path = Path(config.source_uri)
+    source_uri = config.source_uri or str(input_file_path(config.input_dir, context.partition_key))
+    path = Path(source_uri)
     if not path.exists():
-        raise FileNotFoundError(f"Source document not found: {config.source_uri}")
-    log.info("source_document_ok", source_uri=config.source_uri)
-    return {"source_uri": config.source_uri, "file_name": path.name}
+        raise FileNotFoundError(f"Source document not found: {source_uri}")
+    record_stage(items=1)
+    log.info("source_document_ok", source_uri=source_uri, partition_key=context.partition_key)
+    return {"source_uri": source_uri, "file_name": path.name}
 
 
 # ---------------------------------------------------------------------------
@@ -121,19 +335,29 @@ def source_document(config: PipelineConfig) -> dict:
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions, output_required=False)
+@instrumented_asset(unit="documents")
 def document_metadata_json(
     source_document: dict,
     config: PipelineConfig,
-) -> dict:
+    normalizer: TextNormalizerResource,
+    hasher: ShingleHasherResource,
+) -> Iterator[Output[dict]]:
     """Extract file metadata, compute document_id, and write metadata JSON.
 
+    When the document_id is already registered with the same signature
+    parameters, a duplicate summary is written and no output is yielded, so
+    extraction, shingling, MinHash and LSH are all skipped.
+
     Args:
         source_document: Output of source_document asset.
         config: Pipeline configuration.
+        normalizer: TextNormalizerResource (part of the registry config key).
+        hasher: ShingleHasherResource (part of the registry config key).
 
     Returns:
-        Dict with document_id, file_name, source_uri, and metadata_json_path.
+        Dict with document_id, file_name, source_uri, and metadata_json_path;
+        nothing for a known byte duplicate.
     """
     source_uri = source_document["source_uri"]
     out_dir = Path(config.output_root) / "metadata"
@@ -143,15 +367,28 @@ def document_metadata_json(
     )
     meta = DocumentChecksumProcessor().compute_and_stamp(source_uri, meta)
     json_path = MetadataJsonWriter().write(meta, out_dir)
+    record_stage(items=1)
+
+    if config.skip_known_duplicates:
+        registry = FingerprintRegistry(Path(config.output_root) / "indexes")
+        original = registry.find_by_document_id(
+            meta.document_id, _signature_config_key(config, normalizer, hasher)
+        )
+        registry.close()
+        if original is not None:
+            _write_duplicate_summary(config, meta.document_id, meta.file_name, original, "document_id")
+            return
 
     log.info("document_metadata_json_materialized", document_id=meta.document_id)
-    return {
-        "document_id": meta.document_id,
-        "file_name": meta.file_name,
-        "source_uri": source_uri,
-        "metadata_json_path": str(json_path),
-        "mime_type": meta.mime_type,
-    }
+    yield Output(
+        {
+            "document_id": meta.document_id,
+            "file_name": meta.file_name,
+            "source_uri": source_uri,
+            "metadata_json_path": str(json_path),
+            "mime_type": meta.mime_type,
+        }
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -159,44 +396,64 @@ def document_metadata_json(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions)
+@instrumented_asset(unit="characters")
 def raw_extracted_text(
     document_metadata_json: dict,
     config: PipelineConfig,
     extractor: TextExtractorResource,
+    text_cache: TextCacheResource,
 ) -> dict:
     """Extract raw text from the source document via the configured extractor.
 
+    Byte-identical documents seen before (same document_id and engine) are
+    served from the text cache without calling the extractor.
+
     Args:
         document_metadata_json: Output of document_metadata_json asset.
         config: Pipeline configuration.
         extractor: TextExtractorResource providing the active extractor engine.
+        text_cache: TextCacheResource consulted before extraction.
 
     Returns:
-        Dict with document_id, source_uri, text, extraction_engine, and
-        extracted_text_path.
+        Dict with document_id, source_uri, text, pages, extraction_engine,
+        extraction_key, text_cache_hit, and extracted_text_path.
     """
     source_uri = document_metadata_json["source_uri"]
     document_id = document_metadata_json["document_id"]
     out_dir = Path(config.output_root) / "text"
+    cache = text_cache.get_cache(config.output_root)
 
-    result: ExtractedDocumentText = extractor.get_extractor().extract(source_uri)
-    result.document_id = document_id
+    result: ExtractedDocumentText | None = (
+        cache.get_extracted(document_id, extractor.engine, source_uri) if cache else None
+    )
+    cache_hit = result is not None
+    if result is None:
+        result = extractor.get_extractor().extract(source_uri)
+        result.document_id = document_id
+        record_stage(bytes_read=Path(source_uri).stat().st_size)
+        if cache:
+            cache.put_extracted(result, extractor.engine)
 
     text_path = RawTextWriter().write(result, out_dir)
+    record_stage(items=len(result.text))
 
     log.info(
         "raw_extracted_text_materialized",
         document_id=document_id,
         text_length=len(result.text),
+        text_cache_hit=cache_hit,
     )
     return {
         "document_id": document_id,
         "source_uri": source_uri,
         "file_name": document_metadata_json["file_name"],
         "text": result.text,
+        "pages": result.pages,
         "extraction_engine": result.extraction_engine,
+        "extraction_key": extractor.engine,
         "ocr_applied": result.ocr_applied,
+        "text_cache_hit": cache_hit,
         "extracted_text_path": str(text_path),
     }
 
@@ -206,16 +463,24 @@ def raw_extracted_text(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions)
+@instrumented_asset(unit="pages")
 def ocr_extracted_text(
     raw_extracted_text: dict,
     config: PipelineConfig,
+    ocr: OcrProcessorResource,
+    text_cache: TextCacheResource,
 ) -> dict:
     """Apply OCR if required; otherwise pass raw text through unchanged.
 
+    OCR output is cached per (document_id, OCR engine settings), so a
+    duplicate scanned document is OCR'd only once.
+
     Args:
         raw_extracted_text: Output of raw_extracted_text asset.
         config: Pipeline configuration.
+        ocr: OcrProcessorResource providing the page-parallel OCR engine.
+        text_cache: TextCacheResource consulted before running OCR.
 
     Returns:
         Dict with text and ocr_applied flag (may be same as raw_extracted_text).
@@ -234,10 +499,41 @@ def ocr_extracted_text(
             document_id=raw_extracted_text["document_id"],
             reason="text_too_short_or_forced",
         )
-        # OCRmyPDF wired in Task 8 — stub raises NotImplementedError for now
-        raise NotImplementedError(
-            "OCR path not yet wired. Install OcrProcessor (Task 8)."
+        processor = ocr.get_ocr_processor()
+        cache = text_cache.get_cache(config.output_root)
+        document_id = raw_extracted_text["document_id"]
+        source_uri = raw_extracted_text["source_uri"]
+        result: ExtractedDocumentText | None = (
+            cache.get_extracted(document_id, processor.extraction_key, source_uri)
+            if cache
+            else None
+        )
+        cache_hit = result is not None
+        if result is None:
+            result = processor.run_ocr(source_uri, document_id)
+            record_stage(bytes_read=Path(source_uri).stat().st_size)
+            if cache:
+                cache.put_extracted(result, processor.extraction_key)
+        text_path = RawTextWriter().write(result, Path(config.output_root) / "text")
+        record_stage(items=len(result.pages))
+        log.info(
+            "ocr_extracted_text_materialized",
+            document_id=raw_extracted_text["document_id"],
+            page_count=len(result.pages),
+            failed_pages=len(result.metadata["ocr_failed_pages"]),
+            text_length=len(result.text),
+            text_cache_hit=cache_hit,
         )
+        return {
+            **raw_extracted_text,
+            "text": result.text,
+            "pages": result.pages,
+            "extraction_engine": result.extraction_engine,
+            "extraction_key": processor.extraction_key,
+            "ocr_applied": True,
+            "text_cache_hit": cache_hit,
+            "extracted_text_path": str(text_path),
+        }
 
     log.info(
         "ocr_skipped",
@@ -251,36 +547,66 @@ def ocr_extracted_text(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions)
+@instrumented_asset(unit="tokens")
 def normalized_text(
     ocr_extracted_text: dict,
     config: PipelineConfig,
     normalizer: TextNormalizerResource,
+    text_cache: TextCacheResource,
 ) -> dict:
     """Normalize extracted text deterministically.
 
+    When the extractor returned pages, the page and section of every token
+    are recorded as page_runs for page-aware shingling.
+
     Args:
         ocr_extracted_text: Output of ocr_extracted_text asset.
         config: Pipeline configuration.
         normalizer: TextNormalizerResource providing the active normalizer.
+        text_cache: TextCacheResource consulted before normalizing.
 
     Returns:
-        Dict with normalized text, token_count, and normalized_text_path.
+        Dict with normalized text, token_count, page_runs, and
+        normalized_text_path.
     """
     document_id = ocr_extracted_text["document_id"]
+    source_uri = ocr_extracted_text["source_uri"]
+    extraction_key = ocr_extracted_text["extraction_key"]
     out_dir = Path(config.output_root) / "normalized"
+    active_normalizer = normalizer.get_normalizer()
+    cache = text_cache.get_cache(config.output_root)
 
-    result: NormalizedText = normalizer.get_normalizer().normalize(
-        document_id=document_id,
-        source_uri=ocr_extracted_text["source_uri"],
-        text=ocr_extracted_text["text"],
+    result: NormalizedText | None = (
+        cache.get_normalized(
+            document_id, extraction_key, active_normalizer.normalization_key, source_uri
+        )
+        if cache
+        else None
     )
+    cache_hit = result is not None
+    if result is None:
+        result = active_normalizer.normalize(
+            document_id=document_id,
+            source_uri=source_uri,
+            text=ocr_extracted_text["text"],
+        )
+        result.page_runs = PageSegmentProcessor().token_runs(
+            ocr_extracted_text.get("pages", []),
+            active_normalizer,
+            result.token_count,
+            document_id,
+        )
+        if cache:
+            cache.put_normalized(result, extraction_key, active_normalizer.normalization_key)
     norm_path = NormalizedTextWriter().write(result, out_dir)
+    record_stage(items=result.token_count)
 
     log.info(
         "normalized_text_materialized",
         document_id=document_id,
         token_count=result.token_count,
+        text_cache_hit=cache_hit,
     )
     return {
         "document_id": document_id,
@@ -288,6 +614,7 @@ def normalized_text(
         "file_name": ocr_extracted_text["file_name"],
         "normalized_text": result.text,
         "token_count": result.token_count,
+        "page_runs": result.page_runs,
         "normalization_version": result.normalization_version,
         "normalized_text_path": str(norm_path),
     }
@@ -298,43 +625,58 @@ def normalized_text(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions, io_manager_key=SHINGLE_IO_MANAGER_KEY)
+@instrumented_asset(unit="shingles")
 def document_shingles(
     normalized_text: dict,
     config: PipelineConfig,
 ) -> dict:
     """Generate word shingles from normalized text.
 
+    Shingles take the page_no / section_id of their first token when
+    normalized_text carries page_runs; otherwise both are 0.
+
     Args:
         normalized_text: Output of normalized_text asset.
         config: Pipeline configuration.
 
     Returns:
-        Dict with shingle list and count metadata.
+        Dict with the columnar ShingleBatch and count metadata.
     """
     document_id = normalized_text["document_id"]
     tokens = TokenizerProcessor().tokenize(normalized_text["normalized_text"], document_id)
+    page_runs = normalized_text.get("page_runs", [])
+    token_page_no, token_section_id = PageSegmentProcessor().token_positions(
+        page_runs, len(tokens)
+    )
 
-    records: list[ShingleRecord] = WordShingleGenerator(
+    batch: ShingleBatch = WordShingleGenerator(
         shingle_size=config.shingle_size
-    ).generate(
+    ).generate_batch(
         document_id=document_id,
         source_uri=normalized_text["source_uri"],
         file_name=normalized_text["file_name"],
         tokens=tokens,
+        token_page_no=token_page_no,
+        token_section_id=token_section_id,
+        normalization_version=normalized_text["normalization_version"],
     )
+    page_count = len({run["page"] for run in page_runs} - {0})
+    record_stage(items=len(batch))
 
     log.info(
         "document_shingles_materialized",
         document_id=document_id,
-        shingle_count=len(records),
+        shingle_count=len(batch),
+        page_count=page_count,
     )
     return {
         "document_id": document_id,
         "file_name": normalized_text["file_name"],
         "source_uri": normalized_text["source_uri"],
-        "shingles": records,
-        "shingle_count": len(records),
+        "shingles": batch,
+        "shingle_count": len(batch),
+        "page_count": page_count,
         "normalization_version": normalized_text["normalization_version"],
     }
 
@@ -344,29 +686,66 @@ def document_shingles(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions, io_manager_key=SHINGLE_IO_MANAGER_KEY)
+@instrumented_asset(unit="shingles")
 def document_shingle_hashes(
     document_shingles: dict,
+    config: PipelineConfig,
     hasher: ShingleHasherResource,
 ) -> dict:
     """Compute SHA-256 and xxhash64 for every shingle.
 
+    Documents longer than config.partition_size tokens are hashed by
+    PartitionedFingerprintProcessor, which also returns the merged hash
+    signature and MinHash so the downstream assets do not recompute them.
+
     Args:
         document_shingles: Output of document_shingles asset.
+        config: Pipeline configuration.
         hasher: ShingleHasherResource providing the active hasher.
 
     Returns:
-        Dict with hashed shingle records.
+        Dict with the ShingleBatch hash columns filled, partition_count,
+        partition_merge_status and (partitioned documents only)
+        partition_hash_signature_sha256, partition_unique_count and
+        partition_minhash.
     """
-    records: list[ShingleRecord] = document_shingles["shingles"]
-    hashed = hasher.get_hasher().hash_records(records)
+    batch: ShingleBatch = document_shingles["shingles"]
+    token_count = len(batch) + batch.shingle_size - 1 if len(batch) else 0
+    partition_fields: dict = {
+        "partition_count": 1,
+        "partition_merge_status": "single-partition",
+        "partition_hash_signature_sha256": None,
+        "partition_unique_count": None,
+        "partition_minhash": None,
+    }
+    if token_count > config.partition_size:
+        fingerprint = PartitionedFingerprintProcessor(
+            shingle_size=config.shingle_size,
+            num_perm=config.minhash_num_perm,
+            partition_size=config.partition_size,
+            hasher=hasher.get_hasher(),
+            max_workers=config.partition_max_workers,
+        ).fingerprint_batch(batch)
+        hashed = fingerprint.shingles
+        partition_fields = {
+            "partition_count": fingerprint.partition_count,
+            "partition_merge_status": fingerprint.partition_merge_status,
+            "partition_hash_signature_sha256": fingerprint.hash_signature_sha256,
+            "partition_unique_count": fingerprint.unique_shingle_hash_count,
+            "partition_minhash": fingerprint.minhash,
+        }
+    else:
+        hashed = hasher.get_hasher().hash_batch(batch)
+    record_stage(items=len(hashed))
 
     log.info(
         "document_shingle_hashes_materialized",
         document_id=document_shingles["document_id"],
         shingle_count=len(hashed),
+        partition_count=partition_fields["partition_count"],
     )
-    return {**document_shingles, "shingles": hashed}
+    return {**document_shingles, "shingles": hashed, **partition_fields}
 
 
 # ---------------------------------------------------------------------------
@@ -374,12 +753,13 @@ def document_shingle_hashes(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions, io_manager_key=SHINGLE_IO_MANAGER_KEY)
+@instrumented_asset(unit="shingles")
 def document_shingle_parquet(
     document_shingle_hashes: dict,
     config: PipelineConfig,
 ) -> dict:
-    """Write shingle records to a temporary Parquet file.
+    """Write the shingle batch to a temporary Parquet file.
 
     Args:
         document_shingle_hashes: Output of document_shingle_hashes asset.
@@ -389,9 +769,12 @@ def document_shingle_parquet(
         Dict with parquet_path and row_count.
     """
     out_dir = Path(config.output_root) / "shingles"
-    parquet_path = ShingleParquetWriter().write(
-        document_shingle_hashes["shingles"], out_dir
+    writer = ShingleParquetWriter(
+        compression=config.parquet_compression,
+        row_group_size=config.parquet_row_group_size,
     )
+    parquet_path = writer.write(document_shingle_hashes["shingles"], out_dir)
+    record_stage(items=len(document_shingle_hashes["shingles"]))
 
     log.info(
         "document_shingle_parquet_materialized",
@@ -406,6 +789,7 @@ def document_shingle_parquet(
         "shingles": document_shingle_hashes["shingles"],
         "parquet_path": str(parquet_path),
         "row_count": len(document_shingle_hashes["shingles"]),
+        **_partition_fields(document_shingle_hashes),
     }
 
 
@@ -414,45 +798,95 @@ def document_shingle_parquet(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(
+    partitions_def=input_file_partitions,
+    io_manager_key=SHINGLE_IO_MANAGER_KEY,
+    output_required=False,
+)
+@instrumented_asset(unit="shingles")
 def document_hash_signature(
     document_shingle_parquet: dict,
     config: PipelineConfig,
-) -> dict:
+    normalizer: TextNormalizerResource,
+    hasher: ShingleHasherResource,
+) -> Iterator[Output[dict]]:
     """Build and write the document-level SHA-256 hash signature.
 
+    When another document with the same hash signature is registered, this
+    one is registered against its artifacts, a duplicate summary is written
+    and no output is yielded, so MinHash and LSH are skipped.
+
     Args:
         document_shingle_parquet: Output of document_shingle_parquet asset.
         config: Pipeline configuration.
+        normalizer: TextNormalizerResource (part of the registry config key).
+        hasher: ShingleHasherResource (part of the registry config key).
 
     Returns:
-        Dict with hash_signature_sha256, unique_shingle_hash_count, and
-        sig_path.
+        Dict with hash_signature_sha256, unique_shingle_hash_count,
+        total_shingle_count and config_key; nothing for a known
+        normalized-content duplicate.
     """
-    import hashlib
-
-    shingles: list[ShingleRecord] = document_shingle_parquet["shingles"]
+    shingles: ShingleBatch = document_shingle_parquet["shingles"]
     document_id = document_shingle_parquet["document_id"]
+    config_key = _signature_config_key(config, normalizer, hasher)
 
-    unique_hashes = sorted({r.shingle_hash_sha256 for r in shingles})
-    combined = "".join(unique_hashes).encode("utf-8")
-    sig_sha256 = hashlib.sha256(combined).hexdigest()
-
-    log.info(
-        "document_hash_signature_computed",
-        document_id=document_id,
-        unique_hash_count=len(unique_hashes),
+    sig_sha256 = document_shingle_parquet.get("partition_hash_signature_sha256")
+    unique_count = document_shingle_parquet.get("partition_unique_count")
+    if sig_sha256 is None:
+        sig_sha256, unique_count = DocumentHashSignatureProcessor().compute(
+            shingles.shingle_hash_sha256, document_id
+        )
+    record_stage(items=len(shingles))
+
+    if config.skip_known_duplicates:
+        registry = FingerprintRegistry(Path(config.output_root) / "indexes")
+        original = registry.find_by_hash_signature(sig_sha256, config_key)
+        if original is not None:
+            registry.register(
+                [
+                    RegisteredFingerprint(
+                        document_id=document_id,
+                        config_key=config_key,
+                        hash_signature_sha256=sig_sha256,
+                        source_uri=document_shingle_parquet["source_uri"],
+                        file_name=document_shingle_parquet["file_name"],
+                        sig_path=original.sig_path,
+                        minhash_path=original.minhash_path,
+                        total_shingle_count=len(shingles),
+                        unique_shingle_hash_count=unique_count,
+                        duplicate_of=original.duplicate_of or original.document_id,
+                    )
+                ]
+            )
+        registry.close()
+        if original is not None:
+            ShingleRetentionProcessor(dlp_safe_mode=config.dlp_safe_mode).process(
+                Path(document_shingle_parquet["parquet_path"]), document_id
+            )
+            _write_duplicate_summary(
+                config,
+                document_id,
+                document_shingle_parquet["file_name"],
+                original,
+                "hash_signature_sha256",
+            )
+            return
+
+    yield Output(
+        {
+            "document_id": document_id,
+            "file_name": document_shingle_parquet["file_name"],
+            "source_uri": document_shingle_parquet["source_uri"],
+            "shingles": shingles,
+            "parquet_path": document_shingle_parquet["parquet_path"],
+            "hash_signature_sha256": sig_sha256,
+            "unique_shingle_hash_count": unique_count,
+            "total_shingle_count": len(shingles),
+            "config_key": config_key,
+            **_partition_fields(document_shingle_parquet),
+        }
     )
-    return {
-        "document_id": document_id,
-        "file_name": document_shingle_parquet["file_name"],
-        "source_uri": document_shingle_parquet["source_uri"],
-        "shingles": shingles,
-        "parquet_path": document_shingle_parquet["parquet_path"],
-        "hash_signature_sha256": sig_sha256,
-        "unique_shingle_hash_count": len(unique_hashes),
-        "total_shingle_count": len(shingles),
-    }
 
 
 # ---------------------------------------------------------------------------
@@ -460,41 +894,55 @@ def document_hash_signature(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions)
+@instrumented_asset(unit="shingles")
 def document_minhash_signature(
     document_hash_signature: dict,
     config: PipelineConfig,
 ) -> dict:
-    """Build MinHash signature and write both signature JSON artifacts.
+    """Build the MinHash signature and append it to the corpus signature store.
 
     Args:
         document_hash_signature: Output of document_hash_signature asset.
         config: Pipeline configuration.
 
     Returns:
-        Dict with sig_path, minhash_path, and minhash object.
+        Dict with sig_path ('' unless JSON export is on), minhash_path (the
+        {doc}.minhash.json export or the signature store data file), and
+        minhash object.
     """
-    shingles: list[ShingleRecord] = document_hash_signature["shingles"]
+    shingles: ShingleBatch = document_hash_signature["shingles"]
     document_id = document_hash_signature["document_id"]
-    out_dir = Path(config.output_root) / "signatures"
 
-    hashes64 = [r.shingle_hash64 for r in shingles]
-    mh = MinHashSignatureBuilder(num_perm=config.minhash_num_perm).build(hashes64, document_id)
+    mh = document_hash_signature.get("partition_minhash")
+    if mh is None:
+        mh = MinHashSignatureBuilder(num_perm=config.minhash_num_perm).build_batch(
+            shingles.shingle_hash64, document_id
+        )
+    record_stage(items=len(shingles))
 
-    sig_path, minhash_path = DocumentSignatureWriter().write(
-        document_id=document_id,
-        source_uri=document_hash_signature["source_uri"],
-        file_name=document_hash_signature["file_name"],
-        signature_version="v1",
-        shingle_size=config.shingle_size,
-        total_shingle_count=document_hash_signature["total_shingle_count"],
-        unique_shingle_hash_count=document_hash_signature["unique_shingle_hash_count"],
-        hash_signature_sha256=document_hash_signature["hash_signature_sha256"],
-        minhash=mh,
-        lsh_bucket_keys=[],
-        partition_merge_status="single-partition",
-        output_dir=out_dir,
+    store = MinHashSignatureStore(
+        Path(config.output_root) / "indexes", num_perm=config.minhash_num_perm
     )
+    store.append({document_id: mh})
+    sig_path, minhash_path = "", store.data_path
+    if config.export_signature_json:
+        sig_path, minhash_path = DocumentSignatureWriter().write(
+            document_id=document_id,
+            source_uri=document_hash_signature["source_uri"],
+            file_name=document_hash_signature["file_name"],
+            signature_version="v1",
+            shingle_size=config.shingle_size,
+            total_shingle_count=document_hash_signature["total_shingle_count"],
+            unique_shingle_hash_count=document_hash_signature["unique_shingle_hash_count"],
+            hash_signature_sha256=document_hash_signature["hash_signature_sha256"],
+            minhash=mh,
+            lsh_bucket_keys=[],
+            partition_merge_status=document_hash_signature.get(
+                "partition_merge_status", "single-partition"
+            ),
+            output_dir=Path(config.output_root) / "signatures",
+        )
 
     # DLP-safe shingle Parquet cleanup
     ShingleRetentionProcessor(dlp_safe_mode=config.dlp_safe_mode).process(
@@ -505,15 +953,19 @@ def document_minhash_signature(
     log.info(
         "document_minhash_signature_materialized",
         document_id=document_id,
-        sig_path=str(sig_path),
+        minhash_path=str(minhash_path),
     )
     return {
         "document_id": document_id,
         "file_name": document_hash_signature["file_name"],
+        "source_uri": document_hash_signature["source_uri"],
         "minhash": mh,
         "sig_path": str(sig_path),
         "minhash_path": str(minhash_path),
         "hash_signature_sha256": document_hash_signature["hash_signature_sha256"],
+        "total_shingle_count": document_hash_signature["total_shingle_count"],
+        "unique_shingle_hash_count": document_hash_signature["unique_shingle_hash_count"],
+        "config_key": document_hash_signature["config_key"],
     }
 
 
@@ -522,12 +974,13 @@ def document_minhash_signature(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions)
+@instrumented_asset(unit="documents")
 def lsh_index(
     document_minhash_signature: dict,
     config: PipelineConfig,
 ) -> dict:
-    """Insert the document MinHash into the corpus LSH index.
+    """Append the document MinHash to the persistent corpus LSH index.
 
     Args:
         document_minhash_signature: Output of document_minhash_signature asset.
@@ -536,15 +989,11 @@ def lsh_index(
     Returns:
         Dict with lsh_index_path.
     """
-    out_dir = Path(config.output_root) / "indexes"
     document_id = document_minhash_signature["document_id"]
     mh = document_minhash_signature["minhash"]
 
-    lsh_b = LshIndexBuilder(
-        threshold=config.lsh_threshold, num_perm=config.minhash_num_perm
-    )
-    lsh = lsh_b.build({document_id: mh})
-    idx_path = lsh_b.save(lsh, out_dir)
+    idx_path = _corpus_lsh_index(config).append({document_id: mh})
+    record_stage(items=1)
 
     log.info("lsh_index_materialized", document_id=document_id, index_path=str(idx_path))
     return {
@@ -558,13 +1007,14 @@ def lsh_index(
 # ---------------------------------------------------------------------------
 
 
-@asset
+@asset(partitions_def=input_file_partitions)
+@instrumented_asset(unit="documents")
 def document_fingerprint_summary(
     document_minhash_signature: dict,
     lsh_index: dict,
     config: PipelineConfig,
 ) -> dict:
-    """Write a summary JSON combining all pipeline outputs.
+    """Write a summary JSON combining all pipeline outputs and register them.
 
     Args:
         document_minhash_signature: Output of document_minhash_signature asset.
@@ -574,8 +1024,6 @@ def document_fingerprint_summary(
     Returns:
         Dict with summary_path.
     """
-    import json
-
     document_id = document_minhash_signature["document_id"]
     out_dir = Path(config.output_root) / "signatures"
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -594,6 +1042,27 @@ def document_fingerprint_summary(
     summary_path = out_dir / f"{stem}.fingerprint_summary.json"
     with open(summary_path, "w", encoding="utf-8") as fh:
         json.dump(summary, fh, indent=2)
+    record_stage(items=1, bytes_written=summary_path.stat().st_size)
+
+    registry = FingerprintRegistry(Path(config.output_root) / "indexes")
+    registry.register(
+        [
+            RegisteredFingerprint(
+                document_id=document_id,
+                config_key=document_minhash_signature["config_key"],
+                hash_signature_sha256=document_minhash_signature["hash_signature_sha256"],
+                source_uri=document_minhash_signature["source_uri"],
+                file_name=document_minhash_signature["file_name"],
+                sig_path=document_minhash_signature["sig_path"],
+                minhash_path=document_minhash_signature["minhash_path"],
+                total_shingle_count=document_minhash_signature["total_shingle_count"],
+                unique_shingle_hash_count=document_minhash_signature[
+                    "unique_shingle_hash_count"
+                ],
+            )
+        ]
+    )
+    registry.close()
 
     log.info(
         "document_fingerprint_summary_materialized",
@@ -601,3 +1070,145 @@ def document_fingerprint_summary(
         summary_path=str(summary_path),
     )
     return {"document_id": document_id, "summary_path": str(summary_path)}
+
+
+# ---------------------------------------------------------------------------
+# Corpus batch — corpus_fingerprint_batch
+# ---------------------------------------------------------------------------
+
+
+@asset
+@instrumented_asset(unit="documents")
+def corpus_fingerprint_batch(
+    config: BatchConfig,
+    extractor: TextExtractorResource,
+    normalizer: TextNormalizerResource,
+    text_cache: TextCacheResource,
+) -> Output[dict]:
+    """Fingerprint every document in an input folder or manifest in one run.
+
+    Args:
+        config: BatchConfig with input_dir / manifest_path and worker count.
+        extractor: TextExtractorResource whose engine and pool options workers use.
+        normalizer: TextNormalizerResource whose settings each worker uses.
+        text_cache: TextCacheResource shared by all workers.
+
+    Returns:
+        Output with document counts, docs/sec and per-stage timing metadata.
+    """
+    if not config.input_dir and not config.manifest_path:
+        raise ValueError("BatchConfig requires input_dir or manifest_path.")
+
+    source_uris = BatchFingerprintProcessor.discover(
+        input_dir=config.input_dir or None,
+        manifest_path=config.manifest_path or None,
+        file_glob=config.file_glob,
+    )
+    report: BatchFingerprintReport = BatchFingerprintProcessor(
+        output_root=config.output_root,
+        shingle_size=config.shingle_size,
+        num_perm=config.minhash_num_perm,
+        lsh_threshold=config.lsh_threshold,
+        lsh_shard_count=config.lsh_shard_count,
+        dlp_safe_mode=config.dlp_safe_mode,
+        ocr_enabled=config.ocr_enabled,
+        ocr_min_text_length=config.ocr_min_text_length,
+        ocr_dpi=config.ocr_dpi,
+        ocr_language=config.ocr_language,
+        ocr_page_timeout_seconds=config.ocr_page_timeout_seconds,
+        extractor_engine=extractor.engine,
+        extractor_options=extractor.get_extractor_options(),
+        normalization_version=normalizer.normalization_version,
+        remove_stopwords=normalizer.remove_stopwords,
+        max_workers=config.max_workers,
+        streaming_min_bytes=config.streaming_min_bytes,
+        text_cache_dir=text_cache.resolve_cache_dir(config.output_root),
+        text_cache_max_bytes=text_cache.max_bytes,
+        skip_known_duplicates=config.skip_known_duplicates,
+        export_signature_json=config.export_signature_json,
+        pipeline_run_id=config.pipeline_run_id or None,
+    ).run(source_uris)
+
+    record_stage(items=report.succeeded_count)
+    failures = {r.source_uri: r.error for r in report.results if r.error}
+    log.info(
+        "corpus_fingerprint_batch_materialized",
+        document_count=report.document_count,
+        failed_count=report.failed_count,
+        docs_per_second=round(report.docs_per_second, 2),
+    )
+    return Output(
+        {
+            "document_count": report.document_count,
+            "succeeded_count": report.succeeded_count,
+            "failed_count": report.failed_count,
+            "document_ids": [r.document_id for r in report.results if r.error is None],
+            "failures": failures,
+            "lsh_index_path": str(Path(config.output_root) / "indexes"),
+        },
+        metadata={
+            "document_count": report.document_count,
+            "succeeded_count": report.succeeded_count,
+            "failed_count": report.failed_count,
+            "max_workers": report.max_workers,
+            "wall_seconds": MetadataValue.float(report.wall_seconds),
+            "docs_per_second": MetadataValue.float(report.docs_per_second),
+            "text_cache_hit_count": report.text_cache_hit_count,
+            "duplicate_count": report.duplicate_count,
+            "stage_seconds_mean": MetadataValue.json(report.stage_seconds_mean),
+            "stage_seconds_total": MetadataValue.json(report.stage_seconds_total),
+        },
+    )
+
+
+# ---------------------------------------------------------------------------
+# Corpus clustering — near_duplicate_clusters
+# ---------------------------------------------------------------------------
+
+
+@asset
+@instrumented_asset(unit="documents")
+def near_duplicate_clusters(config: ClusterConfig) -> Output[dict]:
+    """Cluster every stored signature into near-duplicate groups.
+
+    Args:
+        config: ClusterConfig with the output root, banding and worker count.
+
+    Returns:
+        Output with the Parquet path and cluster counts as metadata.
+    """
+    output_root = Path(config.output_root)
+    report: NearDuplicateClusterReport = NearDuplicateClusterProcessor(
+        index_dir=output_root / "indexes",
+        threshold=config.lsh_threshold,
+        num_perm=config.minhash_num_perm,
+        min_similarity=config.min_similarity or None,
+        max_workers=config.max_workers,
+        max_bucket_size=config.max_bucket_size,
+    ).run(output_root / "clusters", include_singletons=config.include_singletons)
+    record_stage(items=report.document_count)
+
+    log.info(
+        "near_duplicate_clusters_materialized",
+        document_count=report.document_count,
+        cluster_count=report.cluster_count,
+        parquet_path=report.parquet_path,
+    )
+    return Output(
+        {
+            "parquet_path": report.parquet_path,
+            "document_count": report.document_count,
+            "cluster_count": report.cluster_count,
+        },
+        metadata={
+            "parquet_path": MetadataValue.path(report.parquet_path),
+            "document_count": report.document_count,
+            "cluster_count": report.cluster_count,
+            "clustered_document_count": report.clustered_document_count,
+            "largest_cluster_size": report.largest_cluster_size,
+            "candidate_pair_count": report.candidate_pair_count,
+            "verified_pair_count": report.verified_pair_count,
+            "oversized_bucket_count": report.oversized_bucket_count,
+            "wall_seconds": MetadataValue.float(report.wall_seconds),
+        },
+    )
@@ -0,0 +1,242 @@
+"""
+File Name: io_managers.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: ShingleBatchIOManager — Dagster IO manager for the shingle-stage
+             assets.  The small asset dicts are pickled inline as usual; any
+             ShingleBatch they carry is stored once as an Arrow IPC file (plus
+             a sibling UTF-8 text file) and loaded back memory-mapped, so the
+             shingle payload is never pickled between assets.
+
+Note: Layout under base_dir (default: DAGSTER_HOME/storage/shingle_batches):
+        <asset key path>.pkl          dict with ShingleBatch values swapped
+                                      for references
+        <asset key path>.<key>.arrow  offset + hash columns of dict[key],
+                                      document constants in schema metadata
+        <asset key path>.<key>.txt    joined token text the offsets index into
+      A batch that was loaded from this IO manager and is passed through
+      unchanged (document_shingle_parquet, document_hash_signature) is
+      written by hard-linking the upstream files — no bytes are copied, and
+      the link keeps the stored output valid if the upstream asset is
+      re-materialized later.
+
+Requirements:
+- dagster>=1.9
+- pyarrow>=18
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import shutil
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+import numpy as np
+from dagster import ConfigurableIOManager, InputContext, OutputContext
+from pydantic import PrivateAttr
+
+from docfp.models.shingle_batch import ShingleBatch
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+_CONSTANT_FIELDS = (
+    "document_id",
+    "source_uri",
+    "file_name",
+    "normalization_version",
+    "created_at_utc",
+    "shingle_size",
+    "partition_id",
+    "partition_count",
+)
+_INT_COLUMNS = ("token_start", "char_start", "char_end")
+_OPTIONAL_INT32_COLUMNS = ("page_no", "section_id")
+_SCHEMA_METADATA_KEY = b"docfp.shingle_batch"
+
+
+@dataclass(frozen=True)
+class _BatchRef:
+    """Placeholder for a ShingleBatch inside the pickled asset dict."""
+
+    key: str
+
+
+def _batch_to_record_batch(batch: ShingleBatch) -> pa.RecordBatch:
+    import pyarrow as pa
+
+    columns: dict[str, pa.Array] = {name: pa.array(getattr(batch, name)) for name in _INT_COLUMNS}
+    for name in _OPTIONAL_INT32_COLUMNS:
+        values = getattr(batch, name)
+        if values is not None:
+            columns[name] = pa.array(values, pa.int32())
+    if batch.shingle_hash64 is not None:
+        columns["shingle_hash64"] = pa.array(batch.shingle_hash64, pa.uint64())
+    if batch.shingle_hash_sha256 is not None:
+        sha_hex = np.ascontiguousarray(batch.shingle_hash_sha256, dtype="S64")
+        columns["shingle_hash_sha256"] = pa.FixedSizeBinaryArray.from_buffers(
+            pa.binary(64), len(batch), [None, pa.py_buffer(sha_hex)]
+        )
+    constants = {name: getattr(batch, name) for name in _CONSTANT_FIELDS}
+    schema = pa.schema(
+        [pa.field(name, arr.type) for name, arr in columns.items()],
+        metadata={_SCHEMA_METADATA_KEY: json.dumps(constants).encode("utf-8")},
+    )
+    return pa.RecordBatch.from_arrays(list(columns.values()), schema=schema)
+
+
+def _record_batch_to_batch(record_batch: pa.RecordBatch, text: str) -> ShingleBatch:
+    constants = json.loads(record_batch.schema.metadata[_SCHEMA_METADATA_KEY])
+    names = set(record_batch.schema.names)
+
+    def _numpy(name: str) -> Optional[np.ndarray]:
+        if name not in names:
+            return None
+        return record_batch.column(name).to_numpy(zero_copy_only=True)
+
+    sha_hex = None
+    if "shingle_hash_sha256" in names:
+        arr = record_batch.column("shingle_hash_sha256")
+        sha_hex = np.frombuffer(
+            arr.buffers()[1], dtype="S64", count=len(arr), offset=arr.offset * 64
+        )
+    return ShingleBatch(
+        text=text,
+        token_start=_numpy("token_start"),
+        char_start=_numpy("char_start"),
+        char_end=_numpy("char_end"),
+        page_no=_numpy("page_no"),
+        section_id=_numpy("section_id"),
+        shingle_hash64=_numpy("shingle_hash64"),
+        shingle_hash_sha256=sha_hex,
+        **constants,
+    )
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    tmp = dst.with_name(dst.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+class ShingleBatchIOManager(ConfigurableIOManager):
+    """Store ShingleBatch payloads as memory-mapped Arrow IPC, dicts inline.
+
+    Args:
+        base_dir: Storage root. Empty → <instance storage dir>/shingle_batches.
+
+    Returns:
+        Asset dicts with ShingleBatch values restored on load.
+    """
+
+    base_dir: str = ""
+
+    # id(batch) → (weakref, arrow path, hashed) for batches loaded by this step
+    _loaded: dict[int, tuple[weakref.ref, Path, bool]] = PrivateAttr(default_factory=dict)
+
+    def _path(self, storage_dir: str, identifier: list[str]) -> Path:
+        root = Path(self.base_dir) if self.base_dir else Path(storage_dir) / "shingle_batches"
+        return root.joinpath(*identifier)
+
+    def _write_batch(self, batch: ShingleBatch, arrow_path: Path) -> bool:
+        """Write (or hard-link) a batch; return True when bytes were written."""
+        entry = self._loaded.get(id(batch))
+        hashed = batch.shingle_hash64 is not None
+        if entry is not None and entry[0]() is batch and entry[2] == hashed:
+            source = entry[1]
+            if source != arrow_path:
+                _link_or_copy(source, arrow_path)
+                _link_or_copy(source.with_suffix(".txt"), arrow_path.with_suffix(".txt"))
+            return False
+
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+
+        tmp = arrow_path.with_name(arrow_path.name + ".tmp")
+        record_batch = _batch_to_record_batch(batch)
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with ipc.new_file(sink, record_batch.schema) as writer:
+                writer.write_batch(record_batch)
+        os.replace(tmp, arrow_path)
+        text_tmp = arrow_path.with_suffix(".txt.tmp")
+        text_tmp.write_text(batch.text, encoding="utf-8")
+        os.replace(text_tmp, arrow_path.with_suffix(".txt"))
+        return True
+
+    def _read_batch(self, arrow_path: Path) -> ShingleBatch:
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+
+        source = pa.memory_map(str(arrow_path), "r")
+        record_batch = ipc.open_file(source).get_batch(0)
+        text = arrow_path.with_suffix(".txt").read_text(encoding="utf-8")
+        batch = _record_batch_to_batch(record_batch, text)
+        self._loaded[id(batch)] = (weakref.ref(batch), arrow_path, batch.shingle_hash64 is not None)
+        return batch
+
+    def handle_output(self, context: OutputContext, obj: Any) -> None:
+        """Pickle the asset dict, storing ShingleBatch values as Arrow IPC.
+
+        Args:
+            context: Dagster output context.
+            obj: Asset return value (usually a dict).
+
+        Returns:
+            None.
+        """
+        path = self._path(
+            context.step_context.instance.storage_directory(), context.get_asset_identifier()
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        payload = obj
+        written = linked = 0
+        if isinstance(obj, dict):
+            payload = {}
+            for key, value in obj.items():
+                if isinstance(value, ShingleBatch):
+                    arrow_path = path.with_name(f"{path.name}.{key}.arrow")
+                    if self._write_batch(value, arrow_path):
+                        written += 1
+                    else:
+                        linked += 1
+                    payload[key] = _BatchRef(key=key)
+                else:
+                    payload[key] = value
+
+        tmp = path.with_name(path.name + ".pkl.tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path.with_name(path.name + ".pkl"))
+        if written or linked:
+            context.add_output_metadata(
+                {"shingle_batches_written": written, "shingle_batches_linked": linked}
+            )
+
+    def load_input(self, context: InputContext) -> Any:
+        """Unpickle the asset dict and memory-map its ShingleBatch values.
+
+        Args:
+            context: Dagster input context.
+
+        Returns:
+            The stored asset value with ShingleBatch objects restored.
+        """
+        path = self._path(context.instance.storage_directory(), context.get_asset_identifier())
+        with open(path.with_name(path.name + ".pkl"), "rb") as fh:
+            payload = pickle.load(fh)
+        if isinstance(payload, dict):
+            for key, value in payload.items():
+                if isinstance(value, _BatchRef):
+                    payload[key] = self._read_batch(path.with_name(f"{path.name}.{value.key}.arrow"))
+        return payload
@@ -14,6 +14,7 @@ from __future__ import annotations
 from dagster import define_asset_job
 
 from docfp.dagster_defs.assets import (
+    corpus_fingerprint_batch,
     document_fingerprint_summary,
     document_hash_signature,
     document_metadata_json,
@@ -22,27 +23,43 @@ from docfp.dagster_defs.assets import (
     document_shingle_parquet,
     document_shingles,
     lsh_index,
+    near_duplicate_clusters,
     normalized_text,
     ocr_extracted_text,
     raw_extracted_text,
     source_document,
 )
 
+# Per-document assets, partitioned by input_file_partitions
+DOCUMENT_ASSETS = [
+    source_document,
+    document_metadata_json,
+    raw_extracted_text,
+    ocr_extracted_text,
+    normalized_text,
+    document_shingles,
+    document_shingle_hashes,
+    document_shingle_parquet,
+    document_hash_signature,
+    document_minhash_signature,
+    lsh_index,
+    document_fingerprint_summary,
+]
+
 fingerprint_pipeline_job = define_asset_job(
     name="fingerprint_pipeline_job",
-    selection=[
-        source_document,
-        document_metadata_json,
-        raw_extracted_text,
-        ocr_extracted_text,
-        normalized_text,
-        document_shingles,
-        document_shingle_hashes,
-        document_shingle_parquet,
-        document_hash_signature,
-        document_minhash_signature,
-        lsh_index,
-        document_fingerprint_summary,
-    ],
-    description="Full document fingerprinting pipeline: ingest → extract → normalize → shingle → sign → LSH",
+    selection=DOCUMENT_ASSETS,
+    description="Full document fingerprinting pipeline, one input_files partition per run: ingest → extract → normalize → shingle → sign → LSH",
+)
+
+corpus_batch_job = define_asset_job(
+    name="corpus_batch_job",
+    selection=[corpus_fingerprint_batch],
+    description="Corpus batch fingerprinting: every document in an input folder or manifest, fanned out over a process pool",
+)
+
+near_duplicate_cluster_job = define_asset_job(
+    name="near_duplicate_cluster_job",
+    selection=[near_duplicate_clusters],
+    description="All-pairs near-duplicate clustering of every stored signature, one LSH band per worker",
 )
@@ -0,0 +1,59 @@
+"""
+File Name: partitions.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: input_file_partitions — the dynamic partitions of the per-document
+             fingerprinting assets: one partition per input file, registered by
+             input_file_sensor as files arrive.
+
+Note: A partition key is the file's path relative to the watched input
+      directory, POSIX-style (e.g. 'reports/2026/q1.pdf').  Keys are never
+      absolute, so the IO managers always store a partition's outputs under
+      their own storage directory.  source_document resolves the key against
+      PipelineConfig.input_dir.
+
+Requirements:
+- dagster>=1.9
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from pathlib import Path, PurePosixPath
+
+from dagster import DynamicPartitionsDefinition
+
+INPUT_FILE_PARTITIONS_NAME = "input_files"
+
+input_file_partitions = DynamicPartitionsDefinition(name=INPUT_FILE_PARTITIONS_NAME)
+
+
+def input_file_partition_key(input_dir: str | Path, path: str | Path) -> str:
+    """Return the partition key of a file under the watched input directory.
+
+    Args:
+        input_dir: Watched input directory.
+        path: File inside input_dir.
+
+    Returns:
+        POSIX path of the file relative to input_dir.
+    """
+    return Path(path).resolve().relative_to(Path(input_dir).resolve()).as_posix()
+
+
+def input_file_path(input_dir: str | Path, partition_key: str) -> Path:
+    """Resolve a partition key back to the file it names.
+
+    Args:
+        input_dir: Watched input directory.
+        partition_key: Key returned by input_file_partition_key().
+
+    Returns:
+        Path of the file under input_dir.
+    """
+    relative = PurePosixPath(partition_key)
+    if relative.is_absolute() or ".." in relative.parts:
+        raise ValueError(
+            f"Partition key is not a path inside the input directory: {partition_key!r}"
+        )
+    return Path(input_dir).joinpath(*relative.parts)
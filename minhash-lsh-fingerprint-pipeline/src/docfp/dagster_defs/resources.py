@@ -2,9 +2,10 @@
 File Name: resources.py
 Author: Senthilnathan Karuppaiah
 Date: 2026-05-03
-Description: Dagster ConfigurableResource definitions — extractor, normalizer,
-             and hasher are wired here so they can be swapped via dagster.yaml
-             without touching asset code (ADR-003).
+Description: Dagster ConfigurableResource definitions — extractor, OCR,
+             normalizer, hasher, and text cache are wired here so they can
+             be swapped via dagster.yaml without touching asset code
+             (ADR-003).
 
 Requirements:
 - dagster>=1.9
@@ -13,14 +14,33 @@ Requirements:
 
 from __future__ import annotations
 
+from pathlib import Path
+from typing import Any, Optional
+
 from dagster import ConfigurableResource
 
-from docfp.extractors.tika_extractor import TikaDocumentTextExtractor
+from docfp.extractors.factory import build_extractor
+from docfp.extractors.tesseract_ocr_processor import (
+    DEFAULT_DPI,
+    DEFAULT_LANGUAGE,
+    DEFAULT_PAGE_TIMEOUT_SECONDS,
+    TesseractOcrProcessor,
+)
+from docfp.extractors.tika_server_pool import (
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_PORT,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+)
 from docfp.interfaces.document_text_extractor import DocumentTextExtractor
 from docfp.interfaces.normalizer import Normalizer
+from docfp.interfaces.ocr_processor import OcrProcessor
 from docfp.interfaces.shingle_hasher import ShingleHasher
-from docfp.processors.shingle_hash_processor import ShingleHashProcessor
-from docfp.processors.text_normalizer import TextNormalizer
+from docfp.processors.shingle_hash_processor import (
+    DEFAULT_HASH64_ALGORITHM,
+    ShingleHashProcessor,
+)
+from docfp.processors.normalizer_factory import DEFAULT_NORMALIZATION_VERSION, build_normalizer
+from docfp.processors.text_cache import DEFAULT_MAX_BYTES, ContentAddressedTextCache
 
 
 class TextExtractorResource(ConfigurableResource):
@@ -28,37 +48,72 @@ class TextExtractorResource(ConfigurableResource):
 
     Args:
         engine: Extractor engine name. Supported values: 'tika'.
+        tika_server_url: Running Tika server (or local stand-in) to use;
+                         empty → localhost:tika_port, launched if needed.
+        tika_server_jar: tika-server JAR launched when nothing is listening;
+                         empty → tika-python's downloaded default.
+        tika_port: Local Tika server port. Default 9998.
+        max_in_flight: Concurrent Tika parses per process. Default 4.
+        request_timeout_seconds: Per-document Tika timeout. Default 300.
 
     Returns:
         DocumentTextExtractor instance.
     """
 
     engine: str = "tika"
+    tika_server_url: str = ""
+    tika_server_jar: str = ""
+    tika_port: int = DEFAULT_PORT
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    request_timeout_seconds: float = DEFAULT_REQUEST_TIMEOUT_SECONDS
+
+    def get_extractor_options(self) -> dict[str, Any]:
+        """Return the engine options passed to build_extractor.
+
+        Args:
+            None.
+
+        Returns:
+            Dict of TikaServerPool keyword arguments for the 'tika' engine.
+        """
+        return {
+            "server_url": self.tika_server_url,
+            "server_jar": self.tika_server_jar,
+            "port": self.tika_port,
+            "max_in_flight": self.max_in_flight,
+            "request_timeout_seconds": self.request_timeout_seconds,
+        }
 
     def get_extractor(self) -> DocumentTextExtractor:
         """Return the configured DocumentTextExtractor implementation.
 
+        The underlying Tika pool is cached per process, so repeated calls
+        reuse the same warm server and keep-alive connections.
+
         Args:
             None.
 
         Returns:
             DocumentTextExtractor instance for the configured engine.
         """
-        if self.engine == "tika":
-            return TikaDocumentTextExtractor()
-        raise ValueError(f"Unsupported extractor engine: {self.engine!r}")
+        return build_extractor(self.engine, **self.get_extractor_options())
 
 
 class TextNormalizerResource(ConfigurableResource):
     """Dagster resource wrapping the active Normalizer.
 
     Args:
+        normalization_version: Rule set version, 'v2' (default, single-pass
+                               FusedTextNormalizer) or 'v1' (TextNormalizer).
+                               Both produce identical text; the version is
+                               part of cache and registry keys.
         remove_stopwords: Whether stopwords should be removed during normalization.
 
     Returns:
         Normalizer instance.
     """
 
+    normalization_version: str = DEFAULT_NORMALIZATION_VERSION
     remove_stopwords: bool = False
 
     def get_normalizer(self) -> Normalizer:
@@ -70,16 +125,25 @@ class TextNormalizerResource(ConfigurableResource):
         Returns:
             Normalizer instance.
         """
-        return TextNormalizer(remove_stopwords=self.remove_stopwords)
+        return build_normalizer(self.normalization_version, self.remove_stopwords)
 
 
 class ShingleHasherResource(ConfigurableResource):
     """Dagster resource wrapping the ShingleHasher.
 
+    Args:
+        hash64_algorithm: 64-bit shingle hash, 'xxh64' (default) or 'xxh3_64'.
+                          Changing it changes every shingle_hash64 and MinHash,
+                          so signatures are only comparable within one setting.
+        max_workers: Threads used to hash large shingle batches. Default 1.
+
     Returns:
         ShingleHasher instance (SHA-256 + xxhash64).
     """
 
+    hash64_algorithm: str = DEFAULT_HASH64_ALGORITHM
+    max_workers: int = 1
+
     def get_hasher(self) -> ShingleHasher:
         """Return the ShingleHasher implementation.
 
@@ -89,4 +153,85 @@ class ShingleHasherResource(ConfigurableResource):
         Returns:
             ShingleHashProcessor instance.
         """
-        return ShingleHashProcessor()
+        return ShingleHashProcessor(
+            hash64_algorithm=self.hash64_algorithm, max_workers=self.max_workers
+        )
+
+
+class OcrProcessorResource(ConfigurableResource):
+    """Dagster resource wrapping the page-parallel OcrProcessor.
+
+    Args:
+        dpi: Page rasterization resolution. Default 300.
+        language: Tesseract language code(s), e.g. 'eng+deu'. Default 'eng'.
+        page_timeout_seconds: Per-page OCR timeout. Default 120.
+        max_workers: OCR worker processes; 0 uses every available core.
+
+    Returns:
+        OcrProcessor instance.
+    """
+
+    dpi: int = DEFAULT_DPI
+    language: str = DEFAULT_LANGUAGE
+    page_timeout_seconds: float = DEFAULT_PAGE_TIMEOUT_SECONDS
+    max_workers: int = 0
+
+    def get_ocr_processor(self) -> OcrProcessor:
+        """Return the configured OcrProcessor implementation.
+
+        Args:
+            None.
+
+        Returns:
+            TesseractOcrProcessor instance.
+        """
+        return TesseractOcrProcessor(
+            dpi=self.dpi,
+            language=self.language,
+            page_timeout_seconds=self.page_timeout_seconds,
+            max_workers=self.max_workers,
+        )
+
+
+class TextCacheResource(ConfigurableResource):
+    """Dagster resource wrapping the content-addressed text cache.
+
+    Args:
+        enabled: When False every document is extracted and normalized afresh.
+        cache_dir: Cache root; empty → <output_root>/cache/text.
+        max_bytes: Cached payload cap before LRU eviction. Default 2 GiB.
+
+    Returns:
+        ContentAddressedTextCache instance, or None when disabled.
+    """
+
+    enabled: bool = True
+    cache_dir: str = ""
+    max_bytes: int = DEFAULT_MAX_BYTES
+
+    def resolve_cache_dir(self, output_root: str) -> Optional[str]:
+        """Return the cache directory for a run, or None when disabled.
+
+        Args:
+            output_root: Run output root used when cache_dir is empty.
+
+        Returns:
+            Cache directory path, or None.
+        """
+        if not self.enabled:
+            return None
+        return self.cache_dir or str(Path(output_root) / "cache" / "text")
+
+    def get_cache(self, output_root: str) -> Optional[ContentAddressedTextCache]:
+        """Return the text cache for a run, or None when disabled.
+
+        Args:
+            output_root: Run output root used when cache_dir is empty.
+
+        Returns:
+            ContentAddressedTextCache instance, or None.
+        """
+        cache_dir = self.resolve_cache_dir(output_root)
+        if cache_dir is None:
+            return None
+        return ContentAddressedTextCache(cache_dir, max_bytes=self.max_bytes)
@@ -0,0 +1,182 @@
+"""
+File Name: sensors.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: input_file_sensor — continuous ingestion.  Watches an input
+             directory, registers every new file as an input_files dynamic
+             partition and launches one fingerprint_pipeline_job run per
+             partition, within backpressure limits.
+
+Note: Each tick:
+        1. scans the input directory (BatchFingerprintProcessor.discover
+           rules: recursive file_glob, hidden files ignored) and keeps files
+           untouched for min_file_age_seconds, so half-copied files wait;
+        2. registers files that are not yet partitions;
+        3. launches runs for partitions that have not materialized
+           source_document and have no run yet, in key order, at most
+           max_runs_per_tick and never more than max_in_flight queued or
+           running fingerprint_pipeline_job runs in total.
+      Partitions held back by the limits are picked up on later ticks.  The
+      run key is the partition key, so a file is never launched twice by the
+      sensor; failed partitions are re-run from the UI or a backfill.  How
+      many launched runs execute at once is set by the instance's run
+      coordinator (run_queue.max_concurrent_runs in dagster.yaml).  Defaults
+      come from DOCFP_INPUT_DIR, DOCFP_OUTPUT_ROOT and
+      DOCFP_SENSOR_MAX_IN_FLIGHT; build_input_file_sensor() builds sensors
+      for other directories.
+
+Requirements:
+- dagster>=1.9
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+from dagster import (
+    DagsterRunStatus,
+    DefaultSensorStatus,
+    RunConfig,
+    RunRequest,
+    RunsFilter,
+    SensorDefinition,
+    SensorEvaluationContext,
+    SensorResult,
+    sensor,
+)
+
+from docfp.dagster_defs.assets import PipelineConfig, source_document
+from docfp.dagster_defs.jobs import DOCUMENT_ASSETS, fingerprint_pipeline_job
+from docfp.dagster_defs.partitions import (
+    INPUT_FILE_PARTITIONS_NAME,
+    input_file_partition_key,
+    input_file_partitions,
+)
+from docfp.processors.batch_fingerprint_processor import BatchFingerprintProcessor
+
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_MAX_RUNS_PER_TICK = 20
+DEFAULT_MIN_FILE_AGE_SECONDS = 30.0
+DEFAULT_MINIMUM_INTERVAL_SECONDS = 30
+
+_IN_FLIGHT_STATUSES = [
+    DagsterRunStatus.QUEUED,
+    DagsterRunStatus.NOT_STARTED,
+    DagsterRunStatus.STARTING,
+    DagsterRunStatus.STARTED,
+]
+# Substrings Dagster rejects in partition keys
+_INVALID_KEY_SUBSTRINGS = ("...", "\a", "\b", "\f", "\n", "\r", "\t", "\v", "\0")
+
+
+def _settled_partition_keys(
+    input_dir: str, file_glob: str, min_file_age_seconds: float
+) -> list[str]:
+    """Return the sorted partition keys of files old enough to ingest."""
+    now = time.time()
+    keys: list[str] = []
+    for uri in BatchFingerprintProcessor.discover(input_dir=input_dir, file_glob=file_glob):
+        try:
+            age = now - Path(uri).stat().st_mtime
+        except FileNotFoundError:  # removed since the scan
+            continue
+        key = input_file_partition_key(input_dir, uri)
+        if age >= min_file_age_seconds and not any(s in key for s in _INVALID_KEY_SUBSTRINGS):
+            keys.append(key)
+    return keys
+
+
+def build_input_file_sensor(
+    input_dir: str = "data/input",
+    output_root: str = "output",
+    file_glob: str = "*",
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    max_runs_per_tick: int = DEFAULT_MAX_RUNS_PER_TICK,
+    min_file_age_seconds: float = DEFAULT_MIN_FILE_AGE_SECONDS,
+    minimum_interval_seconds: int = DEFAULT_MINIMUM_INTERVAL_SECONDS,
+    name: str = "input_file_sensor",
+) -> SensorDefinition:
+    """Build a sensor that ingests every file under input_dir as a partition.
+
+    Args:
+        input_dir: Directory watched recursively.
+        output_root: output_root passed to every launched run.
+        file_glob: Glob pattern applied under input_dir. Default '*'.
+        max_in_flight: Most queued or running fingerprint_pipeline_job runs.
+        max_runs_per_tick: Most runs launched by one evaluation.
+        min_file_age_seconds: Files modified more recently are left for a
+                              later tick.
+        minimum_interval_seconds: Seconds between evaluations.
+        name: Sensor name.
+
+    Returns:
+        SensorDefinition targeting fingerprint_pipeline_job (stopped by
+        default; start it in the UI or with `dagster sensor start`).
+    """
+    run_config = RunConfig(
+        ops={
+            asset.op.name: PipelineConfig(input_dir=input_dir, output_root=output_root)
+            for asset in DOCUMENT_ASSETS
+            if asset.op.config_schema is not None
+        }
+    )
+
+    @sensor(
+        name=name,
+        job=fingerprint_pipeline_job,
+        minimum_interval_seconds=minimum_interval_seconds,
+        default_status=DefaultSensorStatus.STOPPED,
+        description=f"Registers each file under {input_dir} as an input_files partition "
+        "and launches its fingerprint run",
+    )
+    def _input_file_sensor(context: SensorEvaluationContext) -> SensorResult:
+        instance = context.instance
+        keys = _settled_partition_keys(input_dir, file_glob, min_file_age_seconds)
+        registered = set(instance.get_dynamic_partitions(INPUT_FILE_PARTITIONS_NAME))
+        new_keys = [key for key in keys if key not in registered]
+        add_requests = [input_file_partitions.build_add_request(new_keys)] if new_keys else []
+
+        in_flight = instance.get_runs_count(
+            RunsFilter(job_name=fingerprint_pipeline_job.name, statuses=_IN_FLIGHT_STATUSES)
+        )
+        budget = max(0, min(max_runs_per_tick, max_in_flight - in_flight))
+        materialized = instance.get_materialized_partitions(source_document.key)
+
+        run_requests: list[RunRequest] = []
+        for key in keys:
+            if len(run_requests) >= budget:
+                break
+            if key in materialized:
+                continue
+            if key in registered and instance.get_runs_count(
+                RunsFilter(job_name=fingerprint_pipeline_job.name, tags={"dagster/partition": key})
+            ):
+                continue  # launched before, still running or failed
+            run_requests.append(RunRequest(run_key=key, partition_key=key, run_config=run_config))
+
+        context.log.info(
+            f"files={len(keys)} new_partitions={len(new_keys)} in_flight={in_flight} "
+            f"launched={len(run_requests)} budget={budget}"
+        )
+        if run_requests:
+            return SensorResult(run_requests=run_requests, dynamic_partitions_requests=add_requests)
+        reason = (
+            f"{in_flight} runs in flight (max_in_flight={max_in_flight})"
+            if budget == 0
+            else "No input files waiting for a run"
+        )
+        return SensorResult(skip_reason=reason, dynamic_partitions_requests=add_requests)
+
+    return _input_file_sensor
+
+
+input_file_sensor = build_input_file_sensor(
+    input_dir=os.environ.get("DOCFP_INPUT_DIR", "data/input"),
+    output_root=os.environ.get("DOCFP_OUTPUT_ROOT", "output"),
+    max_in_flight=int(os.environ.get("DOCFP_SENSOR_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT)),
+)
+
+sensors = [input_file_sensor]
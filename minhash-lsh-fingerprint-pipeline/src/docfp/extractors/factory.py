@@ -0,0 +1,55 @@
+"""
+File Name: factory.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: build_extractor — maps an extraction engine name to its
+             DocumentTextExtractor implementation so Dagster resources and
+             batch worker processes resolve engines the same way (ADR-003).
+
+Note: Engine options (e.g. the Tika pool's server_url, max_in_flight) are
+      passed through as keyword arguments.  share_extractor_options() warms a
+      shared backend once in the parent so worker processes attach to it
+      instead of each cold-starting their own.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from docfp.extractors.tika_extractor import TikaDocumentTextExtractor
+from docfp.extractors.tika_server_pool import get_tika_pool
+from docfp.interfaces.document_text_extractor import DocumentTextExtractor
+
+
+def build_extractor(engine: str, **options: Any) -> DocumentTextExtractor:
+    """Return the DocumentTextExtractor implementation for an engine name.
+
+    Args:
+        engine: Extractor engine name. Supported values: 'tika'.
+        **options: Engine options; for 'tika' the TikaServerPool arguments.
+
+    Returns:
+        DocumentTextExtractor instance for the requested engine.
+    """
+    if engine == "tika":
+        return TikaDocumentTextExtractor(pool=get_tika_pool(**options))
+    raise ValueError(f"Unsupported extractor engine: {engine!r}")
+
+
+def share_extractor_options(engine: str, options: dict[str, Any]) -> dict[str, Any]:
+    """Warm an engine's backend and return options that reuse it.
+
+    Args:
+        engine: Extractor engine name.
+        options: Engine options as passed to build_extractor.
+
+    Returns:
+        Options for worker processes; for 'tika' server_url is pinned to the
+        endpoint the parent resolved (launching the server if needed).
+    """
+    if engine == "tika":
+        return {**options, "server_url": get_tika_pool(**options).start()}
+    return dict(options)
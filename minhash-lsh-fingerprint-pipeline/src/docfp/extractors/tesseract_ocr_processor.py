@@ -0,0 +1,206 @@
+"""
+File Name: tesseract_ocr_processor.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: TesseractOcrProcessor — page-parallel OCR implementation of
+             OcrProcessor (FR-009).  PDF pages are rasterized with pdfplumber
+             at a configurable DPI and recognised with the Tesseract CLI, one
+             page per process-pool task, so OCR wall time scales with cores
+             rather than page count.
+
+Note: Each page runs under its own subprocess timeout; a page that times out
+      or fails yields empty text and is listed in metadata['ocr_failed_pages']
+      instead of failing the document.  Image files (TIFF, PNG, JPEG) are
+      OCR'd directly as a single page.  Tesseract must be on PATH (it is also
+      required by the 'ocr' extra, ocrmypdf).
+
+Requirements:
+- pdfplumber>=0.11
+- tesseract (system binary)
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from docfp.interfaces.ocr_processor import OcrProcessor
+from docfp.logging_config import get_logger
+from docfp.models.extracted_text import ExtractedDocumentText
+
+log = get_logger(__name__)
+
+EXTRACTION_ENGINE = "tesseract-ocr"
+DEFAULT_DPI = 300
+DEFAULT_LANGUAGE = "eng"
+DEFAULT_PAGE_TIMEOUT_SECONDS = 120.0
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".gif", ".webp"})
+
+
+def _run_tesseract(
+    image_path: str, language: str, dpi: int, timeout: float, tesseract_cmd: str
+) -> str:
+    completed = subprocess.run(
+        [tesseract_cmd, image_path, "stdout", "-l", language, "--dpi", str(dpi)],
+        capture_output=True,
+        timeout=timeout,
+        check=True,
+    )
+    return completed.stdout.decode("utf-8", errors="replace")
+
+
+def _ocr_page(
+    source_uri: str,
+    page_index: int,
+    dpi: int,
+    language: str,
+    timeout: float,
+    tesseract_cmd: str,
+) -> dict:
+    """Rasterize and OCR one page; runs inside a pool worker.
+
+    Args:
+        source_uri: PDF or image path.
+        page_index: Zero-based page index (ignored for image files).
+        dpi: Rasterization resolution passed to pdfplumber and Tesseract.
+        language: Tesseract language code(s), e.g. 'eng' or 'eng+deu'.
+        timeout: Seconds allowed for this page's Tesseract run.
+        tesseract_cmd: Tesseract executable.
+
+    Returns:
+        Dict with 'page' (1-based), 'text', 'seconds' and 'error' (None on success).
+    """
+    started = time.perf_counter()
+    page: dict = {"page": page_index + 1, "text": "", "seconds": 0.0, "error": None}
+    try:
+        if Path(source_uri).suffix.lower() in IMAGE_EXTENSIONS:
+            page["text"] = _run_tesseract(source_uri, language, dpi, timeout, tesseract_cmd)
+        else:
+            import pdfplumber
+
+            with tempfile.TemporaryDirectory(prefix="docfp_ocr_") as tmp_dir:
+                image_path = os.path.join(tmp_dir, f"page_{page_index + 1:05d}.png")
+                with pdfplumber.open(source_uri) as pdf:
+                    pdf.pages[page_index].to_image(resolution=dpi).original.save(image_path)
+                page["text"] = _run_tesseract(image_path, language, dpi, timeout, tesseract_cmd)
+    except subprocess.TimeoutExpired:
+        page["error"] = f"timeout after {timeout}s"
+    except Exception as exc:  # noqa: BLE001 — recorded per page
+        page["error"] = f"{type(exc).__name__}: {exc}"
+    page["seconds"] = round(time.perf_counter() - started, 3)
+    return page
+
+
+class TesseractOcrProcessor(OcrProcessor):
+    """OCR a document page by page across a process pool.
+
+    Args:
+        dpi: Rasterization resolution in dots per inch. Default 300.
+        language: Tesseract language code(s). Default 'eng'.
+        page_timeout_seconds: Per-page Tesseract timeout. Default 120.
+        max_workers: Pool size; 0 uses os.cpu_count(), 1 runs pages inline.
+        tesseract_cmd: Tesseract executable name or path. Default 'tesseract'.
+
+    Returns:
+        ExtractedDocumentText with ocr_applied=True and populated pages.
+    """
+
+    def __init__(
+        self,
+        dpi: int = DEFAULT_DPI,
+        language: str = DEFAULT_LANGUAGE,
+        page_timeout_seconds: float = DEFAULT_PAGE_TIMEOUT_SECONDS,
+        max_workers: int = 0,
+        tesseract_cmd: str = "tesseract",
+    ) -> None:
+        self.dpi = dpi
+        self.language = language
+        self.page_timeout_seconds = page_timeout_seconds
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.tesseract_cmd = tesseract_cmd
+
+    @property
+    def extraction_key(self) -> str:
+        """Text source identity for caching, e.g. 'tesseract-ocr/eng/300dpi'."""
+        return f"{EXTRACTION_ENGINE}/{self.language}/{self.dpi}dpi"
+
+    def _page_count(self, source_uri: str) -> int:
+        if Path(source_uri).suffix.lower() in IMAGE_EXTENSIONS:
+            return 1
+        import pdfplumber
+
+        with pdfplumber.open(source_uri) as pdf:
+            return len(pdf.pages)
+
+    def run_ocr(self, source_uri: str, document_id: str) -> ExtractedDocumentText:
+        """Rasterize every page and OCR them in parallel.
+
+        Args:
+            source_uri: Absolute path of the PDF or image to OCR.
+            document_id: SHA-256 identifier for the document.
+
+        Returns:
+            ExtractedDocumentText with text joined from pages in page order,
+            pages=[{'page', 'text'}, ...] and ocr_applied=True.
+        """
+        if shutil.which(self.tesseract_cmd) is None:
+            raise RuntimeError(
+                f"Tesseract executable {self.tesseract_cmd!r} not found on PATH; "
+                "install tesseract-ocr to enable the OCR path."
+            )
+
+        page_count = self._page_count(source_uri)
+        workers = min(self.max_workers, page_count) or 1
+        log.info(
+            "ocr_started",
+            document_id=document_id,
+            source_uri=source_uri,
+            page_count=page_count,
+            workers=workers,
+            dpi=self.dpi,
+        )
+        started = time.perf_counter()
+        args = (self.dpi, self.language, self.page_timeout_seconds, self.tesseract_cmd)
+        if workers == 1:
+            results = [_ocr_page(source_uri, i, *args) for i in range(page_count)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_ocr_page, source_uri, i, *args) for i in range(page_count)
+                ]
+                results = [f.result() for f in futures]
+
+        failed = [{"page": r["page"], "error": r["error"]} for r in results if r["error"]]
+        pages = [{"page": r["page"], "text": r["text"].strip()} for r in results]
+        text = "\n\n".join(p["text"] for p in pages if p["text"])
+        wall = time.perf_counter() - started
+        log.info(
+            "ocr_complete",
+            document_id=document_id,
+            page_count=page_count,
+            failed_page_count=len(failed),
+            text_length=len(text),
+            wall_seconds=round(wall, 3),
+            page_seconds_total=round(sum(r["seconds"] for r in results), 3),
+        )
+        return ExtractedDocumentText(
+            document_id=document_id,
+            source_uri=source_uri,
+            text=text,
+            metadata={
+                "ocr_page_count": page_count,
+                "ocr_failed_pages": failed,
+                "ocr_dpi": self.dpi,
+                "ocr_language": self.language,
+                "ocr_wall_seconds": round(wall, 3),
+            },
+            pages=pages,
+            extraction_engine=EXTRACTION_ENGINE,
+            ocr_applied=True,
+        )
@@ -5,43 +5,28 @@ Date: 2026-05-03
 Description: TikaDocumentTextExtractor — Apache Tika implementation of
              DocumentTextExtractor.  POC default extractor (FR-007, ADR-002).
 
-Note: Requires the 'tika' Python package and a reachable Tika server.
-      The tika package auto-starts a local JVM server on first use if
-      TIKA_SERVER_JAR is not set.
+Note: Documents are parsed through a TikaServerPool — one warm server and a
+      keep-alive HTTP connection pool per process — instead of a tika-python
+      round trip per call.  Without explicit pool options the shared default
+      pool is used (localhost:9998, launched via tika-python on first use).
+      Documents are parsed to XHTML (/rmeta/xml) so pages carries one chunk
+      per page and section (see tika_xhtml_pages.py); text is the
+      concatenation of those chunks.
 
 Requirements:
+- requests>=2.31
 - tika>=2.6
 - Python 3.12+
 """
 
 from __future__ import annotations
 
-import logging
-import os
-from datetime import datetime, timezone
-
-import structlog
-from tika import parser as tika_parser
-
+from docfp.extractors.tika_server_pool import TikaServerPool, get_tika_pool
 from docfp.interfaces.document_text_extractor import DocumentTextExtractor
+from docfp.logging_config import get_logger
 from docfp.models.extracted_text import ExtractedDocumentText
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
 
 EXTRACTION_ENGINE = "apache-tika"
 
@@ -50,12 +35,15 @@ class TikaDocumentTextExtractor(DocumentTextExtractor):
     """Extract text from documents using Apache Tika (POC default).
 
     Args:
-        source_uri: Absolute file path of the document to extract text from.
+        pool: TikaServerPool to parse through; None → the default shared pool.
 
     Returns:
-        ExtractedDocumentText with full body text and Tika metadata.
+        ExtractedDocumentText with full body text, pages and Tika metadata.
     """
 
+    def __init__(self, pool: TikaServerPool | None = None) -> None:
+        self.pool = pool or get_tika_pool()
+
     def extract(self, source_uri: str) -> ExtractedDocumentText:
         """Run Tika parser on the source document and return extracted text.
 
@@ -63,19 +51,18 @@ class TikaDocumentTextExtractor(DocumentTextExtractor):
             source_uri: Absolute path or URI of the document.
 
         Returns:
-            ExtractedDocumentText with text body, Tika metadata dict, and
-            ocr_applied=False.
+            ExtractedDocumentText with text body, Tika metadata dict,
+            page/section chunks and ocr_applied=False.
         """
         log.info("tika_extraction_start", source_uri=source_uri)
 
-        parsed = tika_parser.from_file(source_uri)
-        text: str = parsed.get("content") or ""
-        metadata: dict = parsed.get("metadata") or {}
+        text, metadata, pages = self.pool.parse_pages(source_uri)
 
         log.info(
             "tika_extraction_complete",
             source_uri=source_uri,
             text_length=len(text),
+            page_count=len({chunk["page"] for chunk in pages} - {0}),
             metadata_keys=list(metadata.keys()),
         )
 
@@ -84,7 +71,7 @@ class TikaDocumentTextExtractor(DocumentTextExtractor):
             source_uri=source_uri,
             text=text.strip(),
             metadata=metadata,
-            pages=[],
+            pages=pages,
             extraction_engine=EXTRACTION_ENGINE,
             ocr_applied=False,
         )
@@ -0,0 +1,311 @@
+"""
+File Name: tika_server_pool.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: TikaServerPool — one warm Apache Tika server plus a keep-alive
+             HTTP connection pool shared by every TikaDocumentTextExtractor in
+             a process.  Replaces the per-call tika-python round trip (server
+             probe + fresh connection + upload) with a single started-once
+             endpoint and bounded concurrent in-flight parses.
+
+Note: Endpoint resolution, first match wins:
+        1. server_url  — an already running Tika server or a local stand-in
+                         (see tika_stand_in_server.py); never launched here.
+        2. localhost:port already answering GET /tika — reused as is.
+        3. server_jar  — launched as 'java -jar <jar> --port <port>'.
+        4. otherwise   — tika-python downloads and launches its default jar.
+      Launched servers run in their own session and are left running when the
+      process exits, so later runs and worker processes find them warm on the
+      port; call stop_server() to shut one down explicitly.
+      get_tika_pool() caches one pool per (process, configuration); forked
+      workers therefore never share an inherited HTTP connection.
+      parse() returns the plain-text handler's output; parse_pages() asks for
+      XHTML and also returns the page/section chunks.
+
+Requirements:
+- requests>=2.31
+- tika>=2.6
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from docfp.extractors.tika_xhtml_pages import merge_rmeta_pages
+from docfp.logging_config import get_logger
+
+if TYPE_CHECKING:
+    import requests
+
+log = get_logger(__name__)
+
+DEFAULT_PORT = 9998
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 300.0
+DEFAULT_STARTUP_TIMEOUT_SECONDS = 120.0
+_PROBE_TIMEOUT_SECONDS = 2.0
+_TIKA_CONTENT_KEY = "X-TIKA:content"
+
+
+def merge_rmeta(entries: list[dict[str, Any]]) -> tuple[str, dict[str, Any]]:
+    """Fold a /rmeta/text response into (content, metadata).
+
+    Matches tika-python's parser.from_file: content of the container and
+    every embedded document is concatenated; metadata keys repeated across
+    entries become lists.
+
+    Args:
+        entries: JSON list returned by PUT /rmeta/text.
+
+    Returns:
+        Tuple of (concatenated text, merged metadata dict).
+    """
+    content = "".join(e[_TIKA_CONTENT_KEY] for e in entries if _TIKA_CONTENT_KEY in e)
+    metadata: dict[str, Any] = {}
+    for entry in entries:
+        for key, value in entry.items():
+            if key == _TIKA_CONTENT_KEY:
+                continue
+            if key in metadata:
+                if not isinstance(metadata[key], list):
+                    metadata[key] = [metadata[key]]
+                metadata[key].append(value)
+            else:
+                metadata[key] = value
+    return content, metadata
+
+
+class TikaServerPool:
+    """Warm Tika server endpoint with a pooled keep-alive HTTP session.
+
+    Args:
+        server_url: Existing server or stand-in URL; empty → localhost:port.
+        server_jar: tika-server-standard JAR launched when nothing answers.
+        port: Local port used when server_url is empty. Default 9998.
+        max_in_flight: Concurrent parse requests (and pooled connections).
+        request_timeout_seconds: Per-document parse timeout. Default 300.
+        startup_timeout_seconds: Time allowed for the server to answer. Default 120.
+        java_path: Java executable used with server_jar. Default 'java'.
+
+    Returns:
+        TikaServerPool instance; parse() returns (text, metadata).
+    """
+
+    def __init__(
+        self,
+        server_url: str = "",
+        server_jar: str = "",
+        port: int = DEFAULT_PORT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        request_timeout_seconds: float = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        startup_timeout_seconds: float = DEFAULT_STARTUP_TIMEOUT_SECONDS,
+        java_path: str = "java",
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        self.server_url = server_url.rstrip("/")
+        self.server_jar = server_jar
+        self.port = port
+        self.max_in_flight = max_in_flight
+        self.request_timeout_seconds = request_timeout_seconds
+        self.startup_timeout_seconds = startup_timeout_seconds
+        self.java_path = java_path
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._session: requests.Session | None = None
+        self._endpoint: str | None = None
+        self._process: subprocess.Popen | None = None
+
+    def _new_session(self) -> requests.Session:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.max_in_flight, pool_block=True
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _is_ready(self, session: requests.Session, endpoint: str) -> bool:
+        import requests
+
+        try:
+            return session.get(f"{endpoint}/tika", timeout=_PROBE_TIMEOUT_SECONDS).ok
+        except requests.RequestException:
+            return False
+
+    def _launch(self, endpoint: str) -> None:
+        if self.server_jar:
+            self._process = subprocess.Popen(
+                [
+                    self.java_path,
+                    "-jar",
+                    self.server_jar,
+                    "--port",
+                    str(self.port),
+                    "--host",
+                    "localhost",
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            log.info("tika_server_launched", endpoint=endpoint, pid=self._process.pid)
+        else:
+            from tika.tika import checkTikaServer
+
+            checkTikaServer("http", "localhost", str(self.port))
+            log.info("tika_server_launched", endpoint=endpoint, launcher="tika-python")
+
+    def start(self) -> str:
+        """Resolve (launching if needed) the server endpoint; idempotent.
+
+        Args:
+            None.
+
+        Returns:
+            Base URL of a Tika server that answered GET /tika.
+        """
+        if self._endpoint is not None:
+            return self._endpoint
+        with self._lock:
+            if self._endpoint is not None:
+                return self._endpoint
+            session = self._new_session()
+            endpoint = self.server_url or f"http://localhost:{self.port}"
+            started = time.perf_counter()
+            if not self.server_url and not self._is_ready(session, endpoint):
+                self._launch(endpoint)
+            deadline = started + self.startup_timeout_seconds
+            while not self._is_ready(session, endpoint):
+                if self._process is not None and self._process.poll() is not None:
+                    raise RuntimeError(
+                        f"Tika server exited with code {self._process.returncode} "
+                        f"before answering at {endpoint}."
+                    )
+                if time.perf_counter() > deadline:
+                    raise RuntimeError(
+                        f"Tika server at {endpoint} did not answer within "
+                        f"{self.startup_timeout_seconds}s."
+                    )
+                time.sleep(0.5)
+            log.info(
+                "tika_pool_ready",
+                endpoint=endpoint,
+                max_in_flight=self.max_in_flight,
+                startup_seconds=round(time.perf_counter() - started, 3),
+            )
+            self._session = session
+            self._endpoint = endpoint
+            return endpoint
+
+    def _rmeta(self, source_uri: str, handler: str) -> list[dict[str, Any]]:
+        """PUT one document to /rmeta/<handler> and return the JSON entries."""
+        from tika.tika import make_content_disposition_header
+
+        endpoint = self.start()
+        headers = {
+            "Accept": "application/json",
+            "Content-Disposition": make_content_disposition_header(source_uri),
+        }
+        with self._slots, open(Path(source_uri), "rb") as fh:
+            resp = self._session.put(
+                f"{endpoint}/rmeta/{handler}",
+                data=fh,
+                headers=headers,
+                timeout=self.request_timeout_seconds,
+            )
+        resp.raise_for_status()
+        resp.encoding = "utf-8"
+        return json.loads(resp.text) if resp.text else []
+
+    def parse(self, source_uri: str) -> tuple[str, dict[str, Any]]:
+        """Upload one document to /rmeta/text and return its text and metadata.
+
+        Blocks while max_in_flight parses are already running in this pool.
+
+        Args:
+            source_uri: Absolute path of the document to parse.
+
+        Returns:
+            Tuple of (text, metadata) merged as tika-python does.
+        """
+        return merge_rmeta(self._rmeta(source_uri, "text"))
+
+    def parse_pages(self, source_uri: str) -> tuple[str, dict[str, Any], list[dict[str, Any]]]:
+        """Upload one document to /rmeta/xml and return text, metadata and pages.
+
+        Blocks while max_in_flight parses are already running in this pool.
+
+        Args:
+            source_uri: Absolute path of the document to parse.
+
+        Returns:
+            Tuple of (text, metadata, pages); pages are the page/section
+            chunks of merge_rmeta_pages() and text is their concatenation.
+        """
+        entries = self._rmeta(source_uri, "xml")
+        text, pages = merge_rmeta_pages(entries)
+        _, metadata = merge_rmeta(entries)
+        return text, metadata, pages
+
+    def close(self) -> None:
+        """Close pooled connections; a launched server keeps running.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+            self._session = None
+            self._endpoint = None
+
+    def stop_server(self) -> None:
+        """Close connections and terminate the server this pool launched.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        self.close()
+        if self._process is not None and self._process.poll() is None:
+            os.killpg(self._process.pid, signal.SIGTERM)
+            self._process.wait(timeout=30)
+        self._process = None
+
+
+_POOLS: dict[tuple, TikaServerPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_tika_pool(**options: Any) -> TikaServerPool:
+    """Return the process-wide TikaServerPool for a configuration.
+
+    Args:
+        **options: TikaServerPool keyword arguments.
+
+    Returns:
+        Cached TikaServerPool, created on first use in this process.
+    """
+    key = (os.getpid(), tuple(sorted(options.items())))
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is None:
+            pool = _POOLS[key] = TikaServerPool(**options)
+        return pool
@@ -0,0 +1,149 @@
+"""
+File Name: tika_stand_in_server.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: TikaStandInServer — minimal in-process HTTP server speaking the
+             Tika REST calls TikaServerPool uses (GET /tika, PUT /rmeta/text,
+             PUT /rmeta/xml), so tests, benchmarks and laptops without Java
+             can exercise the pooled extractor end to end.
+
+Note: The uploaded body is decoded as UTF-8 (errors replaced) and returned as
+      X-TIKA:content, which is exact for plain-text fixtures only.  For
+      /rmeta/xml the text is split into <div class="page"> elements at form
+      feeds (\\f), and lines starting with '#' become <h1> headings, so
+      page-aware extraction can be exercised with plain-text fixtures.  Point
+      TextExtractorResource(tika_server_url=server.url) at it.  The optional
+      latency_seconds delay emulates parse time so in-flight concurrency is
+      observable.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import html
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+_FILENAME = re.compile(r'filename\*?=(?:UTF-8\'\')?"?([^";]+)"?')
+
+
+def _to_xhtml(text: str) -> str:
+    """Render plain text as Tika-style XHTML, one page div per form feed."""
+    pages = []
+    for page in text.split("\f"):
+        blocks = []
+        for line in page.splitlines():
+            tag = "h1" if line.startswith("#") else "p"
+            blocks.append(f"<{tag}>{html.escape(line)}</{tag}>\n")
+        pages.append(f'<div class="page">\n{"".join(blocks)}</div>\n')
+    return (
+        '<html xmlns="http://www.w3.org/1999/xhtml"><head></head><body>'
+        f"{''.join(pages)}</body></html>"
+    )
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, as the real server
+    disable_nagle_algorithm = True  # headers and body go out as separate writes
+
+    def _reply(self, status: int, body: bytes, content_type: str) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802 — http.server naming
+        if self.path.rstrip("/") == "/tika":
+            self._reply(200, b"This is Tika Server (stand-in).", "text/plain")
+        else:
+            self._reply(404, b"", "text/plain")
+
+    def do_PUT(self) -> None:  # noqa: N802 — http.server naming
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        handler = self.path.rstrip("/")
+        if handler not in ("/rmeta/text", "/rmeta/xml"):
+            self._reply(404, b"", "text/plain")
+            return
+        self.server.request_count += 1
+        if self.server.latency_seconds:
+            time.sleep(self.server.latency_seconds)
+        match = _FILENAME.search(self.headers.get("Content-Disposition", ""))
+        text = body.decode("utf-8", errors="replace")
+        entry = {
+            "Content-Type": "text/plain; charset=UTF-8",
+            "X-TIKA:Parsed-By": "docfp.TikaStandInServer",
+            "X-TIKA:content": _to_xhtml(text) if handler == "/rmeta/xml" else text,
+        }
+        if match:
+            entry["resourceName"] = match.group(1)
+        self._reply(200, json.dumps([entry]).encode("utf-8"), "application/json")
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002
+        pass
+
+
+class TikaStandInServer:
+    """Background-thread stand-in for a Tika server on a free local port.
+
+    Args:
+        port: Port to bind; 0 picks a free one. Default 0.
+        latency_seconds: Artificial delay per parse request. Default 0.
+
+    Returns:
+        TikaStandInServer; use as a context manager or call start()/stop().
+    """
+
+    def __init__(self, port: int = 0, latency_seconds: float = 0.0) -> None:
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+        self._server.daemon_threads = True
+        self._server.latency_seconds = latency_seconds
+        self._server.request_count = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the stand-in server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self) -> int:
+        """Number of /rmeta parse requests served."""
+        return self._server.request_count
+
+    def start(self) -> TikaStandInServer:
+        """Serve requests on a daemon thread.
+
+        Args:
+            None.
+
+        Returns:
+            self, for chaining.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down and release the port.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> TikaStandInServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
@@ -0,0 +1,115 @@
+"""
+File Name: tika_xhtml_pages.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: split_xhtml_pages / merge_rmeta_pages — turn Tika's XHTML output
+             (PUT /rmeta/xml) into the extracted text plus per-page, per-section
+             text chunks for ExtractedDocumentText.pages.
+
+Note: Tika wraps every page of a paginated format (PDF, some Office formats)
+      in <div class="page">.  Pages are numbered from 1 in document order;
+      body text outside any page div (non-paginated formats, embedded
+      documents) is page 0.  Within a page, each h1-h6 heading opens a new
+      section unless the current section has no text yet, so section 0 is
+      the text before the first heading.  The character data of <body> is
+      kept verbatim, including the newlines Tika emits around block
+      elements, so the joined chunks equal the /rmeta/text content and
+      page boundaries always fall on whitespace.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from html.parser import HTMLParser
+from typing import Any
+
+_TIKA_CONTENT_KEY = "X-TIKA:content"
+_HEADINGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+
+class _PageSplitter(HTMLParser):
+    """Collect <body> character data into (page, sections) chunks."""
+
+    def __init__(self, paginate: bool) -> None:
+        super().__init__(convert_charrefs=True)
+        self.pages: list[dict[str, Any]] = []
+        self._next_page = 1
+        self._paginate = paginate
+        self._in_body = False
+        self._divs: list[bool] = []  # per open <div>: is it a page div?
+        self._page = 0
+
+    def _open_chunk(self, page: int) -> None:
+        self._page = page
+        self.pages.append({"page": page, "sections": [""]})
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag == "body":
+            self._in_body = True
+            return
+        if not self._in_body:
+            return
+        if tag == "div":
+            classes = (dict(attrs).get("class") or "").split()
+            is_page = self._paginate and "page" in classes
+            self._divs.append(is_page)
+            if is_page:
+                self._open_chunk(self._next_page)
+                self._next_page += 1
+        elif tag in _HEADINGS and self.pages and self.pages[-1]["sections"][-1].strip():
+            self.pages[-1]["sections"].append("")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "body":
+            self._in_body = False
+        elif tag == "div" and self._in_body and self._divs and self._divs.pop():
+            self._page = 0  # text after the page div belongs to no page
+
+    def handle_data(self, data: str) -> None:
+        if not self._in_body:
+            return
+        if not self.pages or (self.pages[-1]["page"] != self._page and data.strip()):
+            self._open_chunk(self._page)
+        self.pages[-1]["sections"][-1] += data
+
+
+def split_xhtml_pages(xhtml: str, paginate: bool = True) -> list[dict[str, Any]]:
+    """Split one XHTML document into page chunks with their sections.
+
+    Args:
+        xhtml: XHTML produced by a Tika parser.
+        paginate: When False, page divs are ignored and all text is page 0.
+
+    Returns:
+        Chunks in document order, each {'page': int, 'text': str,
+        'sections': [str, ...]} where text is the concatenation of sections.
+    """
+    splitter = _PageSplitter(paginate)
+    splitter.feed(xhtml)
+    splitter.close()
+    return [
+        {"page": chunk["page"], "text": "".join(chunk["sections"]), "sections": chunk["sections"]}
+        for chunk in splitter.pages
+    ]
+
+
+def merge_rmeta_pages(entries: list[dict[str, Any]]) -> tuple[str, list[dict[str, Any]]]:
+    """Fold a /rmeta/xml response into (content, page chunks).
+
+    Only the container document (the first entry) is paginated; embedded
+    documents are appended as page 0, in the order merge_rmeta() joins them.
+
+    Args:
+        entries: JSON list returned by PUT /rmeta/xml.
+
+    Returns:
+        Tuple of (concatenated body text, page chunks in document order).
+    """
+    pages: list[dict[str, Any]] = []
+    for position, entry in enumerate(entries):
+        if _TIKA_CONTENT_KEY not in entry:
+            continue
+        pages.extend(split_xhtml_pages(entry[_TIKA_CONTENT_KEY], paginate=position == 0))
+    return "".join(chunk["text"] for chunk in pages), pages
@@ -12,6 +12,7 @@ Requirements:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator
 
 from docfp.models.normalized_text import NormalizedText
 
@@ -31,6 +32,24 @@ class Normalizer(ABC):
         NormalizedText instance.
     """
 
+    @property
+    @abstractmethod
+    def normalization_version(self) -> str:
+        """Version of the rule set applied, as stamped on NormalizedText.
+
+        Returns:
+            String such as 'v1' or 'v2'; recorded on every shingle.
+        """
+
+    @property
+    @abstractmethod
+    def normalization_key(self) -> str:
+        """Identity of the rule set applied, including options that change output.
+
+        Returns:
+            String such as 'v1' or 'v1+stopwords'; used in cache keys.
+        """
+
     @abstractmethod
     def normalize(self, document_id: str, source_uri: str, text: str) -> NormalizedText:
         """Normalize raw extracted text.
@@ -43,3 +62,34 @@ class Normalizer(ABC):
         Returns:
             NormalizedText with cleaned, lowercase, unicode-normalized text.
         """
+
+    def normalize_tokens(
+        self, document_id: str, source_uri: str, text: str
+    ) -> tuple[NormalizedText, list[str]]:
+        """Normalize raw extracted text and return its tokens as well.
+
+        The default splits normalize()'s text; implementations that produce
+        the tokens while normalizing override this to skip the extra split.
+
+        Args:
+            document_id: SHA-256 identifier for the source document.
+            source_uri: Absolute path or URI of the source document.
+            text: Raw extracted text string.
+
+        Returns:
+            Tuple of (NormalizedText, tokens equal to its text.split()).
+        """
+        normalized = self.normalize(document_id, source_uri, text)
+        return normalized, normalized.text.split()
+
+    @abstractmethod
+    def iter_tokens(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Normalize a stream of raw text chunks and yield tokens lazily.
+
+        Args:
+            chunks: Raw extracted text split at arbitrary positions.
+
+        Returns:
+            Iterator of normalized tokens identical to the whitespace split
+            of normalize() on the concatenated text.
+        """
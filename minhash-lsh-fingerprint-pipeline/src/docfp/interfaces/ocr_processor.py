@@ -27,6 +27,15 @@ class OcrProcessor(ABC):
         ExtractedDocumentText with ocr_applied=True.
     """
 
+    @property
+    @abstractmethod
+    def extraction_key(self) -> str:
+        """Identity of this engine and the settings that change its output.
+
+        Returns:
+            String such as 'tesseract-ocr/eng/300dpi'; used in cache keys.
+        """
+
     @abstractmethod
     def run_ocr(self, source_uri: str, document_id: str) -> ExtractedDocumentText:
         """Run OCR on a document and return extracted text.
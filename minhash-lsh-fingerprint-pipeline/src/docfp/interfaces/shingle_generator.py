@@ -6,14 +6,20 @@ Description: ShingleGenerator ABC — interface for sliding-window shingle
              generation (FR-011, ADR-005).
 
 Requirements:
+- numpy
 - Python 3.12+
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Optional
 
+import numpy as np
+
+from docfp.models.shingle_batch import ShingleBatch
 from docfp.models.shingle_record import ShingleRecord
+from docfp.processors.normalizer_factory import DEFAULT_NORMALIZATION_VERSION
 
 
 class ShingleGenerator(ABC):
@@ -40,6 +46,9 @@ class ShingleGenerator(ABC):
         tokens: list[str],
         partition_id: int = 0,
         partition_count: int = 1,
+        token_page_no: Optional[np.ndarray] = None,
+        token_section_id: Optional[np.ndarray] = None,
+        normalization_version: str = DEFAULT_NORMALIZATION_VERSION,
     ) -> list[ShingleRecord]:
         """Generate shingles from a token list.
 
@@ -50,7 +59,42 @@ class ShingleGenerator(ABC):
             tokens: Normalized token list to slide the window over.
             partition_id: Zero-based index of this partition.
             partition_count: Total number of partitions.
+            token_page_no: Optional int32 source page of each token.
+            token_section_id: Optional int32 section of each token.
+            normalization_version: Rule set that produced the tokens
+                                   (NormalizedText.normalization_version).
 
         Returns:
             List of ShingleRecord with text and hash fields populated.
         """
+
+    @abstractmethod
+    def generate_batch(
+        self,
+        document_id: str,
+        source_uri: str,
+        file_name: str,
+        tokens: list[str],
+        partition_id: int = 0,
+        partition_count: int = 1,
+        token_page_no: Optional[np.ndarray] = None,
+        token_section_id: Optional[np.ndarray] = None,
+        normalization_version: str = DEFAULT_NORMALIZATION_VERSION,
+    ) -> ShingleBatch:
+        """Generate shingles from a token list in columnar form.
+
+        Args:
+            document_id: SHA-256 identifier for the source document.
+            source_uri: Absolute path or URI of the source document.
+            file_name: Original file name with extension.
+            tokens: Normalized token list to slide the window over.
+            partition_id: Zero-based index of this partition.
+            partition_count: Total number of partitions.
+            token_page_no: Optional int32 source page of each token.
+            token_section_id: Optional int32 section of each token.
+            normalization_version: Rule set that produced the tokens
+                                   (NormalizedText.normalization_version).
+
+        Returns:
+            ShingleBatch with offset columns populated.
+        """
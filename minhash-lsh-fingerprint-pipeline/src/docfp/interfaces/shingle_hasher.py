@@ -13,6 +13,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+from docfp.models.shingle_batch import ShingleBatch
+
 
 class ShingleHasher(ABC):
     """Abstract base class for shingle hashing strategies.
@@ -42,3 +44,15 @@ class ShingleHasher(ABC):
         Returns:
             64-bit unsigned integer hash value.
         """
+
+    @abstractmethod
+    def hash_batch(self, batch: ShingleBatch) -> ShingleBatch:
+        """Fill the hash columns of a ShingleBatch.
+
+        Args:
+            batch: ShingleBatch with offset columns populated.
+
+        Returns:
+            The same batch with shingle_hash64 (uint64) and
+            shingle_hash_sha256 ('S64') set.
+        """
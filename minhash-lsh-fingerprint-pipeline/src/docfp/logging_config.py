@@ -0,0 +1,286 @@
+"""
+File Name: logging_config.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Central structlog configuration for every docfp module — one
+             structlog.configure() for the process, events handed to a
+             background thread through a queue, and level-gated / sampled
+             debug events.  Modules log through
+             ``log = get_logger(__name__)``.
+
+Note: Importing this module reads the settings and nothing else: structlog
+      is imported and configured, and the queue handler and its listener
+      thread started, on the first event that passes the level gate, so
+      importing docfp stays cheap and silent.  Settings (read when the module is imported; override
+      them at any time with configure_logging()):
+          DOCFP_LOG_LEVEL          minimum level, default INFO.  Calls below
+                                   it return immediately, so per-block /
+                                   per-shingle debug events cost one no-op
+                                   method call.
+          DOCFP_LOG_FILE           append JSON lines to this file; empty
+                                   (default) writes to stderr.
+          DOCFP_LOG_DEBUG_SAMPLE   keep 1 in N of each debug event name
+                                   (default 1, i.e. all).
+      The caller thread only stamps the event; JSON rendering and I/O happen
+      on the listener thread.  The listener is stopped (queue drained) at
+      interpreter exit and at multiprocessing worker exit; a forked child
+      drops the inherited handler and starts its own on its first event.
+
+Requirements:
+- structlog>=24
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from collections import Counter
+from typing import Any
+
+LOGGER_NAMESPACE = "docfp"
+DEFAULT_LEVEL = "INFO"
+
+_lock = threading.Lock()
+_settings: dict[str, Any] = {}
+_handler: logging.Handler | None = None
+_listener: logging.handlers.QueueListener | None = None
+_debug_counts: Counter = Counter()
+_structlog_configured = False
+_LEVEL_METHODS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "exception": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+class _EnqueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class DocfpLogger:
+    """Module logger returned by get_logger().
+
+    Level methods (debug, info, warning, error, exception, critical) are
+    installed on the class by configure_logging(): below the level they are
+    a no-op, at or above it they forward to a structlog logger created on
+    first use, so a level change also reaches loggers created at import.
+
+    Args:
+        name: Logger name (module __name__).
+    """
+
+    __slots__ = ("name", "_logger")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._logger: Any = None
+
+    def _structlog(self) -> Any:
+        """Return the structlog logger, configuring structlog on first use."""
+        if self._logger is None:
+            self._logger = _structlog_logger(self.name)
+        return self._logger
+
+
+def _nop(self: DocfpLogger, event: str, *args: Any, **kw: Any) -> None:
+    return None
+
+
+def _forward(method_name: str) -> Any:
+    """Return a DocfpLogger method forwarding to the structlog logger."""
+
+    def method(self: DocfpLogger, event: str, *args: Any, **kw: Any) -> Any:
+        return getattr(self._structlog(), method_name)(event, *args, **kw)
+
+    method.__name__ = method_name
+    return method
+
+
+def _apply_level(level: int) -> None:
+    """Install the level methods for level on DocfpLogger."""
+    for name, number in _LEVEL_METHODS.items():
+        setattr(DocfpLogger, name, _forward(name) if number >= level else _nop)
+
+
+def _level_number(level: str | int) -> int:
+    """Return the numeric logging level for a name such as 'info' or an int."""
+    if isinstance(level, int):
+        return level
+    number = logging.getLevelName(str(level).upper())
+    if not isinstance(number, int):
+        raise ValueError(f"Unknown log level: {level!r}")
+    return number
+
+
+def _target_handler(log_file: str) -> logging.Handler:
+    """Return the handler the listener thread writes through."""
+    import structlog
+
+    handler: logging.Handler = (
+        logging.FileHandler(log_file, encoding="utf-8")
+        if log_file
+        else logging.StreamHandler(sys.stderr)
+    )
+    handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.JSONRenderer(),
+            ]
+        )
+    )
+    return handler
+
+
+def _start_listener() -> None:
+    """Attach the queue handler to the docfp logger and start its listener."""
+    global _handler, _listener
+    with _lock:
+        if _listener is not None:
+            return
+        events: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(
+            events, _target_handler(_settings["log_file"]), respect_handler_level=False
+        )
+        _handler = _EnqueueHandler(events)
+        logger = logging.getLogger(LOGGER_NAMESPACE)
+        logger.addHandler(_handler)
+        logger.setLevel(_settings["level"])
+        logger.propagate = False
+        _listener.start()
+
+    import multiprocessing.util
+
+    multiprocessing.util.Finalize(None, shutdown_logging, exitpriority=100)
+
+
+def shutdown_logging() -> None:
+    """Drain the queue and stop the listener thread (idempotent)."""
+    global _handler, _listener
+    with _lock:
+        listener, handler = _listener, _handler
+        _listener = _handler = None
+    if listener is not None:
+        listener.stop()
+        for target in listener.handlers:
+            target.close()
+    if handler is not None:
+        logging.getLogger(LOGGER_NAMESPACE).removeHandler(handler)
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's listener; the child starts its own on first use."""
+    global _handler, _listener
+    if _handler is not None:
+        logging.getLogger(LOGGER_NAMESPACE).removeHandler(_handler)
+    _handler = _listener = None
+    _debug_counts.clear()
+
+
+def _ensure_listener(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """structlog processor: start the queue listener on the first event."""
+    if _listener is None:
+        _start_listener()
+    return event_dict
+
+
+def _sample_debug(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """structlog processor: keep 1 in DOCFP_LOG_DEBUG_SAMPLE of each debug event."""
+    every = _settings["debug_sample"]
+    if method_name == "debug" and every > 1:
+        event = event_dict.get("event")
+        _debug_counts[event] += 1
+        if (_debug_counts[event] - 1) % every:
+            import structlog
+
+            raise structlog.DropEvent
+        event_dict["sampled_every"] = every
+    return event_dict
+
+
+def configure_logging(
+    level: str | int | None = None,
+    log_file: str | None = None,
+    debug_sample: int | None = None,
+) -> None:
+    """Configure docfp logging; arguments left as None keep the current value.
+
+    Args:
+        level: Minimum level name or number (default DOCFP_LOG_LEVEL or INFO).
+        log_file: JSON-lines output file; '' writes to stderr (default
+                  DOCFP_LOG_FILE).
+        debug_sample: Keep 1 in this many of each debug event (default
+                      DOCFP_LOG_DEBUG_SAMPLE or 1).
+
+    Returns:
+        None.  The level applies to existing loggers at once; a running
+        listener is restarted with the new file on the next event.
+    """
+    _settings.update(
+        level=_level_number(
+            level if level is not None else _settings.get("level", DEFAULT_LEVEL)
+        ),
+        log_file=log_file if log_file is not None else _settings.get("log_file", ""),
+        debug_sample=max(1, debug_sample or _settings.get("debug_sample", 1)),
+    )
+    shutdown_logging()
+    _apply_level(_settings["level"])
+    _debug_counts.clear()
+
+
+def _structlog_logger(name: str) -> Any:
+    """Configure structlog once and return a bound logger for name."""
+    global _structlog_configured
+    import structlog
+
+    with _lock:
+        if not _structlog_configured:
+            structlog.configure(
+                processors=[
+                    _ensure_listener,
+                    _sample_debug,
+                    structlog.stdlib.add_logger_name,
+                    structlog.stdlib.add_log_level,
+                    structlog.processors.TimeStamper(fmt="iso"),
+                    structlog.processors.format_exc_info,
+                    structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+                ],
+                wrapper_class=structlog.make_filtering_bound_logger(logging.NOTSET),
+                logger_factory=structlog.stdlib.LoggerFactory(),
+                cache_logger_on_first_use=True,
+            )
+            _structlog_configured = True
+    return structlog.get_logger(name).bind()
+
+
+def get_logger(name: str) -> DocfpLogger:
+    """Return the logger for a docfp module.
+
+    Args:
+        name: Module __name__ (under the 'docfp' logger namespace).
+
+    Returns:
+        DocfpLogger; structlog is not imported until it emits an event.
+    """
+    return DocfpLogger(name)
+
+
+configure_logging(
+    level=os.environ.get("DOCFP_LOG_LEVEL") or DEFAULT_LEVEL,
+    log_file=os.environ.get("DOCFP_LOG_FILE", ""),
+    debug_sample=int(os.environ.get("DOCFP_LOG_DEBUG_SAMPLE") or 1),
+)
+atexit.register(shutdown_logging)
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,95 @@
+"""
+File Name: batch_report.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: DocumentFingerprintResult and BatchFingerprintReport dataclasses —
+             per-document and corpus-level results of a batch fingerprinting run.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class DocumentFingerprintResult:
+    """Outcome of fingerprinting one document inside a batch worker.
+
+    Args:
+        source_uri: Absolute path of the source document.
+        file_name: Original file name with extension.
+        document_id: SHA-256 checksum of the source file ('' if not reached).
+        token_count: Number of normalized tokens.
+        total_shingle_count: Total shingles generated (including duplicates).
+        unique_shingle_hash_count: Distinct shingle hash count.
+        hash_signature_sha256: Document-level SHA-256 hash signature.
+        minhash: datasketch.MinHash signature (None when the document failed).
+        sig_path: Path of the written {doc}.hash_signature.json ('' when
+            JSON export is off).
+        minhash_path: Path of the written {doc}.minhash.json, or of the
+            MinHashSignatureStore data file holding the signature row.
+        stage_seconds: Wall-clock seconds spent per pipeline stage.
+        text_cache_hit: True when extraction / OCR was served from the text cache.
+        duplicate_of: Registered document_id whose signature artifacts were
+            reused ('' when fingerprinted in full).
+        duplicate_kind: 'document_id' (byte duplicate), 'hash_signature_sha256'
+            (normalized-content duplicate) or ''.
+        error: Error message when the document failed, otherwise None.
+
+    Returns:
+        DocumentFingerprintResult instance.
+    """
+
+    source_uri: str
+    file_name: str
+    document_id: str = ""
+    token_count: int = 0
+    total_shingle_count: int = 0
+    unique_shingle_hash_count: int = 0
+    hash_signature_sha256: str = ""
+    minhash: Any = None
+    sig_path: str = ""
+    minhash_path: str = ""
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    text_cache_hit: bool = False
+    duplicate_of: str = ""
+    duplicate_kind: str = ""
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchFingerprintReport:
+    """Corpus-level summary of a batch fingerprinting run.
+
+    Args:
+        results: Per-document results in input order.
+        document_count: Number of documents submitted.
+        succeeded_count: Number of documents fingerprinted successfully.
+        failed_count: Number of documents that raised an error.
+        max_workers: Worker process count used for the run.
+        wall_seconds: Total wall-clock duration of the batch.
+        docs_per_second: Successful documents per wall-clock second.
+        stage_seconds_total: Summed seconds per stage across all workers.
+        stage_seconds_mean: Mean seconds per stage per successful document.
+        text_cache_hit_count: Documents whose extraction / OCR was a cache hit.
+        duplicate_count: Documents short-circuited as exact duplicates.
+
+    Returns:
+        BatchFingerprintReport instance.
+    """
+
+    results: list[DocumentFingerprintResult]
+    document_count: int
+    succeeded_count: int
+    failed_count: int
+    max_workers: int
+    wall_seconds: float
+    docs_per_second: float
+    stage_seconds_total: dict[str, float] = field(default_factory=dict)
+    stage_seconds_mean: dict[str, float] = field(default_factory=dict)
+    text_cache_hit_count: int = 0
+    duplicate_count: int = 0
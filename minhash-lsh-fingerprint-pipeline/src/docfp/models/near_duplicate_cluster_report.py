@@ -0,0 +1,46 @@
+"""
+File Name: near_duplicate_cluster_report.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: NearDuplicateClusterReport dataclass — corpus-level summary of a
+             NearDuplicateClusterProcessor run.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class NearDuplicateClusterReport:
+    """Outcome of clustering every stored signature into near-duplicate groups.
+
+    Args:
+        document_count: Signatures read from the MinHashSignatureStore.
+        cluster_count: Connected components with at least two documents.
+        clustered_document_count: Documents that belong to such a component.
+        largest_cluster_size: Size of the biggest component.
+        candidate_pair_count: Band-collision pairs compared, summed over bands.
+        verified_pair_count: Compared pairs at or above min_similarity.
+        oversized_bucket_count: Band buckets (summed over bands) larger than
+            max_bucket_size, whose members were only compared with the
+            bucket's first members.
+        parquet_path: Path of the written cluster assignment Parquet file.
+        wall_seconds: Total wall-clock duration of the run.
+
+    Returns:
+        NearDuplicateClusterReport instance.
+    """
+
+    document_count: int
+    cluster_count: int
+    clustered_document_count: int
+    largest_cluster_size: int
+    candidate_pair_count: int
+    verified_pair_count: int
+    oversized_bucket_count: int
+    parquet_path: str
+    wall_seconds: float
@@ -0,0 +1,33 @@
+"""
+File Name: near_duplicate_match.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: NearDuplicateMatch dataclass — one verified neighbour returned by
+             NearDuplicateQueryService, with its estimated Jaccard similarity.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class NearDuplicateMatch:
+    """A corpus document whose signature is close to a query signature.
+
+    Args:
+        document_id: SHA-256 identifier of the matching corpus document.
+        similarity: Estimated Jaccard similarity (fraction of equal MinHash
+                    values) between the query and this document.
+        row: Row of the document in the MinHashSignatureStore.
+
+    Returns:
+        NearDuplicateMatch instance.
+    """
+
+    document_id: str
+    similarity: float
+    row: int
@@ -11,7 +11,7 @@ Requirements:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -24,6 +24,8 @@ class NormalizedText:
         text: Normalized text — lowercase, unicode-NFC, cleaned whitespace.
         normalization_version: Identifier of the rule set applied (e.g. 'v1').
         token_count: Number of whitespace-split tokens after normalization.
+        page_runs: Page/section of the tokens, run-length encoded as
+                   [{'page', 'section', 'tokens'}, ...] (empty if not page-aware).
 
     Returns:
         NormalizedText instance.
@@ -34,3 +36,4 @@ class NormalizedText:
     text: str
     normalization_version: str = "v1"
     token_count: int = 0
+    page_runs: list[dict[str, int]] = field(default_factory=list)
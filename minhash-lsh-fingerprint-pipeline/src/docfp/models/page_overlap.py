@@ -0,0 +1,34 @@
+"""
+File Name: page_overlap.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: PageOverlap dataclass — one pair of pages from two documents that
+             share shingles, as returned by PageOverlapProcessor.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class PageOverlap:
+    """Shingle overlap between a page of document A and a page of document B.
+
+    Args:
+        page_a: Page number in document A (0 if not page-aware).
+        page_b: Page number in document B (0 if not page-aware).
+        shared_shingles: Distinct shingle hashes present on both pages.
+        jaccard: shared_shingles / distinct shingle hashes of the two pages.
+
+    Returns:
+        PageOverlap instance.
+    """
+
+    page_a: int
+    page_b: int
+    shared_shingles: int
+    jaccard: float
@@ -0,0 +1,44 @@
+"""
+File Name: partitioned_fingerprint.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: PartitionedFingerprint dataclass — document signatures produced by
+             hashing token partitions in parallel and merging the partial
+             results.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class PartitionedFingerprint:
+    """Signatures of one document computed by PartitionedFingerprintProcessor.
+
+    Args:
+        document_id: SHA-256 identifier for the source document.
+        shingles: The document's ShingleBatch with hash columns filled.
+        partition_count: Number of token partitions hashed.
+        partition_merge_status: 'single-partition' or 'merged-partition'.
+        total_shingle_count: Total shingles generated (including duplicates).
+        unique_shingle_hash_count: Distinct shingle SHA-256 hash count.
+        hash_signature_sha256: Document-level SHA-256 hash signature.
+        minhash: datasketch.MinHash merged from the partition MinHashes.
+
+    Returns:
+        PartitionedFingerprint instance.
+    """
+
+    document_id: str
+    shingles: Any
+    partition_count: int
+    partition_merge_status: str
+    total_shingle_count: int
+    unique_shingle_hash_count: int
+    hash_signature_sha256: str
+    minhash: Any
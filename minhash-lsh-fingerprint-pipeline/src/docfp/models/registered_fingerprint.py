@@ -0,0 +1,50 @@
+"""
+File Name: registered_fingerprint.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: RegisteredFingerprint dataclass — one row of the FingerprintRegistry:
+             a fingerprinted document and where its signature artifacts live.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class RegisteredFingerprint:
+    """A document whose signatures are already on disk.
+
+    Args:
+        document_id: SHA-256 checksum of the source file.
+        config_key: Signature parameters the artifacts were built with.
+        hash_signature_sha256: Document-level SHA-256 hash signature.
+        source_uri: Path of the document when it was registered.
+        file_name: Original file name with extension.
+        sig_path: Path of the {doc}.hash_signature.json artifact ('' when
+            JSON export is off).
+        minhash_path: Path of the {doc}.minhash.json artifact, or of the
+            MinHashSignatureStore data file holding the signature row.
+        total_shingle_count: Total shingles generated (including duplicates).
+        unique_shingle_hash_count: Distinct shingle hash count.
+        duplicate_of: document_id whose artifacts are reused ('' = own artifacts).
+        registered_at_utc: ISO-8601 UTC registration timestamp.
+
+    Returns:
+        RegisteredFingerprint instance.
+    """
+
+    document_id: str
+    config_key: str
+    hash_signature_sha256: str
+    source_uri: str
+    file_name: str
+    sig_path: str
+    minhash_path: str
+    total_shingle_count: int = 0
+    unique_shingle_hash_count: int = 0
+    duplicate_of: str = ""
+    registered_at_utc: str = ""
@@ -0,0 +1,85 @@
+"""
+File Name: shingle_batch.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: ShingleBatch dataclass — columnar form of a document's shingles.
+             Document-level constants are stored once; per-shingle positions
+             and hashes are NumPy columns.  Column names mirror ShingleRecord
+             and the BRD §11 Parquet schema.
+
+Note: Shingle text is not stored per row.  Shingle i is the slice
+      text[char_start[i]:char_end[i]] of the space-joined token string, so a
+      document's shingles cost one string plus a few integer arrays instead
+      of one Python object per shingle.
+
+Requirements:
+- numpy
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+@dataclass
+class ShingleBatch:
+    """All shingles of one document (or partition) in columnar form.
+
+    Args:
+        document_id: SHA-256 checksum of the source file.
+        source_uri: Absolute path or URI of the source document.
+        file_name: Original file name with extension.
+        normalization_version: Normalization rule set applied.
+        created_at_utc: ISO-8601 UTC timestamp of shingle generation.
+        shingle_size: Number of tokens per shingle.
+        text: Space-joined token string that the char offsets index into.
+        token_start: int64 index of each shingle's first token.
+        char_start: int64 char offset of each shingle's first token in text.
+        char_end: int64 char offset after each shingle's last token in text.
+        partition_id: Zero-based partition index (0 for single-partition docs).
+        partition_count: Total partitions the document was split into.
+        page_no: Optional int32 source page per shingle (None → all 0).
+        section_id: Optional int32 section per shingle (None → all 0).
+        shingle_hash64: uint64 xxhash64 per shingle (None until hashed).
+        shingle_hash_sha256: 'S64' ASCII hex SHA-256 per shingle (None until hashed).
+
+    Returns:
+        ShingleBatch instance.
+    """
+
+    document_id: str
+    source_uri: str
+    file_name: str
+    normalization_version: str
+    created_at_utc: str
+    shingle_size: int
+    text: str
+    token_start: np.ndarray
+    char_start: np.ndarray
+    char_end: np.ndarray
+    partition_id: int = 0
+    partition_count: int = 1
+    page_no: Optional[np.ndarray] = None
+    section_id: Optional[np.ndarray] = None
+    shingle_hash64: Optional[np.ndarray] = None
+    shingle_hash_sha256: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return int(self.token_start.shape[0])
+
+    def iter_texts(self) -> Iterator[str]:
+        """Yield each shingle's text in order without retaining it.
+
+        Args:
+            None.
+
+        Returns:
+            Iterator of shingle text strings.
+        """
+        text = self.text
+        for start, end in zip(self.char_start.tolist(), self.char_end.tolist()):
+            yield text[start:end]
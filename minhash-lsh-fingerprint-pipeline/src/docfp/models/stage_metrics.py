@@ -0,0 +1,52 @@
+"""
+File Name: stage_metrics.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: StageMetrics dataclass — wall time, CPU time, memory and I/O
+             recorded by a StageTimer around one asset or processor call.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class StageMetrics:
+    """Resource usage of one timed stage.
+
+    Args:
+        stage: Stage name (asset or processor method).
+        wall_seconds: Elapsed wall-clock seconds.
+        cpu_seconds: User + system CPU seconds of the process and of child
+            processes reaped during the stage (process-pool workers).
+        peak_rss_bytes: Process peak resident set size at the end of the stage.
+        peak_rss_delta_bytes: Growth of the peak RSS during the stage; 0 when
+            the stage stayed below an earlier peak.
+        bytes_read: Bytes read from input files, as reported by the stage.
+        bytes_written: Bytes written to output files, as reported by the stage.
+        items: Units of work processed (see unit).
+        unit: What items counts, e.g. 'tokens', 'shingles', 'documents'.
+        items_per_second: items / wall_seconds (0.0 when nothing was counted).
+
+    Returns:
+        StageMetrics instance.
+    """
+
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_bytes: int
+    peak_rss_delta_bytes: int
+    bytes_read: int = 0
+    bytes_written: int = 0
+    items: int = 0
+    unit: str = ""
+    items_per_second: float = 0.0
+
+    def as_dict(self) -> dict:
+        """Return the metrics as a plain dict (structured log fields)."""
+        return asdict(self)
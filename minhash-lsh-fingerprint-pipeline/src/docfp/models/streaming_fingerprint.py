@@ -0,0 +1,45 @@
+"""
+File Name: streaming_fingerprint.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: StreamingFingerprint dataclass — document signatures produced by
+             the streaming shingle path without materializing the document.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class StreamingFingerprint:
+    """Signatures of one document computed by StreamingFingerprintProcessor.
+
+    Args:
+        document_id: SHA-256 identifier for the source document.
+        source_uri: Absolute path or URI of the source document.
+        token_count: Number of normalized tokens streamed.
+        total_shingle_count: Total shingles generated (including duplicates).
+        unique_shingle_hash_count: Distinct shingle SHA-256 hash count.
+        hash_signature_sha256: Document-level SHA-256 hash signature.
+        minhash: datasketch.MinHash signature.
+        block_count: Token blocks shingled and hashed.
+        spill_run_count: Sorted digest runs spilled to disk (0 = in memory).
+
+    Returns:
+        StreamingFingerprint instance.
+    """
+
+    document_id: str
+    source_uri: str
+    token_count: int
+    total_shingle_count: int
+    unique_shingle_hash_count: int
+    hash_signature_sha256: str
+    minhash: Any
+    block_count: int = 0
+    spill_run_count: int = 0
@@ -0,0 +1,786 @@
+"""
+File Name: batch_fingerprint_processor.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: BatchFingerprintProcessor — fingerprints a whole corpus in one
+             process pool.  Each worker runs the metadata → extraction →
+             normalization → shingling → hashing → MinHash chain for one
+             document and reports per-stage timings; the parent aggregates
+             throughput (docs/sec) and appends every signature to the
+             persistent corpus LSH index in one pass.
+
+Note: Worker processes construct the extractor, normalizer and hasher once
+      (pool initializer) and reuse them for every document they receive, so
+      the per-document cost is the pipeline work itself rather than run
+      launch or resource construction.  Plain-text files of at least
+      streaming_min_bytes are fingerprinted with StreamingFingerprintProcessor
+      so multi-GB text dumps run in bounded memory.  Before a multi-process
+      run the parent warms the extractor backend (for Tika, one shared
+      server) and hands workers its endpoint, so workers open pooled
+      connections to a running server instead of racing to launch JVMs.
+      With text_cache_dir set, extracted, OCR'd and normalized text is
+      looked up in ContentAddressedTextCache by document_id first, so byte
+      duplicates and re-runs skip those stages.  With skip_known_duplicates,
+      documents whose document_id or hash_signature_sha256 is already in the
+      FingerprintRegistry stop there: their results point at the stored
+      signature artifacts and they are not re-added to the LSH index.
+      Duplicates within one batch are caught too: the parent checksums
+      every file and dispatches each document_id once, then collapses
+      results sharing a hash_signature_sha256 onto the first of them before
+      the signature store and LSH appends.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
+
+from docfp.extractors.factory import build_extractor, share_extractor_options
+from docfp.extractors.tesseract_ocr_processor import TesseractOcrProcessor
+from docfp.interfaces.document_text_extractor import DocumentTextExtractor
+from docfp.interfaces.normalizer import Normalizer
+from docfp.logging_config import get_logger
+from docfp.models.batch_report import BatchFingerprintReport, DocumentFingerprintResult
+from docfp.models.document_metadata import DocumentMetadata
+from docfp.models.extracted_text import ExtractedDocumentText
+from docfp.models.registered_fingerprint import RegisteredFingerprint
+from docfp.processors.checksum_processor import DocumentChecksumProcessor
+from docfp.processors.fingerprint_registry import FingerprintRegistry, signature_config_key
+from docfp.processors.hash_signature_processor import DocumentHashSignatureProcessor
+from docfp.processors.incremental_lsh_index import IncrementalLshIndex
+from docfp.processors.metadata_extractor import DocumentMetadataExtractor
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+from docfp.processors.minhash_signature_store import SIGNATURE_DATA_FILE, MinHashSignatureStore
+from docfp.processors.normalizer_factory import DEFAULT_NORMALIZATION_VERSION, build_normalizer
+from docfp.processors.ocr_decision_processor import OcrDecisionProcessor
+from docfp.processors.page_segment_processor import PageSegmentProcessor
+from docfp.processors.sharded_lsh_index import ShardedLshIndex
+from docfp.processors.shingle_hash_processor import (
+    DEFAULT_HASH64_ALGORITHM,
+    ShingleHashProcessor,
+)
+from docfp.processors.streaming_fingerprint_processor import StreamingFingerprintProcessor
+from docfp.processors.text_cache import DEFAULT_MAX_BYTES, ContentAddressedTextCache
+from docfp.processors.tokenizer import TokenizerProcessor
+from docfp.processors.word_shingle_generator import WordShingleGenerator
+from docfp.writers.document_signature_writer import DocumentSignatureWriter
+from docfp.writers.metadata_json_writer import MetadataJsonWriter
+from docfp.writers.shingle_parquet_writer import ShingleParquetWriter
+from docfp.writers.text_writer import NormalizedTextWriter, RawTextWriter
+
+if TYPE_CHECKING:
+    from datasketch import MinHash
+
+log = get_logger(__name__)
+
+STAGES = (
+    "metadata",
+    "extract",
+    "ocr_decision",
+    "normalize",
+    "shingle",
+    "hash",
+    "parquet",
+    "hash_signature",
+    "minhash",
+    "stream",
+    "signatures",
+)
+
+# Per-process state populated by _init_worker (one instance per worker).
+_WORKER_EXTRACTOR: DocumentTextExtractor | None = None
+_WORKER_NORMALIZER: Normalizer | None = None
+_WORKER_TEXT_CACHE: ContentAddressedTextCache | None = None
+_WORKER_REGISTRY: FingerprintRegistry | None = None
+
+
+def _init_worker(
+    extractor_engine: str,
+    extractor_options: dict,
+    normalization_version: str,
+    remove_stopwords: bool,
+    text_cache_dir: str | None,
+    text_cache_max_bytes: int,
+    registry_dir: str | None,
+) -> None:
+    """Build the extractor, normalizer, text cache and registry once per worker.
+
+    Args:
+        extractor_engine: Extractor engine name passed to build_extractor.
+        extractor_options: Engine options passed to build_extractor.
+        normalization_version: Normalizer rule set version (see build_normalizer).
+        remove_stopwords: Whether the normalizer removes stopwords.
+        text_cache_dir: ContentAddressedTextCache root; None disables caching.
+        text_cache_max_bytes: Cache size cap before LRU eviction.
+        registry_dir: FingerprintRegistry directory; None disables the
+            duplicate short-circuit.
+
+    Returns:
+        None.
+    """
+    global _WORKER_EXTRACTOR, _WORKER_NORMALIZER  # noqa: PLW0603
+    global _WORKER_TEXT_CACHE, _WORKER_REGISTRY  # noqa: PLW0603
+    _WORKER_EXTRACTOR = build_extractor(extractor_engine, **extractor_options)
+    _WORKER_NORMALIZER = build_normalizer(normalization_version, remove_stopwords)
+    _WORKER_TEXT_CACHE = (
+        ContentAddressedTextCache(text_cache_dir, max_bytes=text_cache_max_bytes)
+        if text_cache_dir
+        else None
+    )
+    _WORKER_REGISTRY = FingerprintRegistry(registry_dir) if registry_dir else None
+
+
+def _mark_duplicate(
+    result: DocumentFingerprintResult,
+    original: RegisteredFingerprint | DocumentFingerprintResult,
+    kind: str,
+) -> None:
+    """Point a result at a registered (or earlier in-batch) document's artifacts."""
+    result.duplicate_of = original.duplicate_of or original.document_id
+    result.duplicate_kind = kind
+    result.hash_signature_sha256 = original.hash_signature_sha256
+    result.total_shingle_count = original.total_shingle_count
+    result.unique_shingle_hash_count = original.unique_shingle_hash_count
+    result.sig_path = original.sig_path
+    result.minhash_path = original.minhash_path
+
+
+def _is_content_duplicate(result: DocumentFingerprintResult, settings: dict) -> bool:
+    """Return True (and mark the result) when its hash signature is registered."""
+    if _WORKER_REGISTRY is None:
+        return False
+    original = _WORKER_REGISTRY.find_by_hash_signature(
+        result.hash_signature_sha256, settings["config_key"]
+    )
+    if original is None:
+        return False
+    _mark_duplicate(result, original, "hash_signature_sha256")
+    return True
+
+
+def _cached_extract(
+    extraction_key: str,
+    source_uri: str,
+    document_id: str,
+    extract: Callable[[], ExtractedDocumentText],
+) -> tuple[ExtractedDocumentText, bool]:
+    """Return cached text for (document_id, extraction_key) or run extract().
+
+    Args:
+        extraction_key: Text source identity used in the cache key.
+        source_uri: Absolute path of the document.
+        document_id: SHA-256 checksum of the document.
+        extract: Callable producing the text on a cache miss.
+
+    Returns:
+        Tuple of (ExtractedDocumentText, True when served from the cache).
+    """
+    cache = _WORKER_TEXT_CACHE
+    cached: Optional[ExtractedDocumentText] = (
+        cache.get_extracted(document_id, extraction_key, source_uri) if cache else None
+    )
+    if cached is not None:
+        return cached, True
+    extracted = extract()
+    extracted.document_id = document_id
+    if cache:
+        cache.put_extracted(extracted, extraction_key)
+    return extracted, False
+
+
+def _should_stream(meta: DocumentMetadata, settings: dict) -> bool:
+    """Return True when a document goes through the streaming text path."""
+    threshold = settings["streaming_min_bytes"]
+    return (
+        threshold > 0
+        and meta.file_size_bytes >= threshold
+        and meta.mime_type.startswith("text/plain")
+    )
+
+
+def _fingerprint_streaming(
+    source_uri: str,
+    meta: DocumentMetadata,
+    settings: dict,
+    result: DocumentFingerprintResult,
+    lap: Callable[[str], None],
+) -> Optional[MinHash]:
+    """Fingerprint a large plain-text file by streaming it in chunks.
+
+    Args:
+        source_uri: Absolute path of the text file.
+        meta: Checksum-stamped metadata for the document.
+        settings: Plain-dict batch settings.
+        result: Result record updated in place.
+        lap: Stage timer callback.
+
+    Returns:
+        datasketch.MinHash signature of the document, or None when its
+        normalized content is already registered.
+    """
+    fingerprint = StreamingFingerprintProcessor(
+        shingle_size=settings["shingle_size"],
+        num_perm=settings["num_perm"],
+        normalizer=_WORKER_NORMALIZER,
+    ).fingerprint_file(source_uri, meta.document_id)
+    result.token_count = fingerprint.token_count
+    result.total_shingle_count = fingerprint.total_shingle_count
+    result.unique_shingle_hash_count = fingerprint.unique_shingle_hash_count
+    result.hash_signature_sha256 = fingerprint.hash_signature_sha256
+    lap("signatures")
+    if _is_content_duplicate(result, settings):
+        return None
+    return fingerprint.minhash
+
+
+def _fingerprint_in_memory(
+    source_uri: str,
+    meta: DocumentMetadata,
+    settings: dict,
+    result: DocumentFingerprintResult,
+    lap: Callable[[str], None],
+) -> Optional[MinHash]:
+    """Run extraction → normalization → shingling → hashing → MinHash.
+
+    Args:
+        source_uri: Absolute path of the document.
+        meta: Checksum-stamped metadata for the document.
+        settings: Plain-dict batch settings.
+        result: Result record updated in place.
+        lap: Stage timer callback.
+
+    Returns:
+        datasketch.MinHash signature of the document, or None when its
+        normalized content is already registered (MinHash is skipped).
+    """
+    output_root = Path(settings["output_root"])
+    extraction_key = settings["extractor_engine"]
+    extracted, result.text_cache_hit = _cached_extract(
+        extraction_key,
+        source_uri,
+        meta.document_id,
+        lambda: _WORKER_EXTRACTOR.extract(source_uri),
+    )
+    RawTextWriter().write(extracted, output_root / "text")
+    lap("ocr_decision")
+
+    needs_ocr = OcrDecisionProcessor(
+        min_text_length=settings["ocr_min_text_length"],
+        ocr_enabled=settings["ocr_enabled"],
+    ).should_run_ocr(extracted.text, source_uri)
+    if needs_ocr:
+        # Documents are already spread over the batch pool, so OCR pages of
+        # one document run inline in this worker.
+        ocr = TesseractOcrProcessor(
+            dpi=settings["ocr_dpi"],
+            language=settings["ocr_language"],
+            page_timeout_seconds=settings["ocr_page_timeout_seconds"],
+            max_workers=1,
+        )
+        extraction_key = ocr.extraction_key
+        extracted, result.text_cache_hit = _cached_extract(
+            extraction_key,
+            source_uri,
+            meta.document_id,
+            lambda: ocr.run_ocr(source_uri, meta.document_id),
+        )
+        RawTextWriter().write(extracted, output_root / "text")
+    lap("normalize")
+
+    normalization_key = _WORKER_NORMALIZER.normalization_key
+    normalized = (
+        _WORKER_TEXT_CACHE.get_normalized(
+            meta.document_id, extraction_key, normalization_key, source_uri
+        )
+        if _WORKER_TEXT_CACHE
+        else None
+    )
+    tokens: list[str] | None = None
+    if normalized is None:
+        normalized, tokens = _WORKER_NORMALIZER.normalize_tokens(
+            document_id=meta.document_id, source_uri=source_uri, text=extracted.text
+        )
+        normalized.page_runs = PageSegmentProcessor().token_runs(
+            extracted.pages, _WORKER_NORMALIZER, normalized.token_count, meta.document_id
+        )
+        if _WORKER_TEXT_CACHE:
+            _WORKER_TEXT_CACHE.put_normalized(normalized, extraction_key, normalization_key)
+    NormalizedTextWriter().write(normalized, output_root / "normalized")
+    result.token_count = normalized.token_count
+    lap("shingle")
+
+    if tokens is None:  # text cache hit
+        tokens = TokenizerProcessor().tokenize(normalized.text, meta.document_id)
+    token_page_no, token_section_id = PageSegmentProcessor().token_positions(
+        normalized.page_runs, len(tokens)
+    )
+    batch = WordShingleGenerator(shingle_size=settings["shingle_size"]).generate_batch(
+        document_id=meta.document_id,
+        source_uri=source_uri,
+        file_name=meta.file_name,
+        tokens=tokens,
+        token_page_no=token_page_no,
+        token_section_id=token_section_id,
+        normalization_version=normalized.normalization_version,
+    )
+    lap("hash")
+
+    batch = ShingleHashProcessor().hash_batch(batch)
+    lap("parquet")
+
+    # DLP-safe mode would delete the Parquet right after signing, so the
+    # batch path skips writing it at all.
+    if not settings["dlp_safe_mode"] and len(batch):
+        ShingleParquetWriter().write(batch, output_root / "shingles")
+    lap("hash_signature")
+
+    signature, unique_count = DocumentHashSignatureProcessor().compute(
+        batch.shingle_hash_sha256, meta.document_id
+    )
+    result.hash_signature_sha256 = signature
+    result.unique_shingle_hash_count = unique_count
+    result.total_shingle_count = len(batch)
+    if _is_content_duplicate(result, settings):
+        return None
+    lap("minhash")
+
+    mh = MinHashSignatureBuilder(num_perm=settings["num_perm"]).build_batch(
+        batch.shingle_hash64, meta.document_id
+    )
+    lap("signatures")
+    return mh
+
+
+def _fingerprint_document(
+    source_uri: str, settings: dict, document_id: str = ""
+) -> DocumentFingerprintResult:
+    """Run the full per-document fingerprinting chain inside a worker.
+
+    Args:
+        source_uri: Absolute path of the document to fingerprint.
+        settings: Plain-dict batch settings (see BatchFingerprintProcessor).
+        document_id: SHA-256 checksum already computed by the parent; ''
+            makes the worker compute it.
+
+    Returns:
+        DocumentFingerprintResult; failures are captured in ``error`` rather
+        than raised so one bad file does not abort the batch.
+    """
+    result = DocumentFingerprintResult(source_uri=source_uri, file_name=Path(source_uri).name)
+    output_root = Path(settings["output_root"])
+    stage = STAGES[0]
+    clock = time.perf_counter()
+
+    def _lap(name: str) -> None:
+        nonlocal clock, stage
+        now = time.perf_counter()
+        result.stage_seconds[stage] = now - clock
+        clock, stage = now, name
+
+    try:
+        meta = DocumentMetadataExtractor().extract(
+            source_uri, pipeline_run_id=settings["pipeline_run_id"]
+        )
+        if document_id:
+            meta.document_id = document_id
+        else:
+            meta = DocumentChecksumProcessor().compute_and_stamp(source_uri, meta)
+        MetadataJsonWriter().write(meta, output_root / "metadata")
+        result.document_id = meta.document_id
+
+        if _WORKER_REGISTRY is not None:
+            original = _WORKER_REGISTRY.find_by_document_id(
+                meta.document_id, settings["config_key"]
+            )
+            if original is not None:
+                _mark_duplicate(result, original, "document_id")
+                _lap("done")
+                return result
+
+        if _should_stream(meta, settings):
+            _lap("stream")
+            mh = _fingerprint_streaming(source_uri, meta, settings, result, _lap)
+        else:
+            _lap("extract")
+            mh = _fingerprint_in_memory(source_uri, meta, settings, result, _lap)
+        if mh is None:  # normalized-content duplicate; artifacts reused
+            _lap("done")
+            return result
+
+        # The parent appends every signature to the MinHashSignatureStore.
+        result.minhash = mh
+        result.minhash_path = str(output_root / "indexes" / SIGNATURE_DATA_FILE)
+        if settings["export_signature_json"]:
+            sig_path, minhash_path = DocumentSignatureWriter().write(
+                document_id=meta.document_id,
+                source_uri=source_uri,
+                file_name=meta.file_name,
+                signature_version="v1",
+                shingle_size=settings["shingle_size"],
+                total_shingle_count=result.total_shingle_count,
+                unique_shingle_hash_count=result.unique_shingle_hash_count,
+                hash_signature_sha256=result.hash_signature_sha256,
+                minhash=mh,
+                lsh_bucket_keys=[],
+                partition_merge_status="single-partition",
+                output_dir=output_root / "signatures",
+            )
+            result.sig_path = str(sig_path)
+            result.minhash_path = str(minhash_path)
+        _lap("done")
+    except Exception as exc:  # noqa: BLE001 — recorded per document
+        _lap("failed")
+        result.error = f"{type(exc).__name__}: {exc}"
+        log.error("batch_document_failed", source_uri=source_uri, error=result.error)
+    return result
+
+
+class BatchFingerprintProcessor:
+    """Fingerprint many documents in one process pool.
+
+    Args:
+        output_root: Root output directory (sub-folders created automatically).
+        shingle_size: Word-shingle window size. Default 5.
+        num_perm: MinHash permutation count. Default 128.
+        lsh_threshold: Jaccard similarity threshold for the corpus LSH index.
+        lsh_shard_count: Append to a ShardedLshIndex with this many shards
+            (one pool task per shard); 0 keeps the single IncrementalLshIndex.
+        dlp_safe_mode: When True no shingle Parquet is written.
+        ocr_enabled: Force OCR regardless of extracted text length.
+        ocr_min_text_length: Trigger OCR when extracted text is shorter than this.
+        ocr_dpi: Page rasterization resolution for OCR. Default 300.
+        ocr_language: Tesseract language code(s). Default 'eng'.
+        ocr_page_timeout_seconds: Per-page OCR timeout. Default 120.
+        extractor_engine: Extractor engine name (see build_extractor).
+        extractor_options: Engine options, e.g. the Tika pool's server_url,
+            server_jar and max_in_flight.
+        normalization_version: Normalizer rule set version, 'v2' (default)
+            or 'v1' (see build_normalizer).
+        remove_stopwords: Whether the normalizer removes stopwords.
+        max_workers: Worker process count; 0 uses os.cpu_count(), 1 runs inline.
+        streaming_min_bytes: Plain-text files at least this large are
+            fingerprinted by streaming them in chunks (no raw/normalized
+            text or Parquet artifacts); 0 disables streaming.
+        text_cache_dir: ContentAddressedTextCache root shared by all workers;
+            None disables the cache.
+        text_cache_max_bytes: Text cache size cap before LRU eviction.
+        skip_known_duplicates: Consult and update the FingerprintRegistry so
+            exact byte / normalized-content duplicates end early.
+        export_signature_json: Also write the per-document signature JSON
+            files; the MinHashSignatureStore is always written.
+        pipeline_run_id: Optional run ID stamped onto every metadata record.
+
+    Returns:
+        BatchFingerprintReport from run().
+    """
+
+    def __init__(
+        self,
+        output_root: str | Path,
+        shingle_size: int = 5,
+        num_perm: int = 128,
+        lsh_threshold: float = 0.5,
+        lsh_shard_count: int = 0,
+        dlp_safe_mode: bool = True,
+        ocr_enabled: bool = False,
+        ocr_min_text_length: int = 50,
+        ocr_dpi: int = 300,
+        ocr_language: str = "eng",
+        ocr_page_timeout_seconds: float = 120.0,
+        extractor_engine: str = "tika",
+        extractor_options: dict | None = None,
+        normalization_version: str = DEFAULT_NORMALIZATION_VERSION,
+        remove_stopwords: bool = False,
+        max_workers: int = 0,
+        streaming_min_bytes: int = 0,
+        text_cache_dir: str | Path | None = None,
+        text_cache_max_bytes: int = DEFAULT_MAX_BYTES,
+        skip_known_duplicates: bool = True,
+        export_signature_json: bool = False,
+        pipeline_run_id: str | None = None,
+    ) -> None:
+        self.output_root = Path(output_root)
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.lsh_threshold = lsh_threshold
+        self.lsh_shard_count = lsh_shard_count
+        self.dlp_safe_mode = dlp_safe_mode
+        self.ocr_enabled = ocr_enabled
+        self.ocr_min_text_length = ocr_min_text_length
+        self.ocr_dpi = ocr_dpi
+        self.ocr_language = ocr_language
+        self.ocr_page_timeout_seconds = ocr_page_timeout_seconds
+        self.extractor_engine = extractor_engine
+        self.extractor_options = dict(extractor_options or {})
+        self.normalization_version = normalization_version
+        self.remove_stopwords = remove_stopwords
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.streaming_min_bytes = streaming_min_bytes
+        self.text_cache_dir = str(text_cache_dir) if text_cache_dir else None
+        self.text_cache_max_bytes = text_cache_max_bytes
+        self.skip_known_duplicates = skip_known_duplicates
+        self.export_signature_json = export_signature_json
+        self.pipeline_run_id = pipeline_run_id
+
+    @staticmethod
+    def discover(
+        input_dir: str | Path | None = None,
+        manifest_path: str | Path | None = None,
+        file_glob: str = "*",
+    ) -> list[str]:
+        """Resolve the list of documents to fingerprint.
+
+        Args:
+            input_dir: Directory scanned recursively with file_glob.
+            manifest_path: Text file with one document path per line; blank
+                lines and '#' comments are ignored, relative paths resolve
+                against the manifest's directory.
+            file_glob: Glob pattern applied under input_dir. Default '*'.
+
+        Returns:
+            Sorted, de-duplicated list of absolute document paths.
+        """
+        uris: set[str] = set()
+        if input_dir:
+            for path in Path(input_dir).rglob(file_glob):
+                if path.is_file() and not path.name.startswith("."):
+                    uris.add(str(path.resolve()))
+        if manifest_path:
+            manifest = Path(manifest_path)
+            for line in manifest.read_text(encoding="utf-8").splitlines():
+                entry = line.strip()
+                if not entry or entry.startswith("#"):
+                    continue
+                path = Path(entry)
+                if not path.is_absolute():
+                    path = manifest.parent / path
+                uris.add(str(path.resolve()))
+        return sorted(uris)
+
+    def _settings(self) -> dict:
+        return {
+            "output_root": str(self.output_root),
+            "extractor_engine": self.extractor_engine,
+            "config_key": self.config_key,
+            "shingle_size": self.shingle_size,
+            "num_perm": self.num_perm,
+            "dlp_safe_mode": self.dlp_safe_mode,
+            "ocr_enabled": self.ocr_enabled,
+            "ocr_min_text_length": self.ocr_min_text_length,
+            "ocr_dpi": self.ocr_dpi,
+            "ocr_language": self.ocr_language,
+            "ocr_page_timeout_seconds": self.ocr_page_timeout_seconds,
+            "streaming_min_bytes": self.streaming_min_bytes,
+            "export_signature_json": self.export_signature_json,
+            "pipeline_run_id": self.pipeline_run_id,
+        }
+
+    @property
+    def config_key(self) -> str:
+        """FingerprintRegistry key for this batch's signature parameters."""
+        return signature_config_key(
+            shingle_size=self.shingle_size,
+            num_perm=self.num_perm,
+            normalization_key=build_normalizer(
+                self.normalization_version, self.remove_stopwords
+            ).normalization_key,
+            hash64_algorithm=DEFAULT_HASH64_ALGORITHM,
+        )
+
+    @staticmethod
+    def _checksums(source_uris: list[str]) -> list[str]:
+        """Return each document's document_id ('' when it cannot be read)."""
+        checksums = []
+        for uri in source_uris:
+            try:
+                checksums.append(DocumentChecksumProcessor().compute(uri))
+            except OSError:
+                checksums.append("")  # the worker records the error
+        return checksums
+
+    @staticmethod
+    def _collapse_content_duplicates(results: list[DocumentFingerprintResult]) -> None:
+        """Mark results whose hash signature an earlier result in the batch has."""
+        first_by_signature: dict[str, DocumentFingerprintResult] = {}
+        for r in results:
+            if r.minhash is None:
+                continue
+            original = first_by_signature.setdefault(r.hash_signature_sha256, r)
+            if original is not r:
+                _mark_duplicate(r, original, "hash_signature_sha256")
+                r.minhash = None
+
+    def _register(self, results: list[DocumentFingerprintResult]) -> None:
+        """Record fingerprinted (and content-duplicate) documents in the registry."""
+        fingerprints = [
+            RegisteredFingerprint(
+                document_id=r.document_id,
+                config_key=self.config_key,
+                hash_signature_sha256=r.hash_signature_sha256,
+                source_uri=r.source_uri,
+                file_name=r.file_name,
+                sig_path=r.sig_path,
+                minhash_path=r.minhash_path,
+                total_shingle_count=r.total_shingle_count,
+                unique_shingle_hash_count=r.unique_shingle_hash_count,
+                duplicate_of=r.duplicate_of,
+            )
+            for r in results
+            if r.duplicate_kind != "document_id"
+        ]
+        if fingerprints:
+            registry = FingerprintRegistry(self.output_root / "indexes")
+            registry.register(fingerprints)
+            registry.close()
+
+    def run(self, source_uris: list[str]) -> BatchFingerprintReport:
+        """Fingerprint every document and add them to the corpus LSH index.
+
+        Args:
+            source_uris: Absolute paths of the documents to fingerprint.
+
+        Returns:
+            BatchFingerprintReport with per-document results, docs/sec and
+            per-stage timing totals and means.
+        """
+        settings = self._settings()
+        extractor_options = self.extractor_options
+        if self.max_workers > 1 and source_uris:
+            try:
+                extractor_options = share_extractor_options(
+                    self.extractor_engine, extractor_options
+                )
+            except (RuntimeError, OSError) as exc:
+                # Workers retry on their own and report per-document errors.
+                log.warning("extractor_warmup_failed", error=str(exc))
+        init_args = (
+            self.extractor_engine,
+            extractor_options,
+            self.normalization_version,
+            self.remove_stopwords,
+            self.text_cache_dir,
+            self.text_cache_max_bytes,
+            str(self.output_root / "indexes") if self.skip_known_duplicates else None,
+        )
+        log.info(
+            "batch_started",
+            document_count=len(source_uris),
+            max_workers=self.max_workers,
+        )
+        started = time.perf_counter()
+
+        # Byte duplicates inside the batch are fingerprinted once: only the
+        # first source_uri per document_id is dispatched.
+        if self.skip_known_duplicates:
+            checksums = self._checksums(source_uris)
+        else:
+            checksums = [""] * len(source_uris)
+        first_by_id: dict[str, int] = {}
+        dispatched = [
+            i
+            for i, doc_id in enumerate(checksums)
+            if not doc_id or first_by_id.setdefault(doc_id, i) == i
+        ]
+        uris = [source_uris[i] for i in dispatched]
+        ids = [checksums[i] for i in dispatched]
+
+        if self.max_workers == 1:
+            _init_worker(*init_args)
+            fingerprinted = [
+                _fingerprint_document(uri, settings, doc_id) for uri, doc_id in zip(uris, ids)
+            ]
+        else:
+            chunksize = max(1, len(uris) // (self.max_workers * 4))
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=init_args,
+            ) as pool:
+                fingerprinted = list(
+                    pool.map(
+                        _fingerprint_document,
+                        uris,
+                        [settings] * len(uris),
+                        ids,
+                        chunksize=chunksize,
+                    )
+                )
+
+        if self.skip_known_duplicates:
+            self._collapse_content_duplicates([r for r in fingerprinted if r.error is None])
+        by_index = dict(zip(dispatched, fingerprinted))
+        results = []
+        for i, uri in enumerate(source_uris):
+            if i in by_index:
+                results.append(by_index[i])
+                continue
+            original = by_index[first_by_id[checksums[i]]]
+            result = DocumentFingerprintResult(
+                source_uri=uri, file_name=Path(uri).name, document_id=checksums[i]
+            )
+            if original.error is None:
+                _mark_duplicate(result, original, "document_id")
+            else:
+                result.error = original.error
+            results.append(result)
+
+        succeeded = [r for r in results if r.error is None]
+        indexed = [r for r in succeeded if r.minhash is not None]
+        if indexed:
+            signatures = {r.document_id: r.minhash for r in indexed}
+            MinHashSignatureStore(self.output_root / "indexes", num_perm=self.num_perm).append(
+                signatures
+            )
+            if self.lsh_shard_count:
+                ShardedLshIndex(
+                    self.output_root / "indexes",
+                    shard_count=self.lsh_shard_count,
+                    threshold=self.lsh_threshold,
+                    num_perm=self.num_perm,
+                    max_workers=self.max_workers,
+                ).append(signatures)
+            else:
+                IncrementalLshIndex(
+                    self.output_root / "indexes",
+                    threshold=self.lsh_threshold,
+                    num_perm=self.num_perm,
+                ).append(signatures)
+        if self.skip_known_duplicates:
+            self._register(succeeded)
+
+        wall = time.perf_counter() - started
+        stage_total = {s: 0.0 for s in STAGES}
+        for r in succeeded:
+            for name, secs in r.stage_seconds.items():
+                stage_total[name] += secs
+        stage_mean = {s: (t / len(succeeded) if succeeded else 0.0) for s, t in stage_total.items()}
+
+        report = BatchFingerprintReport(
+            results=results,
+            document_count=len(results),
+            succeeded_count=len(succeeded),
+            failed_count=len(results) - len(succeeded),
+            max_workers=self.max_workers,
+            wall_seconds=wall,
+            docs_per_second=(len(succeeded) / wall) if wall > 0 else 0.0,
+            text_cache_hit_count=sum(r.text_cache_hit for r in succeeded),
+            duplicate_count=sum(bool(r.duplicate_kind) for r in succeeded),
+            stage_seconds_total=stage_total,
+            stage_seconds_mean=stage_mean,
+        )
+        log.info(
+            "batch_completed",
+            document_count=report.document_count,
+            succeeded_count=report.succeeded_count,
+            failed_count=report.failed_count,
+            wall_seconds=round(wall, 3),
+            docs_per_second=round(report.docs_per_second, 2),
+            stage_seconds_mean={s: round(v, 4) for s, v in stage_mean.items()},
+        )
+        return report
@@ -12,30 +12,12 @@ Requirements:
 from __future__ import annotations
 
 import hashlib
-import logging
-import os
-from datetime import datetime
-
-import structlog
 
+from docfp.logging_config import get_logger
 from docfp.models.document_metadata import DocumentMetadata
+from docfp.processors.stage_timer import record_stage
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
 
 READ_CHUNK = 65536  # 64 KB
 
@@ -51,21 +33,35 @@ class DocumentChecksumProcessor:
         The same DocumentMetadata instance with document_id set.
     """
 
-    def compute_and_stamp(self, source_uri: str, metadata: DocumentMetadata) -> DocumentMetadata:
-        """Read file bytes, compute SHA-256, and set metadata.document_id.
+    def compute(self, source_uri: str) -> str:
+        """Read file bytes and return their SHA-256 digest.
 
         Args:
             source_uri: Absolute path to the document file.
-            metadata: DocumentMetadata whose document_id field will be filled.
 
         Returns:
-            Updated DocumentMetadata with document_id = hex SHA-256 digest.
+            Hex SHA-256 digest of the file, i.e. its document_id.
         """
         sha = hashlib.sha256()
+        bytes_read = 0
         with open(source_uri, "rb") as fh:
             while chunk := fh.read(READ_CHUNK):
                 sha.update(chunk)
-        document_id = sha.hexdigest()
+                bytes_read += len(chunk)
+        record_stage(bytes_read=bytes_read)
+        return sha.hexdigest()
+
+    def compute_and_stamp(self, source_uri: str, metadata: DocumentMetadata) -> DocumentMetadata:
+        """Read file bytes, compute SHA-256, and set metadata.document_id.
+
+        Args:
+            source_uri: Absolute path to the document file.
+            metadata: DocumentMetadata whose document_id field will be filled.
+
+        Returns:
+            Updated DocumentMetadata with document_id = hex SHA-256 digest.
+        """
+        document_id = self.compute(source_uri)
         metadata.document_id = document_id
         log.info("checksum_computed", file_name=metadata.file_name, document_id=document_id)
         return metadata
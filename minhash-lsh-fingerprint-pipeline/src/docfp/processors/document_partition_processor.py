@@ -5,35 +5,23 @@ Date: 2026-05-03
 Description: DocumentPartitionProcessor — splits a token list into equal-size
              partitions for distributed processing (FR-025, ADR-011).
 
+Note: With overlap = shingle_size - 1, every partition also carries the
+      first overlap tokens of the next one, so the shingles of partition i
+      are exactly the windows starting inside its own token range and the
+      partitions together yield every window of the document exactly once.
+
 Requirements:
 - Python 3.12+
 """
 
 from __future__ import annotations
 
-import logging
 import math
-import os
-from datetime import datetime
-
-import structlog
-
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+
+from docfp.logging_config import get_logger
+
+
+log = get_logger(__name__)
 
 DEFAULT_PARTITION_SIZE = 50_000  # tokens per partition
 
@@ -43,16 +31,38 @@ class DocumentPartitionProcessor:
 
     Args:
         partition_size: Max tokens per partition. Default 50 000.
+        overlap: Tokens of the next partition appended to each partition
+                 (shingle_size - 1 for lossless shingling). Default 0.
 
     Returns:
         List of (partition_id, tokens_slice) tuples.
     """
 
-    def __init__(self, partition_size: int = DEFAULT_PARTITION_SIZE) -> None:
+    def __init__(self, partition_size: int = DEFAULT_PARTITION_SIZE, overlap: int = 0) -> None:
+        if partition_size < 1:
+            raise ValueError(f"partition_size must be at least 1, got {partition_size}.")
         self.partition_size = partition_size
+        self.overlap = overlap
+
+    def bounds(self, token_count: int) -> list[tuple[int, int]]:
+        """Return the [start, end) token range each partition owns.
+
+        Args:
+            token_count: Number of tokens in the document.
+
+        Returns:
+            List of (start, end) in partition order; [(0, token_count)] for
+            documents fitting in one partition.  The slice a partition is
+            given extends overlap tokens past end.
+        """
+        partition_count = max(1, math.ceil(token_count / self.partition_size))
+        return [
+            (i * self.partition_size, min((i + 1) * self.partition_size, token_count))
+            for i in range(partition_count)
+        ]
 
     def partition(self, tokens: list[str], document_id: str) -> list[tuple[int, list[str]]]:
-        """Split tokens into consecutive non-overlapping partitions.
+        """Split tokens into consecutive partitions (overlapping by overlap).
 
         Args:
             tokens: Full normalized token list for the document.
@@ -62,17 +72,15 @@ class DocumentPartitionProcessor:
             List of (partition_id, token_slice) in order.
             Returns [(0, tokens)] for documents fitting in one partition.
         """
-        n = len(tokens)
-        partition_count = max(1, math.ceil(n / self.partition_size))
-        partitions = []
-        for i in range(partition_count):
-            start = i * self.partition_size
-            end = min(start + self.partition_size, n)
-            partitions.append((i, tokens[start:end]))
+        partitions = [
+            (i, tokens[start : end + self.overlap])
+            for i, (start, end) in enumerate(self.bounds(len(tokens)))
+        ]
         log.info(
             "document_partitioned",
             document_id=document_id,
-            token_count=n,
-            partition_count=partition_count,
+            token_count=len(tokens),
+            partition_count=len(partitions),
+            overlap=self.overlap,
         )
         return partitions
@@ -0,0 +1,172 @@
+"""
+File Name: fingerprint_registry.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: FingerprintRegistry — persistent SQLite lookup of every
+             fingerprinted document_id and hash_signature_sha256, so exact
+             byte duplicates and exact normalized-content duplicates end the
+             pipeline early and reuse the stored signature artifacts instead
+             of repeating MinHash and LSH work.
+
+Note: Rows are keyed by (document_id, config_key).  config_key encodes every
+      parameter the signature artifacts depend on (see signature_config_key),
+      so changing shingle size, permutations, normalization or the 64-bit
+      hash never reuses stale signatures.  A hit whose artifacts were deleted
+      counts as a miss.  Stored in WAL mode so batch workers read while the
+      parent registers.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import astuple, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from docfp.logging_config import get_logger
+from docfp.models.registered_fingerprint import RegisteredFingerprint
+
+log = get_logger(__name__)
+
+REGISTRY_FILENAME = "fingerprint_registry.sqlite"
+_COLUMNS = tuple(f.name for f in fields(RegisteredFingerprint))
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fingerprints (
+    document_id                TEXT NOT NULL,
+    config_key                 TEXT NOT NULL,
+    hash_signature_sha256      TEXT NOT NULL,
+    source_uri                 TEXT NOT NULL,
+    file_name                  TEXT NOT NULL,
+    sig_path                   TEXT NOT NULL,
+    minhash_path               TEXT NOT NULL,
+    total_shingle_count        INTEGER NOT NULL,
+    unique_shingle_hash_count  INTEGER NOT NULL,
+    duplicate_of               TEXT NOT NULL,
+    registered_at_utc          TEXT NOT NULL,
+    PRIMARY KEY (document_id, config_key)
+);
+CREATE INDEX IF NOT EXISTS fingerprints_hash_signature
+    ON fingerprints (hash_signature_sha256, config_key);
+"""
+
+
+def signature_config_key(
+    shingle_size: int,
+    num_perm: int,
+    normalization_key: str,
+    hash64_algorithm: str,
+    signature_version: str = "v1",
+) -> str:
+    """Encode the parameters signature artifacts depend on.
+
+    Args:
+        shingle_size: Word-shingle window size.
+        num_perm: MinHash permutation count.
+        normalization_key: Normalizer rule set identity (e.g. 'v1+stopwords').
+        hash64_algorithm: 64-bit shingle hash feeding MinHash.
+        signature_version: Signature schema version. Default 'v1'.
+
+    Returns:
+        Key such as 'v1/k5/p128/v1/xxh64'.
+    """
+    return f"{signature_version}/k{shingle_size}/p{num_perm}/{normalization_key}/{hash64_algorithm}"
+
+
+class FingerprintRegistry:
+    """SQLite registry of fingerprinted documents and their artifacts.
+
+    Args:
+        index_dir: Directory holding fingerprint_registry.sqlite (created if absent).
+
+    Returns:
+        FingerprintRegistry instance.
+    """
+
+    def __init__(self, index_dir: str | Path) -> None:
+        self.index_dir = Path(index_dir)
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.index_dir / REGISTRY_FILENAME
+        self._db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    def _find(self, where: str, params: tuple) -> Optional[RegisteredFingerprint]:
+        rows = self._db.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM fingerprints WHERE {where} "
+            "ORDER BY registered_at_utc",
+            params,
+        ).fetchall()
+        for row in rows:
+            found = RegisteredFingerprint(*row)
+            paths = (found.sig_path, found.minhash_path)
+            if all(Path(p).exists() for p in paths if p):
+                return found
+        return None
+
+    def find_by_document_id(
+        self, document_id: str, config_key: str
+    ) -> Optional[RegisteredFingerprint]:
+        """Return the registration for an exact byte duplicate, or None.
+
+        Args:
+            document_id: SHA-256 checksum of the source file.
+            config_key: Signature parameters (see signature_config_key).
+
+        Returns:
+            RegisteredFingerprint whose artifacts still exist, or None.
+        """
+        return self._find("document_id = ? AND config_key = ?", (document_id, config_key))
+
+    def find_by_hash_signature(
+        self, hash_signature_sha256: str, config_key: str
+    ) -> Optional[RegisteredFingerprint]:
+        """Return the earliest registration with identical normalized content, or None.
+
+        Args:
+            hash_signature_sha256: Document-level SHA-256 hash signature.
+            config_key: Signature parameters (see signature_config_key).
+
+        Returns:
+            RegisteredFingerprint whose artifacts still exist, or None.
+        """
+        return self._find(
+            "hash_signature_sha256 = ? AND config_key = ?", (hash_signature_sha256, config_key)
+        )
+
+    def register(self, fingerprints: list[RegisteredFingerprint]) -> int:
+        """Record fingerprinted documents; existing keys are left unchanged.
+
+        Args:
+            fingerprints: Registrations to add.
+
+        Returns:
+            Number of new rows.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        rows = [astuple(fp)[:-1] + (fp.registered_at_utc or now,) for fp in fingerprints]
+        with self._db:
+            self._db.execute("BEGIN")
+            before = self._db.total_changes
+            self._db.executemany(
+                f"INSERT OR IGNORE INTO fingerprints ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                rows,
+            )
+            added = self._db.total_changes - before
+        log.info("fingerprints_registered", submitted=len(rows), added=added)
+        return added
+
+    def close(self) -> None:
+        """Close the registry connection.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        self._db.close()
@@ -0,0 +1,130 @@
+"""
+File Name: fused_text_normalizer.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: FusedTextNormalizer — normalization rule set 'v2': the v1 rules
+             (NFC, lowercase, punctuation stripping, whitespace collapse)
+             applied in a single pass that yields the tokens directly, so the
+             normalized text and its tokens come out together (FR-010,
+             ADR-004).
+
+Note: After v1 replaces every character that is neither \\w nor whitespace
+      with a space and collapses whitespace, its tokens are exactly the
+      maximal runs of \\w characters of the NFC-normalized, lowercased text.
+      ASCII text is always NFC and its case mapping and \\w / whitespace
+      classes are fixed, so it is mapped with one str.translate table (upper
+      → lower, punctuation and control characters → space) and split; other
+      text is NFC-normalized, lowercased and scanned with one precompiled
+      \\w+ pattern.  The normalized text is " ".join(tokens).  Output is
+      identical to v1; the separate version keeps cache and registry keys of
+      the two implementations apart.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+from docfp.logging_config import get_logger
+from docfp.models.normalized_text import NormalizedText
+from docfp.processors.text_normalizer import TextNormalizer
+
+log = get_logger(__name__)
+
+NORMALIZATION_VERSION = "v2"
+
+_WORD = re.compile(r"\w+")
+
+
+def _ascii_table() -> dict[int, str]:
+    """Map each ASCII character the way v1 treats it: word → lowercase, space → kept."""
+    table: dict[int, str] = {}
+    for code in range(128):
+        char = chr(code)
+        if _WORD.fullmatch(char):
+            table[code] = char.lower()
+        elif char.isspace():
+            table[code] = char
+        else:
+            table[code] = " "
+    return table
+
+
+_ASCII_TABLE = str.maketrans(_ascii_table())
+
+
+class FusedTextNormalizer(TextNormalizer):
+    """Single-pass normalizer producing v1-identical text and tokens.
+
+    Args:
+        remove_stopwords: When True, removes tokens in the stopword set.
+
+    Returns:
+        NormalizedText instance (normalization_version 'v2').
+    """
+
+    @property
+    def normalization_version(self) -> str:
+        """Rule set version stamped on NormalizedText: NORMALIZATION_VERSION."""
+        return NORMALIZATION_VERSION
+
+    @property
+    def normalization_key(self) -> str:
+        """Rule set identity: NORMALIZATION_VERSION, plus '+stopwords' when enabled."""
+        if self.remove_stopwords:
+            return f"{NORMALIZATION_VERSION}+stopwords"
+        return NORMALIZATION_VERSION
+
+    def normalize(self, document_id: str, source_uri: str, text: str) -> NormalizedText:
+        """Normalize raw extracted text deterministically.
+
+        Args:
+            document_id: SHA-256 identifier for the source document.
+            source_uri: Absolute path or URI of the source document.
+            text: Raw extracted text string.
+
+        Returns:
+            NormalizedText with cleaned, lowercase, unicode-normalized text.
+        """
+        return self.normalize_tokens(document_id, source_uri, text)[0]
+
+    def normalize_tokens(
+        self, document_id: str, source_uri: str, text: str
+    ) -> tuple[NormalizedText, list[str]]:
+        """Normalize raw extracted text and return its tokens from the same pass.
+
+        Args:
+            document_id: SHA-256 identifier for the source document.
+            source_uri: Absolute path or URI of the source document.
+            text: Raw extracted text string.
+
+        Returns:
+            Tuple of (NormalizedText, tokens equal to its text.split()).
+        """
+        tokens = self._filter(self._tokens(text))
+
+        log.info(
+            "text_normalized",
+            document_id=document_id,
+            token_count=len(tokens),
+            normalization_version=NORMALIZATION_VERSION,
+            remove_stopwords=self.remove_stopwords,
+        )
+
+        normalized = NormalizedText(
+            document_id=document_id,
+            source_uri=source_uri,
+            text=" ".join(tokens),
+            normalization_version=NORMALIZATION_VERSION,
+            token_count=len(tokens),
+        )
+        return normalized, tokens
+
+    def _tokens(self, text: str) -> list[str]:
+        """Return the normalized tokens of text (before stopword removal)."""
+        if text.isascii():
+            return text.translate(_ASCII_TABLE).split()
+        return _WORD.findall(unicodedata.normalize("NFC", text).lower())
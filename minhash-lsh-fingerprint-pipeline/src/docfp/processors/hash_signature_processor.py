@@ -0,0 +1,168 @@
+"""
+File Name: hash_signature_processor.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: DocumentHashSignatureProcessor — document-level SHA-256 hash
+             signature over the sorted set of unique shingle SHA-256 hashes
+             (FR-013, BRD §11).  StreamingHashSignature computes the same
+             value incrementally in bounded memory.
+
+Note: The signature is sha256("".join(sorted(unique_hex_hashes))).  Hashes are
+      taken as a fixed-width 'S64' NumPy column, so de-duplication and sorting
+      are one np.unique call and the concatenation is the array's raw buffer.
+      StreamingHashSignature spills sorted unique runs to a temporary
+      directory once its buffer fills and k-way merges them at the end.
+
+Requirements:
+- numpy
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import tempfile
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_SPILL_THRESHOLD = 1_000_000  # buffered digests (~64 MB) before spilling a run
+_HEX_WIDTH = 64
+_MERGE_READ_RECORDS = 16_384
+
+
+class DocumentHashSignatureProcessor:
+    """Compute the document-level SHA-256 hash signature.
+
+    Args:
+        None.
+
+    Returns:
+        (hash_signature_sha256, unique_shingle_hash_count) from compute().
+    """
+
+    def compute(self, shingle_hash_sha256: np.ndarray, document_id: str = "") -> tuple[str, int]:
+        """Hash the sorted unique shingle SHA-256 hex digests.
+
+        Args:
+            shingle_hash_sha256: 'S64' array of lowercase hex digests
+                                 (ShingleBatch.shingle_hash_sha256).
+            document_id: SHA-256 document identifier (used for logging).
+
+        Returns:
+            Tuple of (64-char hex signature, unique shingle hash count).
+        """
+        unique = np.unique(np.asarray(shingle_hash_sha256, dtype="S64"))
+        signature = hashlib.sha256(unique.tobytes()).hexdigest()
+        log.info(
+            "document_hash_signature_computed",
+            document_id=document_id,
+            unique_hash_count=len(unique),
+        )
+        return signature, len(unique)
+
+
+class StreamingHashSignature:
+    """Accumulate shingle SHA-256 digests and produce the document signature.
+
+    Args:
+        spill_threshold: Buffered unique digests before a sorted run is
+                         written to disk. Default 1,000,000 (~64 MB).
+        spill_dir: Parent directory for spill runs (system temp by default).
+
+    Returns:
+        (hash_signature_sha256, unique_shingle_hash_count) from finalize(),
+        equal to DocumentHashSignatureProcessor.compute() over every digest.
+    """
+
+    def __init__(
+        self,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+        spill_dir: str | Path | None = None,
+    ) -> None:
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+        self._pending: list[np.ndarray] = []
+        self._pending_count = 0
+        self._runs: list[Path] = []
+        self._tmpdir: tempfile.TemporaryDirectory | None = None
+
+    @property
+    def spill_run_count(self) -> int:
+        return len(self._runs)
+
+    def add(self, shingle_hash_sha256: np.ndarray) -> None:
+        """Add a slice of shingle digests.
+
+        Args:
+            shingle_hash_sha256: 'S64' array of lowercase hex digests.
+
+        Returns:
+            None.
+        """
+        unique = np.unique(np.asarray(shingle_hash_sha256, dtype="S64"))
+        self._pending.append(unique)
+        self._pending_count += len(unique)
+        if self._pending_count >= self.spill_threshold:
+            self._spill()
+
+    def _merged_pending(self) -> np.ndarray:
+        if not self._pending:
+            return np.empty(0, dtype="S64")
+        return np.unique(np.concatenate(self._pending))
+
+    def _spill(self) -> None:
+        if not self._pending:
+            return
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.TemporaryDirectory(prefix="docfp_sig_", dir=self.spill_dir)
+        run_path = Path(self._tmpdir.name) / f"run_{len(self._runs):05d}.s64"
+        self._merged_pending().tofile(run_path)
+        self._runs.append(run_path)
+        self._pending = []
+        self._pending_count = 0
+
+    @staticmethod
+    def _iter_run(path: Path) -> Iterator[bytes]:
+        with open(path, "rb") as fh:
+            while block := fh.read(_HEX_WIDTH * _MERGE_READ_RECORDS):
+                for i in range(0, len(block), _HEX_WIDTH):
+                    yield block[i : i + _HEX_WIDTH]
+
+    def finalize(self) -> tuple[str, int]:
+        """Return the signature over every digest added so far.
+
+        Args:
+            None.
+
+        Returns:
+            Tuple of (64-char hex signature, unique shingle hash count).
+        """
+        try:
+            if not self._runs:
+                unique = self._merged_pending()
+                return hashlib.sha256(unique.tobytes()).hexdigest(), len(unique)
+
+            self._spill()
+            digest = hashlib.sha256()
+            count = 0
+            previous = b""
+            for value in heapq.merge(*(self._iter_run(p) for p in self._runs)):
+                if value != previous:
+                    digest.update(value)
+                    count += 1
+                    previous = value
+            return digest.hexdigest(), count
+        finally:
+            if self._tmpdir is not None:
+                self._tmpdir.cleanup()
+                self._tmpdir = None
+            self._runs = []
+            self._pending = []
+            self._pending_count = 0
@@ -0,0 +1,277 @@
+"""
+File Name: incremental_lsh_index.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: IncrementalLshIndex — persistent, append-only corpus LSH index.
+             New signatures are appended to a JSON-lines log in O(1); the log is
+             folded into the memory-mapped snapshot by compaction once it
+             grows to a fixed fraction of the snapshot, so ingesting N documents
+             costs O(N) in total (FR-024, ADR-010).
+
+Note: Layout under the index directory:
+        corpus_lsh_index.lshx           compacted snapshot (MappedLshIndex format)
+        corpus_lsh_index.log.jsonl      signatures appended since compaction
+        corpus_lsh_index.manifest.json  entry counts, LSH parameters, format version
+        corpus_lsh_index.lock           advisory lock for concurrent runs
+      append() skips document_ids already in the snapshot, so manifest
+      log_count counts inserted entries only; an id re-appended while it is
+      still in the log is dropped at replay/compaction.
+      A crash mid-append can leave a partial last log line: replay skips
+      it, and the next append cuts the log back to its last complete line
+      before writing.
+      A corpus_lsh_index.pkl left by earlier releases is read once,
+      folded into the first .lshx snapshot and removed.
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+from docfp.processors.lsh_index_builder import (
+    DEFAULT_NUM_PERM,
+    DEFAULT_THRESHOLD,
+    LEGACY_LSH_INDEX_FILE,
+    LSH_INDEX_FILE,
+    LshIndexBuilder,
+)
+from docfp.processors.lsh_index_file import LSH_INDEX_FORMAT_VERSION, MappedLshIndex
+
+if TYPE_CHECKING:
+    from datasketch import MinHash
+
+log = get_logger(__name__)
+
+LSH_LOG_FILE = "corpus_lsh_index.log.jsonl"
+LSH_MANIFEST_FILE = "corpus_lsh_index.manifest.json"
+LSH_LOCK_FILE = "corpus_lsh_index.lock"
+DEFAULT_COMPACTION_RATIO = 0.5  # compact when log ≥ 50% of snapshot entries
+DEFAULT_MIN_COMPACTION_ENTRIES = 256
+_TAIL_SCAN_BYTES = 65_536  # block size when searching back for the last newline
+
+
+class IncrementalLshIndex:
+    """Append-only corpus LSH index with log compaction.
+
+    Args:
+        index_dir: Directory holding the snapshot, log and manifest files.
+        threshold: Jaccard similarity threshold for LSH banding. Default 0.5.
+        num_perm: MinHash permutation count (must match signature builder).
+        compaction_ratio: Compact once log entries reach this fraction of
+                          the snapshot entry count. Default 0.5.
+        min_compaction_entries: Never compact for fewer log entries than
+                                this (except when no snapshot exists yet).
+
+    Returns:
+        MappedLshIndex views of the full corpus via load().
+    """
+
+    def __init__(
+        self,
+        index_dir: Path,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        compaction_ratio: float = DEFAULT_COMPACTION_RATIO,
+        min_compaction_entries: int = DEFAULT_MIN_COMPACTION_ENTRIES,
+    ) -> None:
+        self.index_dir = Path(index_dir)
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.compaction_ratio = compaction_ratio
+        self.min_compaction_entries = min_compaction_entries
+        self.snapshot_path = self.index_dir / LSH_INDEX_FILE
+        self.legacy_snapshot_path = self.index_dir / LEGACY_LSH_INDEX_FILE
+        self.log_path = self.index_dir / LSH_LOG_FILE
+        self.manifest_path = self.index_dir / LSH_MANIFEST_FILE
+        self._builder = LshIndexBuilder(threshold=threshold, num_perm=num_perm)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.index_dir / LSH_LOCK_FILE, "a+") as lock_fh:
+            fcntl.flock(lock_fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_fh, fcntl.LOCK_UN)
+
+    def _read_manifest(self) -> dict:
+        if not self.manifest_path.exists():
+            return {
+                "threshold": self.threshold,
+                "num_perm": self.num_perm,
+                "snapshot_count": 0,
+                "log_count": 0,
+            }
+        manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        if manifest["threshold"] != self.threshold or manifest["num_perm"] != self.num_perm:
+            raise ValueError(
+                f"Index at {self.index_dir} was built with threshold={manifest['threshold']}, "
+                f"num_perm={manifest['num_perm']}; got threshold={self.threshold}, "
+                f"num_perm={self.num_perm}."
+            )
+        return manifest
+
+    def _write_manifest(self, manifest: dict) -> None:
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def _replay_log(self, index: MappedLshIndex) -> int:
+        if not self.log_path.exists():
+            return 0
+        document_ids, hashvalues = [], []
+        with open(self.log_path, "rb") as fh:
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    # Only the last line can be unterminated: a torn write.
+                    log.warning(
+                        "lsh_index_log_torn_line_skipped",
+                        path=str(self.log_path),
+                        byte_count=len(line),
+                    )
+                    break
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                document_ids.append(entry["document_id"])
+                hashvalues.append(entry["hashvalues"])
+        if not document_ids:
+            return 0
+        return index.insert_batch(document_ids, np.asarray(hashvalues, dtype=np.uint64))
+
+    def _truncate_torn_log(self) -> None:
+        """Cut the log back to its last complete line, as a crash can leave a partial one."""
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, "r+b") as fh:
+            size = fh.seek(0, os.SEEK_END)
+            end = size
+            while end:
+                start = max(0, end - _TAIL_SCAN_BYTES)
+                fh.seek(start)
+                newline = fh.read(end - start).rfind(b"\n")
+                if newline >= 0:
+                    end = start + newline + 1
+                    break
+                end = start
+            if end < size:
+                fh.truncate(end)
+                log.warning(
+                    "lsh_index_log_truncated",
+                    path=str(self.log_path),
+                    dropped_bytes=size - end,
+                )
+
+    def _load_unlocked(self) -> tuple[MappedLshIndex, int]:
+        inserted = 0
+        if self.snapshot_path.exists():
+            index = self._builder.load(self.snapshot_path)
+        elif self.legacy_snapshot_path.exists():
+            # Pickled MinHashLSH from earlier releases, folded into the next compaction.
+            index = self._builder.to_mapped(self._builder.load_legacy(self.legacy_snapshot_path))
+            inserted = len(index)
+        else:
+            index = MappedLshIndex(threshold=self.threshold, num_perm=self.num_perm)
+        return index, inserted + self._replay_log(index)
+
+    def _compact_unlocked(self, manifest: dict) -> None:
+        index, _ = self._load_unlocked()
+        index.write(self.snapshot_path)
+        self.log_path.unlink(missing_ok=True)
+        self.legacy_snapshot_path.unlink(missing_ok=True)
+        manifest["snapshot_count"] = len(index)
+        manifest["log_count"] = 0
+        manifest["format_version"] = LSH_INDEX_FORMAT_VERSION
+        self._write_manifest(manifest)
+        log.info(
+            "lsh_index_compacted",
+            index_dir=str(self.index_dir),
+            snapshot_count=manifest["snapshot_count"],
+        )
+
+    def append(self, signatures: dict[str, MinHash]) -> Path:
+        """Append signatures to the index log, compacting when it is due.
+
+        Args:
+            signatures: Mapping of document_id → MinHash signature.
+
+        Returns:
+            Path of the snapshot file (the index directory's canonical index).
+        """
+        with self._locked():
+            manifest = self._read_manifest()
+            self._truncate_torn_log()
+            document_ids = list(signatures)
+            if self.snapshot_path.exists():
+                known = MappedLshIndex.open(self.snapshot_path).known(document_ids)
+            else:
+                known = [False] * len(document_ids)
+            with open(self.log_path, "a", encoding="utf-8") as fh:
+                appended = 0
+                for doc_id, is_known in zip(document_ids, known):
+                    if is_known:
+                        continue
+                    entry = {
+                        "document_id": doc_id,
+                        "hashvalues": signatures[doc_id].hashvalues.tolist(),
+                    }
+                    fh.write(json.dumps(entry) + "\n")
+                    appended += 1
+            manifest["log_count"] += appended
+            self._write_manifest(manifest)
+            log.info(
+                "lsh_index_appended",
+                index_dir=str(self.index_dir),
+                appended=appended,
+                skipped=len(signatures) - appended,
+                log_count=manifest["log_count"],
+            )
+
+            due = max(
+                self.min_compaction_entries,
+                int(manifest["snapshot_count"] * self.compaction_ratio),
+            )
+            if not self.snapshot_path.exists() or manifest["log_count"] >= due:
+                self._compact_unlocked(manifest)
+        return self.snapshot_path
+
+    def compact(self) -> Path:
+        """Fold the append log into the snapshot immediately.
+
+        Args:
+            None.
+
+        Returns:
+            Path of the rewritten snapshot file.
+        """
+        with self._locked():
+            self._compact_unlocked(self._read_manifest())
+        return self.snapshot_path
+
+    def load(self) -> MappedLshIndex:
+        """Map the snapshot and replay un-compacted entries in memory.
+
+        Args:
+            None.
+
+        Returns:
+            MappedLshIndex with every indexed document_id.
+        """
+        with self._locked():
+            self._read_manifest()
+            index, _ = self._load_unlocked()
+        log.info("lsh_index_loaded_incremental", index_dir=str(self.index_dir))
+        return index
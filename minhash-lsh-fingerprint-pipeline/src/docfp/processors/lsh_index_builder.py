@@ -5,6 +5,10 @@ Date: 2026-05-03
 Description: LshIndexBuilder — builds and queries a datasketch MinHashLSH index
              for approximate near-duplicate detection (FR-024, ADR-010).
 
+Note: Persisted indexes use the versioned, memory-mapped format of
+      lsh_index_file.MappedLshIndex (corpus_lsh_index.lshx).  load_legacy()
+      reads the pickled MinHashLSH earlier releases wrote, for migration.
+
 Requirements:
 - datasketch>=1.6
 - Python 3.12+
@@ -12,35 +16,24 @@ Requirements:
 
 from __future__ import annotations
 
-import logging
-import os
 import pickle
-from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+from docfp.processors.lsh_index_file import MappedLshIndex
+
+if TYPE_CHECKING:
+    from datasketch import MinHash, MinHashLSH
 
-import structlog
-from datasketch import MinHash, MinHashLSH
-
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
 
 DEFAULT_THRESHOLD = 0.5
 DEFAULT_NUM_PERM = 128
-LSH_INDEX_FILE = "corpus_lsh_index.pkl"
+LSH_INDEX_FILE = "corpus_lsh_index.lshx"
+LEGACY_LSH_INDEX_FILE = "corpus_lsh_index.pkl"
 
 
 class LshIndexBuilder:
@@ -69,48 +62,116 @@ class LshIndexBuilder:
         Returns:
             Populated MinHashLSH instance ready for querying.
         """
+        from datasketch import MinHashLSH
+
         lsh = MinHashLSH(threshold=self.threshold, num_perm=self.num_perm)
-        for doc_id, mh in signatures.items():
-            lsh.insert(doc_id, mh)
+        self.insert(lsh, signatures)
         log.info("lsh_index_built", document_count=len(signatures), threshold=self.threshold)
         return lsh
 
-    def save(self, lsh: MinHashLSH, output_dir: Path) -> Path:
-        """Persist the LSH index to disk as a pickle file.
+    def insert(self, lsh: MinHashLSH, signatures: dict[str, MinHash]) -> int:
+        """Insert signatures into an existing index, skipping known document IDs.
+
+        Args:
+            lsh: MinHashLSH index to extend in place.
+            signatures: Mapping of document_id → MinHash signature.
+
+        Returns:
+            Number of signatures actually inserted.
+        """
+        inserted = 0
+        for doc_id, mh in signatures.items():
+            if doc_id in lsh:
+                continue
+            lsh.insert(doc_id, mh)
+            inserted += 1
+        return inserted
+
+    def to_mapped(self, lsh: MinHashLSH) -> MappedLshIndex:
+        """Copy the documents of a MinHashLSH into an in-memory MappedLshIndex.
+
+        MinHashLSH keeps each document's band values as big-endian bytes, in
+        band order; they are decoded back into the leading bands * r values,
+        which is all band_keys() reads.
+
+        Args:
+            lsh: MinHashLSH built with this builder's threshold and num_perm.
+
+        Returns:
+            MappedLshIndex with the same documents and band layout.
+        """
+        if lsh.h != self.num_perm:
+            raise ValueError(f"MinHashLSH has num_perm={lsh.h}; expected {self.num_perm}.")
+        index = MappedLshIndex(
+            threshold=self.threshold, num_perm=self.num_perm, bands=lsh.b, rows_per_band=lsh.r
+        )
+        document_ids = list(lsh.keys.keys())
+        if not document_ids:
+            return index
+        hashvalues = np.zeros((len(document_ids), self.num_perm), dtype=np.uint64)
+        width = lsh.b * lsh.r
+        for row, doc_id in enumerate(document_ids):
+            band_bytes = lsh.keys.get(doc_id)
+            itemsize = len(band_bytes[0]) // lsh.r
+            hashvalues[row, :width] = np.concatenate(
+                [np.frombuffer(h, dtype=f">u{itemsize}") for h in band_bytes]
+            )
+        index.insert_batch(document_ids, hashvalues)
+        return index
+
+    def save(self, lsh: MinHashLSH | MappedLshIndex, output_dir: Path) -> Path:
+        """Persist a built index as a .lshx index file.
 
         Args:
-            lsh: The MinHashLSH index to persist.
+            lsh: Index from build() (MinHashLSH) or a MappedLshIndex.
             output_dir: Directory to write the index file.
 
         Returns:
-            Path of the written pickle file.
+            Path of the written index file.
         """
-        output_dir.mkdir(parents=True, exist_ok=True)
-        out_path = output_dir / LSH_INDEX_FILE
-        with open(out_path, "wb") as fh:
-            pickle.dump(lsh, fh)
-        log.info("lsh_index_saved", path=str(out_path))
+        index = lsh if isinstance(lsh, MappedLshIndex) else self.to_mapped(lsh)
+        out_path = index.write(Path(output_dir) / LSH_INDEX_FILE)
+        log.info("lsh_index_saved", path=str(out_path), document_count=len(index))
         return out_path
 
-    def load(self, index_path: Path) -> MinHashLSH:
-        """Load a previously persisted LSH index from disk.
+    def load(self, index_path: Path) -> MappedLshIndex:
+        """Memory-map a previously persisted .lshx index (header parse only).
 
         Args:
-            index_path: Path to the pickle file.
+            index_path: Path to the index file.
+
+        Returns:
+            MappedLshIndex with the MinHashLSH query/insert/contains API.
+        """
+        index = MappedLshIndex.open(index_path)
+        if (index.threshold, index.num_perm) != (self.threshold, self.num_perm):
+            raise ValueError(
+                f"{index_path} was built with threshold={index.threshold}, "
+                f"num_perm={index.num_perm}; got threshold={self.threshold}, "
+                f"num_perm={self.num_perm}."
+            )
+        log.info("lsh_index_loaded", path=str(index_path))
+        return index
+
+    def load_legacy(self, index_path: Path) -> MinHashLSH:
+        """Load a pickled MinHashLSH written by earlier releases (migration only).
+
+        Args:
+            index_path: Path to corpus_lsh_index.pkl.
 
         Returns:
             Deserialized MinHashLSH instance.
         """
         with open(index_path, "rb") as fh:
             lsh = pickle.load(fh)  # noqa: S301 — trusted internal artifact
-        log.info("lsh_index_loaded", path=str(index_path))
+        log.info("lsh_index_legacy_loaded", path=str(index_path))
         return lsh
 
-    def query(self, lsh: MinHashLSH, query_mh: MinHash) -> list[str]:
+    def query(self, lsh: MinHashLSH | MappedLshIndex, query_mh: MinHash) -> list[str]:
         """Find candidate near-duplicate documents for a query signature.
 
         Args:
-            lsh: Populated MinHashLSH index.
+            lsh: Populated MinHashLSH or MappedLshIndex.
             query_mh: MinHash signature of the query document.
 
         Returns:
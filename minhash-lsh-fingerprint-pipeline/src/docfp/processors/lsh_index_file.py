@@ -0,0 +1,494 @@
+"""
+File Name: lsh_index_file.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: MappedLshIndex — the corpus LSH index in a documented, versioned,
+             memory-mapped file format (corpus_lsh_index.lshx), queryable
+             without deserializing buckets, replacing the pickled MinHashLSH.
+
+Note: File layout (little-endian; every section starts on a 64-byte boundary):
+
+        header          128 bytes: HEADER struct (magic, format version,
+                        num_perm, bands, rows_per_band, band hash id,
+                        threshold, counts, section offsets), zero padded
+        band_dir        uint64[bands + 1]    bucket range of each band
+        id_offsets      uint64[N + 1]        byte range of each document_id
+        id_order        uint32[N]            rows sorted by document_id
+        id_blob         UTF-8 document_ids, concatenated
+        postings        uint32[bands * N]    document rows; band b owns
+                                             [b * N, (b + 1) * N)
+        bucket_hashes   uint64[buckets]      band keys, ascending per band
+        bucket_offsets  uint64[buckets + 1]  postings range of each bucket
+
+      A band key is band_keys() of the band's values: a 64-bit mix, so the
+      file never depends on datasketch internals.  Opening the file maps it
+      and parses the header only; a query is one searchsorted per band over
+      that band's slice of bucket_hashes.  Signatures inserted after the
+      file was written are held in memory (per-band sorted keys) until
+      write() folds them in, band by band, in O(documents) memory.
+
+Requirements:
+- numpy>=1.24
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from datasketch import MinHash
+
+log = get_logger(__name__)
+
+LSH_INDEX_MAGIC = b"DOCFPLSH"
+LSH_INDEX_FORMAT_VERSION = 1
+BAND_HASH_SPLITMIX64 = 1  # band_keys() below
+HEADER_SIZE = 128
+HEADER = struct.Struct("<8sIIIIIId10Q")
+SECTION_ALIGNMENT = 64
+KEY_DTYPE = np.dtype("<u8")
+ROW_DTYPE = np.dtype("<u4")
+_BISECT_BATCH_LIMIT = 4_096  # above this, membership checks search all ids at once
+_KEY_SEED = np.uint64(0x9E3779B97F4A7C15)
+_KEY_MULTIPLIER = np.uint64(0xBF58476D1CE4E5B9)
+_KEY_SHIFT = np.uint64(31)
+
+
+def band_keys(matrix: np.ndarray, bands: int, rows_per_band: int) -> np.ndarray:
+    """Mix each band of each signature into one 64-bit key.
+
+    Args:
+        matrix: (n, num_perm) array of MinHash values.
+        bands: Number of LSH bands (b).
+        rows_per_band: MinHash values per band (r).
+
+    Returns:
+        numpy.uint64 array of shape (n, bands).
+    """
+    values = np.asarray(matrix, dtype=KEY_DTYPE)[:, : bands * rows_per_band]
+    values = values.reshape(len(values), bands, rows_per_band)
+    keys = np.full((len(values), bands), _KEY_SEED, dtype=KEY_DTYPE)
+    for j in range(rows_per_band):
+        keys ^= values[:, :, j]
+        keys *= _KEY_MULTIPLIER
+        keys ^= keys >> _KEY_SHIFT
+    return keys
+
+
+def _ragged_indices(starts: np.ndarray, ends: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return (owner, index) for every index in each [start, end) range."""
+    lengths = (ends - starts).astype(np.int64)
+    owner = np.repeat(np.arange(len(lengths)), lengths)
+    first = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return owner, np.arange(int(lengths.sum()), dtype=np.int64) - first + starts[owner]
+
+
+def _segment_search(
+    values: np.ndarray, keys: np.ndarray, lo: np.ndarray, hi: np.ndarray, side: str = "left"
+) -> np.ndarray:
+    """Vectorized searchsorted of each key within its own sorted [lo, hi) segment.
+
+    One bisection step runs for every key at once, so probing all bands of
+    a query costs O(log segment) numpy passes instead of one call per band.
+    """
+    lo, hi = lo.astype(np.int64), hi.astype(np.int64)
+    last = len(values) - 1
+    while True:
+        active = lo < hi
+        if not active.any():
+            return lo
+        mid = (lo + hi) >> 1
+        value = values[np.minimum(mid, last)]
+        go_right = active & ((value <= keys) if side == "right" else (value < keys))
+        lo = np.where(go_right, mid + 1, lo)
+        hi = np.where(active & ~go_right, mid, hi)
+
+
+def _pad_to(fh, alignment: int = SECTION_ALIGNMENT) -> int:
+    position = fh.tell()
+    padding = -position % alignment
+    if padding:
+        fh.write(b"\0" * padding)
+    return position + padding
+
+
+class MappedLshIndex:
+    """Corpus LSH index backed by a memory-mapped .lshx file.
+
+    Args:
+        threshold: Jaccard similarity threshold that fixes the band layout.
+        num_perm: MinHash permutation count (must match signature builder).
+        bands: Band count; None uses the layout MinHashLSH picks.
+        rows_per_band: Rows per band; None uses the layout MinHashLSH picks.
+
+    Returns:
+        Empty in-memory index; use MappedLshIndex.open() for a file.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        num_perm: int,
+        bands: Optional[int] = None,
+        rows_per_band: Optional[int] = None,
+    ) -> None:
+        if bands is None or rows_per_band is None:
+            from datasketch import MinHashLSH
+
+            lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+            bands, rows_per_band = lsh.b, lsh.r
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows_per_band = bands, rows_per_band
+        self.path: Optional[Path] = None
+        self._base_count = 0
+        self._band_dir = np.zeros(self.bands + 1, dtype="<u8")
+        self._id_offsets = np.zeros(1, dtype="<u8")
+        self._id_order = np.empty(0, dtype=ROW_DTYPE)
+        self._id_blob = np.empty(0, dtype=np.uint8)
+        self._postings = np.empty(0, dtype=ROW_DTYPE)
+        self._bucket_hashes = np.empty(0, dtype="<u8")
+        self._bucket_offsets = np.zeros(1, dtype="<u8")
+        self._pending_ids: list[str] = []
+        self._pending_rows: dict[str, int] = {}
+        self._pending_keys: list[np.ndarray] = []
+        self._pending_sorted: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+    @classmethod
+    def open(cls, path: Path) -> MappedLshIndex:
+        """Map an index file; only the header is parsed.
+
+        Args:
+            path: Path of a .lshx file written by write().
+
+        Returns:
+            MappedLshIndex over the file's documents.
+        """
+        with open(path, "rb") as fh:
+            raw = fh.read(HEADER.size)
+        if len(raw) < HEADER.size or raw[:8] != LSH_INDEX_MAGIC:
+            raise ValueError(f"{path} is not a docfp LSH index file.")
+        (
+            _magic,
+            version,
+            _header_size,
+            num_perm,
+            bands,
+            rows_per_band,
+            band_hash,
+            threshold,
+            document_count,
+            bucket_count,
+            band_dir_at,
+            id_offsets_at,
+            id_order_at,
+            id_blob_at,
+            id_blob_bytes,
+            postings_at,
+            bucket_hashes_at,
+            bucket_offsets_at,
+        ) = HEADER.unpack(raw)
+        if version != LSH_INDEX_FORMAT_VERSION or band_hash != BAND_HASH_SPLITMIX64:
+            raise ValueError(
+                f"{path} has format version {version} / band hash {band_hash}; this reader "
+                f"supports version {LSH_INDEX_FORMAT_VERSION} / band hash {BAND_HASH_SPLITMIX64}."
+            )
+        index = cls(threshold, num_perm, bands=bands, rows_per_band=rows_per_band)
+        buf = np.memmap(path, dtype=np.uint8, mode="r")
+
+        def section(offset: int, count: int, dtype: str | np.dtype) -> np.ndarray:
+            dtype = np.dtype(dtype)
+            return buf[offset : offset + count * dtype.itemsize].view(dtype)
+
+        index.path = Path(path)
+        index._base_count = document_count
+        index._band_dir = section(band_dir_at, bands + 1, "<u8")
+        index._id_offsets = section(id_offsets_at, document_count + 1, "<u8")
+        index._id_order = section(id_order_at, document_count, ROW_DTYPE)
+        index._id_blob = buf[id_blob_at : id_blob_at + id_blob_bytes]
+        index._postings = section(postings_at, bands * document_count, ROW_DTYPE)
+        index._bucket_hashes = section(bucket_hashes_at, bucket_count, "<u8")
+        index._bucket_offsets = section(bucket_offsets_at, bucket_count + 1, "<u8")
+        log.info("lsh_index_file_opened", path=str(path), document_count=document_count)
+        return index
+
+    def __len__(self) -> int:
+        return self._base_count + len(self._pending_ids)
+
+    def __contains__(self, document_id: str) -> bool:
+        return self.row_of(document_id) is not None
+
+    def document_id(self, row: int) -> str:
+        """Return the document_id stored at a row."""
+        if row >= self._base_count:
+            return self._pending_ids[row - self._base_count]
+        start, end = int(self._id_offsets[row]), int(self._id_offsets[row + 1])
+        return self._id_blob[start:end].tobytes().decode("utf-8")
+
+    def row_of(self, document_id: str) -> Optional[int]:
+        """Return the row of a document_id (binary search of id_order), or None."""
+        if document_id in self._pending_rows:
+            return self._pending_rows[document_id]
+        target = document_id.encode("utf-8")
+        lo, hi = 0, self._base_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            row = int(self._id_order[mid])
+            start, end = int(self._id_offsets[row]), int(self._id_offsets[row + 1])
+            if self._id_blob[start:end].tobytes() < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._base_count:
+            row = int(self._id_order[lo])
+            start, end = int(self._id_offsets[row]), int(self._id_offsets[row + 1])
+            if self._id_blob[start:end].tobytes() == target:
+                return row
+        return None
+
+    def known(self, document_ids: list[str]) -> list[bool]:
+        """Return whether each document_id is already indexed.
+
+        Small batches binary-search id_order per id; large ones (a replayed
+        append log) materialize the sorted ids once and search them together.
+
+        Args:
+            document_ids: document_ids to look up.
+
+        Returns:
+            One bool per document_id, in order.
+        """
+        if len(document_ids) <= _BISECT_BATCH_LIMIT or not self._base_count:
+            return [self.row_of(doc_id) is not None for doc_id in document_ids]
+        sorted_ids = np.array(self._encoded_ids()[: self._base_count], dtype=bytes)
+        sorted_ids = sorted_ids[self._id_order]
+        probe = np.array([doc_id.encode("utf-8") for doc_id in document_ids], dtype=bytes)
+        pos = np.minimum(np.searchsorted(sorted_ids, probe), self._base_count - 1)
+        known = sorted_ids[pos] == probe
+        return [
+            bool(k) or doc_id in self._pending_rows for k, doc_id in zip(known, document_ids)
+        ]
+
+    def insert_batch(self, document_ids: list[str], hashvalues: np.ndarray) -> int:
+        """Add signatures in memory, skipping document_ids already indexed.
+
+        Args:
+            document_ids: document_id of each hashvalues row.
+            hashvalues: (len(document_ids), num_perm) MinHash values.
+
+        Returns:
+            Number of signatures actually inserted.
+        """
+        keep = []
+        for i, (doc_id, known) in enumerate(zip(document_ids, self.known(document_ids))):
+            if known or doc_id in self._pending_rows:
+                continue
+            self._pending_rows[doc_id] = len(self)
+            self._pending_ids.append(doc_id)
+            keep.append(i)
+        if keep:
+            matrix = np.asarray(hashvalues)[keep]
+            self._pending_keys.append(band_keys(matrix, self.bands, self.rows_per_band))
+            self._pending_sorted = None
+        return len(keep)
+
+    def insert(self, document_id: str, minhash: MinHash) -> None:
+        """Add one signature in memory (MinHashLSH.insert equivalent)."""
+        if document_id in self:
+            raise ValueError(f"document_id {document_id!r} is already indexed.")
+        self.insert_batch([document_id], minhash.hashvalues[np.newaxis, :])
+
+    def _pending(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return per-band sorted pending keys (bands, p) and their rows."""
+        if self._pending_sorted is None:
+            keys = (
+                np.concatenate(self._pending_keys).T
+                if self._pending_keys
+                else np.empty((self.bands, 0), dtype=KEY_DTYPE)
+            )
+            order = np.argsort(keys, axis=1, kind="stable")
+            self._pending_sorted = (
+                np.take_along_axis(keys, order, axis=1),
+                order + self._base_count,
+            )
+        return self._pending_sorted
+
+    def query_batch(self, hashvalues: np.ndarray) -> list[list[str]]:
+        """Return the candidate document_ids of every query signature.
+
+        Args:
+            hashvalues: (queries, num_perm) MinHash values.
+
+        Returns:
+            Per query row, candidate document_ids sharing at least one band,
+            in row order.
+        """
+        matrix = np.atleast_2d(np.asarray(hashvalues))
+        keys = band_keys(matrix, self.bands, self.rows_per_band).T.ravel()
+        owner_of_key = np.tile(np.arange(len(matrix)), self.bands)
+        band_of_key = np.repeat(np.arange(self.bands), len(matrix))
+
+        band_dir = np.asarray(self._band_dir, dtype=np.int64)
+        seg_end = band_dir[band_of_key + 1]
+        pos = _segment_search(self._bucket_hashes, keys, band_dir[band_of_key], seg_end)
+        hit = pos < seg_end
+        hit[hit] = self._bucket_hashes[pos[hit]] == keys[hit]
+        bucket = pos[hit]
+        owner, at = _ragged_indices(
+            self._bucket_offsets[bucket].astype(np.int64),
+            self._bucket_offsets[bucket + 1].astype(np.int64),
+        )
+        queries = [owner_of_key[hit][owner]]
+        rows = [self._postings[at].astype(np.int64)]
+
+        pending_keys, pending_rows = self._pending()
+        pending_count = pending_keys.shape[1]
+        if pending_count:
+            seg_start = band_of_key * pending_count
+            seg_end = seg_start + pending_count
+            flat = pending_keys.ravel()
+            starts = _segment_search(flat, keys, seg_start, seg_end)
+            ends = _segment_search(flat, keys, seg_start, seg_end, side="right")
+            owner, at = _ragged_indices(starts, ends)
+            queries.append(owner_of_key[owner])
+            rows.append(pending_rows.ravel()[at])
+
+        pairs = np.unique(
+            np.concatenate(queries) * (len(self) + 1) + np.concatenate(rows)
+        )
+        query_idx, rows_found = np.divmod(pairs, len(self) + 1)
+        results: list[list[str]] = [[] for _ in range(len(matrix))]
+        for q, row in zip(query_idx.tolist(), rows_found.tolist()):
+            results[q].append(self.document_id(row))
+        return results
+
+    def query(self, minhash: MinHash) -> list[str]:
+        """Return candidate document_ids for one signature (MinHashLSH.query)."""
+        return self.query_batch(minhash.hashvalues[np.newaxis, :])[0]
+
+    def _band_pairs(self, band: int) -> tuple[np.ndarray, np.ndarray]:
+        """Return one band's (key, row) pairs over file and pending rows, sorted."""
+        lo, hi = int(self._band_dir[band]), int(self._band_dir[band + 1])
+        sizes = np.diff(self._bucket_offsets[lo : hi + 1].astype(np.int64))
+        keys = np.repeat(self._bucket_hashes[lo:hi], sizes)
+        start = band * self._base_count
+        rows = self._postings[start : start + self._base_count].astype(ROW_DTYPE)
+        pending_keys, pending_rows = self._pending()
+        keys = np.concatenate([keys, pending_keys[band]])
+        rows = np.concatenate([rows, pending_rows[band].astype(ROW_DTYPE)])
+        order = np.lexsort((rows, keys))
+        return keys[order], rows[order]
+
+    def _encoded_ids(self) -> list[bytes]:
+        blob = self._id_blob.tobytes()
+        offsets = self._id_offsets.tolist()
+        base = [blob[offsets[i] : offsets[i + 1]] for i in range(self._base_count)]
+        return base + [doc_id.encode("utf-8") for doc_id in self._pending_ids]
+
+    def write(self, path: Path) -> Path:
+        """Write file rows plus pending rows to a new index file, atomically.
+
+        Args:
+            path: Target .lshx path (replaced via a temporary file).
+
+        Returns:
+            Path of the written index file.
+        """
+        count = len(self)
+        if count >= np.iinfo(ROW_DTYPE).max:
+            raise ValueError(f"{count} documents exceed the uint32 row limit of the format.")
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        encoded = self._encoded_ids()
+        id_offsets = np.zeros(count + 1, dtype="<u8")
+        np.cumsum([len(e) for e in encoded], out=id_offsets[1:])
+        id_order = np.argsort(np.array(encoded, dtype=bytes), kind="stable").astype(ROW_DTYPE)
+
+        band_dir = np.zeros(self.bands + 1, dtype="<u8")
+        with tempfile.TemporaryDirectory(prefix="lshx_", dir=path.parent) as spill_dir:
+            hashes_spill = Path(spill_dir) / "bucket_hashes"
+            offsets_spill = Path(spill_dir) / "bucket_offsets"
+            with (
+                open(tmp_path, "wb") as fh,
+                open(hashes_spill, "wb") as hashes_fh,
+                open(offsets_spill, "wb") as offsets_fh,
+            ):
+                fh.write(b"\0" * HEADER_SIZE)
+                band_dir_at = _pad_to(fh)
+                fh.write(band_dir.tobytes())
+                id_offsets_at = _pad_to(fh)
+                fh.write(id_offsets.tobytes())
+                id_order_at = _pad_to(fh)
+                fh.write(id_order.tobytes())
+                id_blob_at = _pad_to(fh)
+                for e in encoded:
+                    fh.write(e)
+                id_blob_bytes = fh.tell() - id_blob_at
+                del encoded
+
+                postings_at = _pad_to(fh)
+                bucket_count = 0
+                for band in range(self.bands):
+                    keys, rows = self._band_pairs(band)
+                    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]][: len(keys)])
+                    fh.write(rows.tobytes())
+                    hashes_fh.write(keys[starts].astype("<u8").tobytes())
+                    offsets_fh.write((np.asarray(starts, dtype="<u8") + band * count).tobytes())
+                    bucket_count += len(starts)
+                    band_dir[band + 1] = bucket_count
+                offsets_fh.write(np.array([self.bands * count], dtype="<u8").tobytes())
+
+            with open(tmp_path, "r+b") as fh:
+                fh.seek(0, os.SEEK_END)
+                bucket_hashes_at = _pad_to(fh)
+                with open(hashes_spill, "rb") as spill:
+                    shutil.copyfileobj(spill, fh)
+                bucket_offsets_at = _pad_to(fh)
+                with open(offsets_spill, "rb") as spill:
+                    shutil.copyfileobj(spill, fh)
+                fh.seek(band_dir_at)
+                fh.write(band_dir.tobytes())
+                fh.seek(0)
+                fh.write(
+                    HEADER.pack(
+                        LSH_INDEX_MAGIC,
+                        LSH_INDEX_FORMAT_VERSION,
+                        HEADER_SIZE,
+                        self.num_perm,
+                        self.bands,
+                        self.rows_per_band,
+                        BAND_HASH_SPLITMIX64,
+                        self.threshold,
+                        count,
+                        bucket_count,
+                        band_dir_at,
+                        id_offsets_at,
+                        id_order_at,
+                        id_blob_at,
+                        id_blob_bytes,
+                        postings_at,
+                        bucket_hashes_at,
+                        bucket_offsets_at,
+                    )
+                )
+                fh.flush()
+                os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+        log.info(
+            "lsh_index_file_written",
+            path=str(path),
+            document_count=count,
+            bucket_count=bucket_count,
+        )
+        return path
@@ -12,32 +12,13 @@ Requirements:
 
 from __future__ import annotations
 
-import logging
-import os
 from datetime import datetime, timezone
 from pathlib import Path
 
-import magic
-import structlog
-
+from docfp.logging_config import get_logger
 from docfp.models.document_metadata import DocumentMetadata
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
 
 
 class DocumentMetadataExtractor:
@@ -63,6 +44,8 @@ class DocumentMetadataExtractor:
             DocumentMetadata with all file attributes populated.
             document_id is an empty string at this stage.
         """
+        import magic
+
         path = Path(source_uri)
         file_size = path.stat().st_size
         mime_type = magic.from_file(str(path), mime=True)
@@ -0,0 +1,237 @@
+"""
+File Name: minhash_signature_store.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: MinHashSignatureStore — corpus-wide binary MinHash signature
+             store: one fixed-width uint64[num_perm] row per document in a
+             memory-mapped file plus a document_id index, replacing one pair
+             of pretty-printed JSON files per document as the signature of
+             record.
+
+Note: Layout under the index directory:
+        minhash_signatures.u64            row-major little-endian uint64 rows
+        minhash_signatures.ids            document_id of each row, one per line
+        minhash_signatures.manifest.json  num_perm + dtype
+        minhash_signatures.lock           advisory lock for concurrent runs
+      Rows are only ever appended; the row count is the number of complete
+      lines in the ids file, which is written after the row data, so a
+      reader never sees a row that is not fully on disk and a crash between
+      the two writes leaves trailing bytes that the next append truncates
+      (as it does a partial last line of the ids file).
+      Re-appending a known document_id is a no-op.  matrix() returns a
+      read-only (rows, num_perm) view of the mapped file with no copying.
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+from docfp.processors.lsh_index_builder import DEFAULT_NUM_PERM
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+
+if TYPE_CHECKING:
+    from datasketch import MinHash
+
+log = get_logger(__name__)
+
+SIGNATURE_DATA_FILE = "minhash_signatures.u64"
+SIGNATURE_IDS_FILE = "minhash_signatures.ids"
+SIGNATURE_MANIFEST_FILE = "minhash_signatures.manifest.json"
+SIGNATURE_LOCK_FILE = "minhash_signatures.lock"
+SIGNATURE_DTYPE = np.dtype("<u8")
+
+
+class MinHashSignatureStore:
+    """Append-only, memory-mapped store of MinHash signatures.
+
+    Args:
+        index_dir: Directory holding the store files (created on first append).
+        num_perm: MinHash permutation count; fixes the row width.
+
+    Returns:
+        MinHashSignatureStore instance.
+    """
+
+    def __init__(self, index_dir: str | Path, num_perm: int = DEFAULT_NUM_PERM) -> None:
+        self.index_dir = Path(index_dir)
+        self.num_perm = num_perm
+        self.row_bytes = num_perm * SIGNATURE_DTYPE.itemsize
+        self.data_path = self.index_dir / SIGNATURE_DATA_FILE
+        self.ids_path = self.index_dir / SIGNATURE_IDS_FILE
+        self.manifest_path = self.index_dir / SIGNATURE_MANIFEST_FILE
+        self._document_ids: list[str] = []
+        self._rows: dict[str, int] = {}
+        self._ids_offset = 0
+        self._mapped: Optional[np.ndarray] = None
+        self._check_manifest()
+        self.refresh()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.index_dir / SIGNATURE_LOCK_FILE, "a+") as lock_fh:
+            fcntl.flock(lock_fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_fh, fcntl.LOCK_UN)
+
+    def _check_manifest(self) -> None:
+        if not self.manifest_path.exists():
+            return
+        manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        if manifest["num_perm"] != self.num_perm or manifest["dtype"] != SIGNATURE_DTYPE.str:
+            raise ValueError(
+                f"Signature store at {self.index_dir} holds num_perm={manifest['num_perm']} "
+                f"{manifest['dtype']} rows; got num_perm={self.num_perm}."
+            )
+
+    def _write_manifest(self) -> None:
+        manifest = {"num_perm": self.num_perm, "dtype": SIGNATURE_DTYPE.str}
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def refresh(self) -> int:
+        """Pick up rows appended since the last refresh (by any process).
+
+        Args:
+            None.
+
+        Returns:
+            Number of rows in the store.
+        """
+        if not self.ids_path.exists():
+            return len(self._document_ids)
+        with open(self.ids_path, "rb") as fh:
+            fh.seek(self._ids_offset)
+            tail = fh.read()
+        complete = tail[: tail.rfind(b"\n") + 1]
+        for line in complete.decode("ascii").splitlines():
+            self._rows.setdefault(line, len(self._document_ids))
+            self._document_ids.append(line)
+        self._ids_offset += len(complete)
+        return len(self._document_ids)
+
+    def __len__(self) -> int:
+        return len(self._document_ids)
+
+    def __contains__(self, document_id: str) -> bool:
+        return document_id in self._rows
+
+    @property
+    def document_ids(self) -> list[str]:
+        """document_id of every row, in row order."""
+        return list(self._document_ids)
+
+    def row_of(self, document_id: str) -> Optional[int]:
+        """Return the row number holding a document's signature, or None.
+
+        Args:
+            document_id: SHA-256 document identifier.
+
+        Returns:
+            Row index, or None when the document is not stored.
+        """
+        return self._rows.get(document_id)
+
+    def matrix(self) -> np.ndarray:
+        """Return every stored signature as a read-only memory-mapped view.
+
+        Args:
+            None.
+
+        Returns:
+            numpy.uint64 array of shape (len(self), num_perm) backed by the
+            data file; slicing and arithmetic on it never parse or copy rows.
+        """
+        rows = len(self._document_ids)
+        if rows == 0:
+            return np.empty((0, self.num_perm), dtype=SIGNATURE_DTYPE)
+        if self._mapped is None or self._mapped.shape[0] < rows:
+            self._mapped = np.memmap(
+                self.data_path, dtype=SIGNATURE_DTYPE, mode="r", shape=(rows, self.num_perm)
+            )
+        return self._mapped[:rows]
+
+    def get(self, row: int) -> np.ndarray:
+        """Return one signature row as a view into the mapped file (O(1)).
+
+        Args:
+            row: Row index (see row_of).
+
+        Returns:
+            numpy.uint64 array of length num_perm.
+        """
+        if not 0 <= row < len(self._document_ids):
+            raise IndexError(f"row {row} out of range for {len(self._document_ids)} signatures")
+        return self.matrix()[row]
+
+    def minhash(self, document_id: str) -> Optional[MinHash]:
+        """Rebuild a datasketch MinHash for a stored document.
+
+        Args:
+            document_id: SHA-256 document identifier.
+
+        Returns:
+            MinHash whose hashvalues equal the stored row, or None.
+        """
+        row = self.row_of(document_id)
+        if row is None:
+            return None
+        return MinHashSignatureBuilder(num_perm=self.num_perm).from_hashvalues(self.get(row))
+
+    def append(self, signatures: dict[str, MinHash]) -> dict[str, int]:
+        """Append signatures for documents not yet stored.
+
+        Args:
+            signatures: Mapping of document_id → MinHash signature.
+
+        Returns:
+            Mapping of document_id → row for every given document, including
+            ones that were already stored.
+        """
+        with self._locked():
+            if not self.manifest_path.exists():
+                self._write_manifest()
+            self.refresh()
+            new_ids = [d for d in dict.fromkeys(signatures) if d not in self._rows]
+            if new_ids:
+                block = np.empty((len(new_ids), self.num_perm), dtype=SIGNATURE_DTYPE)
+                for i, doc_id in enumerate(new_ids):
+                    hashvalues = signatures[doc_id].hashvalues
+                    if hashvalues.shape[0] != self.num_perm:
+                        raise ValueError(
+                            f"{doc_id} has {hashvalues.shape[0]} permutations; "
+                            f"store expects {self.num_perm}."
+                        )
+                    block[i] = hashvalues
+                with open(self.data_path, "ab") as fh:
+                    fh.truncate(len(self._document_ids) * self.row_bytes)
+                    fh.write(block.tobytes())
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                with open(self.ids_path, "ab") as fh:
+                    fh.truncate(self._ids_offset)  # drop a torn partial id line
+                    fh.write("".join(f"{d}\n" for d in new_ids).encode("ascii"))
+                self.refresh()
+        log.info(
+            "minhash_signatures_appended",
+            index_dir=str(self.index_dir),
+            appended=len(new_ids),
+            row_count=len(self._document_ids),
+        )
+        return {d: self._rows[d] for d in signatures}
@@ -0,0 +1,345 @@
+"""
+File Name: near_duplicate_cluster_processor.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: NearDuplicateClusterProcessor — all-pairs near-duplicate
+             clustering of the whole corpus: LSH band collisions over every
+             stored MinHash give candidate pairs, a vectorized signature
+             comparison verifies them, and union-find turns verified pairs
+             into connected components written as Parquet.
+
+Note: Work is partitioned by band.  The parent computes all band keys once,
+      in row chunks, into a temporary band-major uint64 file; each band is
+      then one task in a ProcessPoolExecutor that sorts that band's keys,
+      enumerates pairs inside each bucket of equal keys, verifies them in
+      bounded chunks against the memory-mapped signature store, and folds
+      them into per-band union-find labels.  Only the (row, label) pairs of
+      non-trivial components return to the parent, which merges them, so
+      memory stays O(documents) per worker however many pairs collide.
+      Buckets larger than max_bucket_size compare every member with the
+      bucket's first max_bucket_size members only, keeping the pair count
+      linear in the bucket size.
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+from docfp.models.near_duplicate_cluster_report import NearDuplicateClusterReport
+from docfp.processors.lsh_index_builder import DEFAULT_NUM_PERM, DEFAULT_THRESHOLD
+from docfp.processors.lsh_index_file import band_keys
+from docfp.processors.minhash_signature_store import SIGNATURE_DTYPE, MinHashSignatureStore
+from docfp.writers.near_duplicate_cluster_writer import NearDuplicateClusterWriter
+
+log = get_logger(__name__)
+
+DEFAULT_MAX_BUCKET_SIZE = 2_048
+DEFAULT_CHUNK_PAIRS = 1_048_576  # candidate pairs generated per step
+DEFAULT_VERIFY_CHUNK_PAIRS = 65_536  # pairs compared per numpy pass
+DEFAULT_KEY_CHUNK_ROWS = 65_536  # signatures band-keyed per step
+_EDGE_BUFFER_PAIRS = 4_194_304  # verified pairs buffered before a union-find fold
+
+
+def connected_components(
+    size: int,
+    left: np.ndarray,
+    right: np.ndarray,
+    labels: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Vectorized union-find: label every node with its component's smallest node.
+
+    Roots of edges that still disagree are hooked under the smaller root with
+    np.minimum.at, then labels are path-compressed by pointer jumping; rounds
+    repeat until every edge joins equal labels.
+
+    Args:
+        size: Number of nodes.
+        left: int64 array of edge endpoints.
+        right: int64 array of the other endpoints.
+        labels: Labels from an earlier call to extend (must be its output).
+
+    Returns:
+        int64 array where labels[i] is the smallest node connected to i.
+    """
+    labels = np.arange(size, dtype=np.int64) if labels is None else labels
+    while len(left):
+        left_root, right_root = labels[left], labels[right]
+        open_edges = left_root != right_root
+        if not open_edges.any():
+            break
+        left, right = left[open_edges], right[open_edges]
+        left_root, right_root = left_root[open_edges], right_root[open_edges]
+        np.minimum.at(
+            labels,
+            np.maximum(left_root, right_root),
+            np.minimum(left_root, right_root),
+        )
+        while True:
+            jumped = labels[labels]
+            if np.array_equal(jumped, labels):
+                break
+            labels = jumped
+    return labels
+
+
+def _bucket_pairs(
+    order: np.ndarray,
+    starts: np.ndarray,
+    sizes: np.ndarray,
+    chunk_pairs: int,
+    max_bucket_size: int,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield (row, row) candidate pairs for every bucket, chunk by chunk."""
+    small = sizes <= max_bucket_size
+    for size in np.unique(sizes[small]).tolist():
+        first, second = np.triu_indices(size, 1)
+        bucket_starts = starts[small & (sizes == size)]
+        per_step = max(1, chunk_pairs // len(first))
+        for i in range(0, len(bucket_starts), per_step):
+            block = bucket_starts[i : i + per_step, None]
+            yield order[(block + first).ravel()], order[(block + second).ravel()]
+    for start, size in zip(starts[~small].tolist(), sizes[~small].tolist()):
+        for anchor in range(start, start + max_bucket_size):
+            others = order[anchor + 1 : start + size]
+            yield np.full(len(others), order[anchor], dtype=np.int64), others
+
+
+def _cluster_band(
+    band: int,
+    keys_path: str,
+    document_count: int,
+    data_path: str,
+    num_perm: int,
+    min_similarity: float,
+    max_bucket_size: int,
+    chunk_pairs: int,
+    verify_chunk_pairs: int,
+) -> tuple[np.ndarray, np.ndarray, int, int, int]:
+    """Cluster one band's collisions inside a worker process.
+
+    Args:
+        band: Band number (row of the band-major key file).
+        keys_path: Temporary (bands, documents) uint64 band key file.
+        document_count: Number of signatures being clustered.
+        data_path: MinHashSignatureStore row file, mapped directly so the
+                   worker never re-reads the document_id file.
+        num_perm: MinHash permutation count.
+        min_similarity: Minimum estimated Jaccard for a verified pair.
+        max_bucket_size: Bucket size above which only anchor pairs are compared.
+        chunk_pairs: Candidate pairs generated per step.
+        verify_chunk_pairs: Pairs compared per numpy pass.
+
+    Returns:
+        Tuple (rows, labels, candidate pairs, verified pairs, oversized buckets)
+        where rows/labels cover only documents whose label is not themselves.
+    """
+    keys = np.memmap(
+        keys_path,
+        dtype=SIGNATURE_DTYPE,
+        mode="r",
+        offset=band * document_count * SIGNATURE_DTYPE.itemsize,
+        shape=(document_count,),
+    )
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    run_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    run_sizes = np.diff(np.r_[run_starts, document_count])
+    shared = run_sizes > 1
+    starts, sizes = run_starts[shared], run_sizes[shared]
+    del keys, sorted_keys, run_starts, run_sizes
+
+    corpus = np.memmap(
+        data_path, dtype=SIGNATURE_DTYPE, mode="r", shape=(document_count, num_perm)
+    )
+    labels: Optional[np.ndarray] = None
+    buffered_left: list[np.ndarray] = []
+    buffered_right: list[np.ndarray] = []
+    buffered = candidates = verified = 0
+    for left, right in _bucket_pairs(order, starts, sizes, chunk_pairs, max_bucket_size):
+        candidates += len(left)
+        for i in range(0, len(left), verify_chunk_pairs):
+            a, b = left[i : i + verify_chunk_pairs], right[i : i + verify_chunk_pairs]
+            equal = np.count_nonzero(corpus[a] == corpus[b], axis=1)
+            keep = equal / num_perm >= min_similarity
+            buffered_left.append(a[keep])
+            buffered_right.append(b[keep])
+            buffered += int(keep.sum())
+        if buffered >= _EDGE_BUFFER_PAIRS:
+            labels = connected_components(
+                document_count,
+                np.concatenate(buffered_left),
+                np.concatenate(buffered_right),
+                labels,
+            )
+            verified += buffered
+            buffered_left, buffered_right, buffered = [], [], 0
+    if buffered:
+        labels = connected_components(
+            document_count, np.concatenate(buffered_left), np.concatenate(buffered_right), labels
+        )
+        verified += buffered
+    if labels is None:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, candidates, verified, 0
+    rows = np.flatnonzero(labels != np.arange(document_count))
+    return rows, labels[rows], candidates, verified, int((sizes > max_bucket_size).sum())
+
+
+class NearDuplicateClusterProcessor:
+    """Group every stored signature into connected near-duplicate components.
+
+    Args:
+        index_dir: Directory holding the MinHashSignatureStore.
+        threshold: Jaccard threshold that fixes the LSH band layout. Default 0.5.
+        num_perm: MinHash permutation count. Default 128.
+        min_similarity: Minimum estimated Jaccard for a verified pair;
+                        None uses threshold.
+        max_workers: Worker process count; 0 uses os.cpu_count(), 1 runs inline.
+        max_bucket_size: Buckets larger than this only compare members with
+                         their first max_bucket_size members. Default 2048.
+        chunk_pairs: Candidate pairs generated per step (bounds memory).
+        verify_chunk_pairs: Pairs compared per numpy pass.
+
+    Returns:
+        NearDuplicateClusterReport from run().
+    """
+
+    def __init__(
+        self,
+        index_dir: str | Path,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        min_similarity: Optional[float] = None,
+        max_workers: int = 0,
+        max_bucket_size: int = DEFAULT_MAX_BUCKET_SIZE,
+        chunk_pairs: int = DEFAULT_CHUNK_PAIRS,
+        verify_chunk_pairs: int = DEFAULT_VERIFY_CHUNK_PAIRS,
+    ) -> None:
+        from datasketch import MinHashLSH
+
+        self.index_dir = Path(index_dir)
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.min_similarity = threshold if min_similarity is None else min_similarity
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_bucket_size = max_bucket_size
+        self.chunk_pairs = chunk_pairs
+        self.verify_chunk_pairs = verify_chunk_pairs
+        lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        self.bands, self.rows_per_band = lsh.b, lsh.r
+
+    def _write_band_keys(self, corpus: np.ndarray, keys_path: Path) -> None:
+        """Write the (bands, documents) band key matrix in bounded row chunks."""
+        keys = np.memmap(
+            keys_path, dtype=SIGNATURE_DTYPE, mode="w+", shape=(self.bands, len(corpus))
+        )
+        for start in range(0, len(corpus), DEFAULT_KEY_CHUNK_ROWS):
+            stop = start + DEFAULT_KEY_CHUNK_ROWS
+            keys[:, start:stop] = band_keys(corpus[start:stop], self.bands, self.rows_per_band).T
+        keys.flush()
+        del keys
+
+    def _band_results(self, task_args: list[tuple]) -> Iterator[tuple]:
+        """Run the band tasks inline or on the process pool, in band order."""
+        if self.max_workers == 1 or len(task_args) <= 1:
+            for args in task_args:
+                yield _cluster_band(*args)
+            return
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(task_args))) as pool:
+            yield from pool.map(_cluster_band, *zip(*task_args))
+
+    def run(
+        self, output_dir: str | Path, include_singletons: bool = False
+    ) -> NearDuplicateClusterReport:
+        """Cluster the corpus and write the cluster assignment Parquet.
+
+        Args:
+            output_dir: Directory for near_duplicate_clusters.parquet.
+            include_singletons: Also write documents with no near-duplicate.
+
+        Returns:
+            NearDuplicateClusterReport with cluster and pair counts.
+        """
+        started = time.perf_counter()
+        store = MinHashSignatureStore(self.index_dir, num_perm=self.num_perm)
+        corpus = store.matrix()
+        document_count = len(corpus)
+        log.info(
+            "near_duplicate_clustering_started",
+            document_count=document_count,
+            bands=self.bands,
+            max_workers=self.max_workers,
+        )
+
+        labels = np.arange(document_count, dtype=np.int64)
+        candidates = verified = oversized = 0
+        scratch = Path(tempfile.mkdtemp(prefix="near_duplicate_bands_", dir=self.index_dir))
+        try:
+            keys_path = scratch / "band_keys.u64"
+            if document_count:
+                self._write_band_keys(corpus, keys_path)
+            task_args = [
+                (
+                    band,
+                    str(keys_path),
+                    document_count,
+                    str(store.data_path),
+                    self.num_perm,
+                    self.min_similarity,
+                    self.max_bucket_size,
+                    self.chunk_pairs,
+                    self.verify_chunk_pairs,
+                )
+                for band in range(self.bands if document_count else 0)
+            ]
+            for rows, band_labels, pairs, kept, big in self._band_results(task_args):
+                labels = connected_components(document_count, rows, band_labels, labels)
+                candidates += pairs
+                verified += kept
+                oversized += big
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+        sizes = np.bincount(labels, minlength=document_count)[labels]
+        parquet_path = NearDuplicateClusterWriter().write(
+            document_ids=store.document_ids[:document_count],
+            cluster_rows=labels,
+            cluster_sizes=sizes,
+            output_dir=Path(output_dir),
+            include_singletons=include_singletons,
+        )
+        clustered = sizes > 1
+        report = NearDuplicateClusterReport(
+            document_count=document_count,
+            cluster_count=int(np.count_nonzero(clustered & (labels == np.arange(document_count)))),
+            clustered_document_count=int(clustered.sum()),
+            largest_cluster_size=int(sizes.max()) if document_count else 0,
+            candidate_pair_count=candidates,
+            verified_pair_count=verified,
+            oversized_bucket_count=oversized,
+            parquet_path=str(parquet_path),
+            wall_seconds=time.perf_counter() - started,
+        )
+        log.info(
+            "near_duplicate_clustering_completed",
+            document_count=report.document_count,
+            cluster_count=report.cluster_count,
+            clustered_document_count=report.clustered_document_count,
+            verified_pair_count=report.verified_pair_count,
+            wall_seconds=round(report.wall_seconds, 3),
+        )
+        return report
@@ -0,0 +1,271 @@
+"""
+File Name: near_duplicate_query_service.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: NearDuplicateQueryService — batch near-duplicate queries over the
+             corpus signatures: LSH banding finds candidates for many query
+             signatures at once, and a vectorized comparison of signature
+             matrices verifies them, returning the top-k neighbours per query
+             with their estimated Jaccard similarity.
+
+Note: Uses the same band layout (b bands of r rows) MinHashLSH picks for the
+      threshold and num_perm, so the candidate set of a query equals what
+      IncrementalLshIndex(...).load().query() returns.  Band keys are the
+      same 64-bit band_keys() mixes the index file stores, computed for the
+      whole MinHashSignatureStore matrix in numpy; per band the keys are
+      sorted once (with the end of each run of equal keys), and sorted query
+      keys are joined against them with one searchsorted per band instead
+      of per-query dict lookups.
+      Candidates are verified by the fraction of equal MinHash values
+      (MinHash.jaccard), filtered by min_similarity and ranked.
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+from docfp.models.near_duplicate_match import NearDuplicateMatch
+from docfp.processors.lsh_index_builder import DEFAULT_NUM_PERM, DEFAULT_THRESHOLD
+from docfp.processors.lsh_index_file import band_keys
+from docfp.processors.minhash_signature_store import SIGNATURE_DTYPE, MinHashSignatureStore
+
+if TYPE_CHECKING:
+    from datasketch import MinHash
+
+log = get_logger(__name__)
+
+DEFAULT_TOP_K = 10
+DEFAULT_VERIFY_CHUNK_PAIRS = 65_536  # candidate pairs compared per numpy pass
+
+
+class NearDuplicateQueryService:
+    """Top-k near-duplicate search over a MinHashSignatureStore.
+
+    Args:
+        index_dir: Directory holding the signature store (the corpus index dir).
+        threshold: Jaccard threshold that fixes the LSH band layout and the
+                   default min_similarity. Default 0.5.
+        num_perm: MinHash permutation count. Default 128.
+        verify_chunk_pairs: Candidate pairs verified per numpy pass; bounds
+                            the temporary (pairs, num_perm) comparison.
+
+    Returns:
+        NearDuplicateQueryService instance; call refresh() to see documents
+        appended after construction.
+    """
+
+    def __init__(
+        self,
+        index_dir: str | Path,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        verify_chunk_pairs: int = DEFAULT_VERIFY_CHUNK_PAIRS,
+    ) -> None:
+        from datasketch import MinHashLSH
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.verify_chunk_pairs = verify_chunk_pairs
+        lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        self.bands, self.rows_per_band = lsh.b, lsh.r
+        self.store = MinHashSignatureStore(index_dir, num_perm=num_perm)
+        self._keys = np.empty((0, self.bands), dtype=SIGNATURE_DTYPE)
+        self._sorted_keys = np.empty((self.bands, 0), dtype=SIGNATURE_DTYPE)
+        self._sorted_rows = np.empty((self.bands, 0), dtype=np.int64)
+        self._run_ends = np.empty((self.bands, 0), dtype=np.int64)
+        self.refresh()
+
+    def refresh(self) -> int:
+        """Index signatures appended to the store since the last refresh.
+
+        Args:
+            None.
+
+        Returns:
+            Number of indexed corpus documents.
+        """
+        indexed = len(self._keys)
+        rows = self.store.refresh()
+        if rows > indexed:
+            new_keys = band_keys(self.store.matrix()[indexed:], self.bands, self.rows_per_band)
+            self._keys = np.concatenate([self._keys, new_keys])
+            order = np.argsort(self._keys, axis=0, kind="stable").T
+            self._sorted_rows = np.ascontiguousarray(order)
+            self._sorted_keys = np.take_along_axis(self._keys.T, order, axis=1)
+            run_starts = np.ones_like(self._sorted_keys, dtype=bool)
+            run_starts[:, 1:] = self._sorted_keys[:, 1:] != self._sorted_keys[:, :-1]
+            self._run_ends = np.empty_like(self._sorted_rows)
+            for band in range(self.bands):
+                starts = np.flatnonzero(run_starts[band])
+                ends = np.r_[starts[1:], rows]
+                self._run_ends[band] = ends[np.cumsum(run_starts[band]) - 1]
+            log.info(
+                "near_duplicate_index_refreshed",
+                index_dir=str(self.store.index_dir),
+                added=rows - indexed,
+                document_count=rows,
+            )
+        return rows
+
+    def _candidates(self, query_keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return unique (query index, store row) pairs sharing at least one band."""
+        corpus = len(self._keys)
+        if not corpus:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        pair_codes = []
+        for band in range(self.bands):
+            keys = self._sorted_keys[band]
+            wanted = query_keys[:, band]
+            order = np.argsort(wanted)  # ascending probes keep searchsorted cache-local
+            lo = np.empty(len(wanted), dtype=np.int64)
+            lo[order] = np.searchsorted(keys, wanted[order])
+            at = np.minimum(lo, corpus - 1)
+            counts = np.where(keys[at] == wanted, self._run_ends[band][at] - lo, 0)
+            total = int(counts.sum())
+            if not total:
+                continue
+            starts = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+            rows = self._sorted_rows[band][starts + np.arange(total)]
+            queries = np.repeat(np.arange(len(query_keys), dtype=np.int64), counts)
+            pair_codes.append(queries * corpus + rows)
+        if not pair_codes:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        codes = np.unique(np.concatenate(pair_codes))
+        return codes // corpus, codes % corpus
+
+    def query_matrix(
+        self,
+        signatures: np.ndarray,
+        top_k: Optional[int] = DEFAULT_TOP_K,
+        min_similarity: Optional[float] = None,
+        exclude_rows: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized batch query; the building block of the other query methods.
+
+        Args:
+            signatures: (queries, num_perm) array of MinHash values.
+            top_k: Neighbours kept per query; None keeps every verified match.
+            min_similarity: Minimum estimated Jaccard; defaults to threshold.
+            exclude_rows: Optional per-query store row to drop from that
+                          query's results (-1 = none), e.g. the query itself.
+
+        Returns:
+            Tuple of equal-length arrays (query index, store row, similarity),
+            grouped by query index and sorted by descending similarity.
+        """
+        queries = np.asarray(signatures, dtype=SIGNATURE_DTYPE).reshape(-1, self.num_perm)
+        min_similarity = self.threshold if min_similarity is None else min_similarity
+        query_idx, rows = self._candidates(
+            band_keys(queries, self.bands, self.rows_per_band)
+        )
+        if exclude_rows is not None:
+            keep = rows != np.asarray(exclude_rows, dtype=np.int64)[query_idx]
+            query_idx, rows = query_idx[keep], rows[keep]
+
+        corpus = self.store.matrix()
+        similarity = np.empty(len(rows), dtype=np.float64)
+        for start in range(0, len(rows), self.verify_chunk_pairs):
+            stop = start + self.verify_chunk_pairs
+            equal = queries[query_idx[start:stop]] == corpus[rows[start:stop]]
+            similarity[start:stop] = np.count_nonzero(equal, axis=1) / self.num_perm
+
+        keep = similarity >= min_similarity
+        query_idx, rows, similarity = query_idx[keep], rows[keep], similarity[keep]
+        order = np.lexsort((rows, -similarity, query_idx))
+        query_idx, rows, similarity = query_idx[order], rows[order], similarity[order]
+        if top_k is not None and len(query_idx):
+            group_start = np.flatnonzero(np.r_[True, query_idx[1:] != query_idx[:-1]])
+            group_size = np.diff(np.r_[group_start, len(query_idx)])
+            rank = np.arange(len(query_idx)) - np.repeat(group_start, group_size)
+            keep = rank < top_k
+            query_idx, rows, similarity = query_idx[keep], rows[keep], similarity[keep]
+        return query_idx, rows, similarity
+
+    def _matches(
+        self, query_ids: list[str], results: tuple[np.ndarray, np.ndarray, np.ndarray]
+    ) -> dict[str, list[NearDuplicateMatch]]:
+        document_ids = self.store.document_ids
+        matches: dict[str, list[NearDuplicateMatch]] = {q: [] for q in query_ids}
+        for q, row, sim in zip(*(a.tolist() for a in results)):
+            matches[query_ids[q]].append(NearDuplicateMatch(document_ids[row], sim, row))
+        return matches
+
+    def query_batch(
+        self,
+        signatures: dict[str, MinHash],
+        top_k: Optional[int] = DEFAULT_TOP_K,
+        min_similarity: Optional[float] = None,
+    ) -> dict[str, list[NearDuplicateMatch]]:
+        """Find near-duplicates of many query signatures in one pass.
+
+        Args:
+            signatures: Mapping of query id → MinHash (any hashable-to-str id).
+            top_k: Neighbours kept per query; None keeps every verified match.
+            min_similarity: Minimum estimated Jaccard; defaults to threshold.
+
+        Returns:
+            Mapping of query id → matches, most similar first.
+        """
+        query_ids = list(signatures)
+        matrix = np.empty((len(query_ids), self.num_perm), dtype=SIGNATURE_DTYPE)
+        for i, query_id in enumerate(query_ids):
+            matrix[i] = signatures[query_id].hashvalues
+        results = self.query_matrix(matrix, top_k=top_k, min_similarity=min_similarity)
+        log.info(
+            "near_duplicate_batch_queried",
+            query_count=len(query_ids),
+            match_count=len(results[0]),
+        )
+        return self._matches(query_ids, results)
+
+    def query_documents(
+        self,
+        document_ids: list[str],
+        top_k: Optional[int] = DEFAULT_TOP_K,
+        min_similarity: Optional[float] = None,
+        include_self: bool = False,
+    ) -> dict[str, list[NearDuplicateMatch]]:
+        """Find near-duplicates of documents already in the signature store.
+
+        Args:
+            document_ids: Stored document_ids to use as queries.
+            top_k: Neighbours kept per query; None keeps every verified match.
+            min_similarity: Minimum estimated Jaccard; defaults to threshold.
+            include_self: Keep each document's match with itself.
+
+        Returns:
+            Mapping of document_id → matches, most similar first.
+
+        Raises:
+            KeyError: If a document_id is not in the signature store.
+        """
+        query_ids = list(dict.fromkeys(document_ids))
+        rows = [self.store.row_of(d) for d in query_ids]
+        missing = [d for d, row in zip(query_ids, rows) if row is None]
+        if missing:
+            raise KeyError(
+                f"{len(missing)} document_id(s) not in the signature store: {missing[:5]}"
+            )
+        rows = np.asarray(rows, dtype=np.int64)
+        results = self.query_matrix(
+            self.store.matrix()[rows],
+            top_k=top_k,
+            min_similarity=min_similarity,
+            exclude_rows=None if include_self else rows,
+        )
+        log.info(
+            "near_duplicate_documents_queried",
+            query_count=len(query_ids),
+            match_count=len(results[0]),
+        )
+        return self._matches(query_ids, results)
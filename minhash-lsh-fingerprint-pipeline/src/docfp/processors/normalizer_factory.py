@@ -0,0 +1,47 @@
+"""
+File Name: normalizer_factory.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: build_normalizer — maps a normalization_version to its Normalizer
+             implementation so Dagster resources and batch worker processes
+             resolve rule sets the same way (FR-010, ADR-004).
+
+Note: 'v1' is the original TextNormalizer; 'v2' is FusedTextNormalizer, which
+      produces identical text and tokens in a single pass.  The versions are
+      kept apart in cache and registry keys, so switching an existing corpus
+      from v1 to v2 re-normalizes cached text and does not match v1
+      registrations in the exact-duplicate short-circuit.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from docfp.interfaces.normalizer import Normalizer
+from docfp.processors.fused_text_normalizer import FusedTextNormalizer
+from docfp.processors.text_normalizer import TextNormalizer
+
+DEFAULT_NORMALIZATION_VERSION = "v2"
+
+_NORMALIZERS: dict[str, type[TextNormalizer]] = {
+    "v1": TextNormalizer,
+    "v2": FusedTextNormalizer,
+}
+
+
+def build_normalizer(
+    normalization_version: str = DEFAULT_NORMALIZATION_VERSION, remove_stopwords: bool = False
+) -> Normalizer:
+    """Return the Normalizer implementation for a normalization version.
+
+    Args:
+        normalization_version: Rule set version. Supported values: 'v1', 'v2'.
+        remove_stopwords: Whether the normalizer removes stopwords.
+
+    Returns:
+        Normalizer instance for the requested version.
+    """
+    if normalization_version not in _NORMALIZERS:
+        raise ValueError(f"Unsupported normalization version: {normalization_version!r}")
+    return _NORMALIZERS[normalization_version](remove_stopwords=remove_stopwords)
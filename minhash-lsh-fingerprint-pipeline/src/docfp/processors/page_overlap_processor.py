@@ -0,0 +1,169 @@
+"""
+File Name: page_overlap_processor.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: PageOverlapProcessor — answers "which pages of document A share
+             content with which pages of document B" from the page_no and
+             shingle_hash64 columns of two shingle sets, without re-running a
+             whole-document comparison.
+
+Note: Each document is reduced to its distinct (page, hash) pairs.  The two
+      sides are joined on hash in one sorted pass, every shared hash
+      contributes one count to each (page_a, page_b) combination it appears
+      on, and the counts give exact per-page-pair shingle overlap and
+      Jaccard.  Shingles of documents fingerprinted without page positions
+      are all page 0.  Inputs are hashed ShingleBatch objects or
+      {doc}_shingle.parquet files (only two columns are read).
+
+Requirements:
+- numpy
+- pyarrow>=18
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+from docfp.models.page_overlap import PageOverlap
+from docfp.models.shingle_batch import ShingleBatch
+
+log = get_logger(__name__)
+
+
+def _page_hashes(hashes: np.ndarray, pages: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return distinct (hash, page) pairs sorted by hash, then page."""
+    pairs = np.unique(
+        np.rec.fromarrays(
+            [np.asarray(hashes).view(np.uint64), np.asarray(pages, dtype=np.int64)],
+            names="hash,page",
+        )
+    )
+    return pairs["hash"], pairs["page"]
+
+
+class PageOverlapProcessor:
+    """Compute exact shingle overlap between the pages of two documents.
+
+    Args:
+        min_shared: Minimum shared shingles for a page pair to be reported.
+        min_jaccard: Minimum page-pair Jaccard to be reported. Default 0.0.
+
+    Returns:
+        List of PageOverlap, highest shared_shingles first.
+    """
+
+    def __init__(self, min_shared: int = 1, min_jaccard: float = 0.0) -> None:
+        self.min_shared = min_shared
+        self.min_jaccard = min_jaccard
+
+    def overlap_arrays(
+        self,
+        hashes_a: np.ndarray,
+        pages_a: np.ndarray,
+        hashes_b: np.ndarray,
+        pages_b: np.ndarray,
+    ) -> list[PageOverlap]:
+        """Compare two documents given their shingle hash and page columns.
+
+        Args:
+            hashes_a: uint64 (or same-bits int64) shingle hashes of document A.
+            pages_a: Page of each shingle of document A.
+            hashes_b: Shingle hashes of document B.
+            pages_b: Page of each shingle of document B.
+
+        Returns:
+            Page pairs meeting min_shared and min_jaccard, ordered by
+            shared_shingles descending, then page_a and page_b.
+        """
+        hash_a, page_a = _page_hashes(hashes_a, pages_a)
+        hash_b, page_b = _page_hashes(hashes_b, pages_b)
+        pages_of_a, sizes_a = np.unique(page_a, return_counts=True)
+        pages_of_b, sizes_b = np.unique(page_b, return_counts=True)
+
+        shared = np.intersect1d(hash_a, hash_b)
+        lo_a, hi_a = np.searchsorted(hash_a, shared), np.searchsorted(hash_a, shared, "right")
+        lo_b, hi_b = np.searchsorted(hash_b, shared), np.searchsorted(hash_b, shared, "right")
+        count_a, count_b = hi_a - lo_a, hi_b - lo_b
+        combos = count_a * count_b  # page combinations each shared hash contributes to
+        owner = np.repeat(np.arange(len(shared)), combos)
+        local = np.arange(int(combos.sum())) - np.repeat(np.cumsum(combos) - combos, combos)
+        rows_a = lo_a[owner] + local // count_b[owner]
+        rows_b = lo_b[owner] + local % count_b[owner]
+
+        idx_a = np.searchsorted(pages_of_a, page_a[rows_a])
+        idx_b = np.searchsorted(pages_of_b, page_b[rows_b])
+        pair_keys, counts = np.unique(idx_a * len(pages_of_b) + idx_b, return_counts=True)
+        pair_a, pair_b = np.divmod(pair_keys, max(len(pages_of_b), 1))
+        jaccard = counts / (sizes_a[pair_a] + sizes_b[pair_b] - counts)
+
+        keep = (counts >= self.min_shared) & (jaccard >= self.min_jaccard)
+        order = np.lexsort((pair_b[keep], pair_a[keep], -counts[keep]))
+        return [
+            PageOverlap(page_a=int(pa), page_b=int(pb), shared_shingles=int(c), jaccard=float(j))
+            for pa, pb, c, j in zip(
+                pages_of_a[pair_a[keep][order]],
+                pages_of_b[pair_b[keep][order]],
+                counts[keep][order],
+                jaccard[keep][order],
+            )
+        ]
+
+    def overlap(self, batch_a: ShingleBatch, batch_b: ShingleBatch) -> list[PageOverlap]:
+        """Compare the pages of two hashed ShingleBatch objects.
+
+        Args:
+            batch_a: Hashed shingles of document A.
+            batch_b: Hashed shingles of document B.
+
+        Returns:
+            Page pairs meeting the thresholds (see overlap_arrays).
+        """
+
+        def pages(batch: ShingleBatch) -> np.ndarray:
+            if batch.page_no is not None:
+                return batch.page_no
+            return np.zeros(len(batch), dtype=np.int32)
+
+        result = self.overlap_arrays(
+            batch_a.shingle_hash64, pages(batch_a), batch_b.shingle_hash64, pages(batch_b)
+        )
+        log.info(
+            "page_overlap_computed",
+            document_a=batch_a.document_id,
+            document_b=batch_b.document_id,
+            page_pair_count=len(result),
+        )
+        return result
+
+    def overlap_parquet(self, path_a: Path, path_b: Path) -> list[PageOverlap]:
+        """Compare the pages of two {doc}_shingle.parquet files.
+
+        Args:
+            path_a: Shingle Parquet file of document A.
+            path_b: Shingle Parquet file of document B.
+
+        Returns:
+            Page pairs meeting the thresholds (see overlap_arrays).
+        """
+        import pyarrow.parquet as pq
+
+        columns = ["shingle_hash64", "page_no"]
+        table_a = pq.read_table(path_a, columns=columns)
+        table_b = pq.read_table(path_b, columns=columns)
+        result = self.overlap_arrays(
+            table_a["shingle_hash64"].to_numpy(),
+            table_a["page_no"].to_numpy(),
+            table_b["shingle_hash64"].to_numpy(),
+            table_b["page_no"].to_numpy(),
+        )
+        log.info(
+            "page_overlap_computed",
+            document_a=str(path_a),
+            document_b=str(path_b),
+            page_pair_count=len(result),
+        )
+        return result
@@ -0,0 +1,113 @@
+"""
+File Name: page_segment_processor.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: PageSegmentProcessor — maps the normalized token stream of a
+             document back to the page and section each token came from, so
+             shingles carry real page_no / section_id values.
+
+Note: Positions are stored run-length encoded on NormalizedText.page_runs as
+      [{'page', 'section', 'tokens'}, ...] in token order, which is small
+      enough to cache and pass between assets; token_positions() expands
+      them to per-token int32 arrays for the shingle generator.  Each
+      page/section chunk is normalized on its own, which equals the tokens
+      of the whole text because extractors split pages and sections on
+      whitespace.  When the counts do not add up to the document's token
+      count (a chunk boundary inside a word), no runs are returned and the
+      document is shingled without page positions rather than with wrong
+      ones.
+
+Requirements:
+- numpy
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+import numpy as np
+
+from docfp.interfaces.normalizer import Normalizer
+from docfp.logging_config import get_logger
+
+log = get_logger(__name__)
+
+
+class PageSegmentProcessor:
+    """Attribute normalized tokens to the pages and sections of the source.
+
+    Returns:
+        page_runs lists from token_runs(); per-token arrays from
+        token_positions().
+    """
+
+    def token_runs(
+        self,
+        pages: list[dict[str, Any]],
+        normalizer: Normalizer,
+        token_count: int,
+        document_id: str = "",
+    ) -> list[dict[str, int]]:
+        """Count the normalized tokens of every page and section chunk.
+
+        Args:
+            pages: ExtractedDocumentText.pages — {'page', 'text'} chunks,
+                   optionally with 'sections' (list of str).
+            normalizer: Normalizer that produced the document's tokens.
+            token_count: Token count of the whole normalized document.
+            document_id: SHA-256 identifier for logging context.
+
+        Returns:
+            Runs [{'page', 'section', 'tokens'}, ...] in token order, with
+            empty runs dropped and adjacent equal positions merged; [] when
+            pages is empty or the counts do not match token_count.
+        """
+        runs: list[dict[str, int]] = []
+        for chunk in pages:
+            for section, text in enumerate(chunk.get("sections") or [chunk["text"]]):
+                tokens = sum(1 for _ in normalizer.iter_tokens([text]))
+                if not tokens:
+                    continue
+                if runs and (runs[-1]["page"], runs[-1]["section"]) == (chunk["page"], section):
+                    runs[-1]["tokens"] += tokens
+                else:
+                    runs.append({"page": chunk["page"], "section": section, "tokens": tokens})
+
+        mapped = sum(run["tokens"] for run in runs)
+        if runs and mapped != token_count:
+            log.warning(
+                "page_runs_mismatch",
+                document_id=document_id,
+                mapped_token_count=mapped,
+                token_count=token_count,
+            )
+            return []
+        log.info(
+            "page_runs_computed",
+            document_id=document_id,
+            run_count=len(runs),
+            page_count=len({run["page"] for run in runs} - {0}),
+        )
+        return runs
+
+    def token_positions(
+        self, page_runs: list[dict[str, int]], token_count: int
+    ) -> tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Expand page runs to per-token page and section arrays.
+
+        Args:
+            page_runs: Runs returned by token_runs() (may be empty).
+            token_count: Number of tokens in the document.
+
+        Returns:
+            Tuple of int32 arrays (page_no, section_id) of length
+            token_count, or (None, None) when the runs do not cover exactly
+            token_count tokens.
+        """
+        lengths = np.array([run["tokens"] for run in page_runs], dtype=np.int64)
+        if not page_runs or int(lengths.sum()) != token_count:
+            return None, None
+        page_no = np.repeat(np.array([run["page"] for run in page_runs], np.int32), lengths)
+        section_id = np.repeat(np.array([run["section"] for run in page_runs], np.int32), lengths)
+        return page_no, section_id
@@ -6,45 +6,37 @@ Description: PartitionSignatureMerger — merges per-partition sorted unique shi
              hash sets and MinHash states into a single document-level signature
              (FR-026, ADR-011).
 
+Note: The merged signatures equal those of the unpartitioned document: the
+      hash signature is taken over the sorted union of digests and the
+      MinHash is the slot-wise minimum of the partition MinHashes.
+
 Requirements:
 - datasketch>=1.6
+- numpy
 - Python 3.12+
 """
 
 from __future__ import annotations
 
 import hashlib
-import logging
-import os
-from datetime import datetime
-
-import structlog
-from datasketch import MinHash
-
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from datasketch import MinHash
+
+log = get_logger(__name__)
 
 
 class PartitionSignatureMerger:
     """Merge per-partition shingle hash sets into a document-level signature.
 
     Args:
-        partition_hash_sets: List of sets of shingle_hash_sha256 strings,
-                             one set per partition.
+        partition_hash_sets: List of shingle_hash_sha256 collections (sets of
+                             hex strings or 'S64' arrays), one per partition.
         partition_minhashes: List of datasketch.MinHash objects, one per
                              partition.
         document_id: SHA-256 document identifier (for logging).
@@ -53,51 +45,72 @@ class PartitionSignatureMerger:
         Tuple of (merged_hash_signature_sha256, merged_minhash, partition_merge_status).
     """
 
+    def merge_hash_sets(
+        self, partition_hash_sets: list[set[str] | np.ndarray]
+    ) -> tuple[str, int]:
+        """Hash the sorted union of every partition's shingle SHA-256 digests.
+
+        Args:
+            partition_hash_sets: Per-partition shingle SHA-256 hex digests.
+
+        Returns:
+            Tuple of (64-char hex signature, unique shingle hash count), equal
+            to DocumentHashSignatureProcessor.compute() over all shingles.
+        """
+        arrays = [
+            np.asarray(sorted(hs) if isinstance(hs, (set, frozenset)) else hs, dtype="S64")
+            for hs in partition_hash_sets
+        ]
+        unique = np.unique(np.concatenate(arrays)) if arrays else np.empty(0, dtype="S64")
+        return hashlib.sha256(unique.tobytes()).hexdigest(), len(unique)
+
+    def merge_minhashes(self, partition_minhashes: list[MinHash]) -> MinHash:
+        """Combine partition MinHashes by element-wise minimum of hashvalues.
+
+        Each slot of a MinHash is the minimum permuted hash over its input
+        set, so the slot-wise minimum over partitions is bit-identical to the
+        MinHash of the whole document.
+
+        Args:
+            partition_minhashes: Per-partition MinHash objects (same num_perm
+                                 and seed).
+
+        Returns:
+            datasketch.MinHash of the union of the partitions.
+        """
+        merged = partition_minhashes[0].copy()
+        for mh in partition_minhashes[1:]:
+            merged.merge(mh)  # element-wise minimum of hashvalues
+        return merged
+
     def merge(
         self,
-        partition_hash_sets: list[set[str]],
+        partition_hash_sets: list[set[str] | np.ndarray],
         partition_minhashes: list[MinHash],
         document_id: str,
     ) -> tuple[str, MinHash, str]:
         """Merge partition-level artifacts into a single document signature.
 
         Args:
-            partition_hash_sets: Per-partition sets of shingle SHA-256 hashes.
+            partition_hash_sets: Per-partition shingle SHA-256 hex digests.
             partition_minhashes: Per-partition datasketch MinHash objects.
             document_id: SHA-256 document identifier.
 
         Returns:
             Tuple of:
               - merged_hash_signature_sha256: SHA-256 over sorted union of all hashes
-              - merged_minhash: MinHash built from the combined unique hash set
+              - merged_minhash: element-wise minimum of the partition MinHashes
               - partition_merge_status: 'single-partition' or 'merged-partition'
         """
-        unified: set[str] = set()
-        for hs in partition_hash_sets:
-            unified.update(hs)
-
-        sorted_hashes = sorted(unified)
-        combined = "".join(sorted_hashes).encode("utf-8")
-        merged_sig = hashlib.sha256(combined).hexdigest()
-
-        # Rebuild a MinHash from the unified hash set
-        from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder  # noqa: PLC0415
-
-        num_perm = partition_minhashes[0].hashvalues.shape[0] if partition_minhashes else 128
-        builder = MinHashSignatureBuilder(num_perm=num_perm)
-        import xxhash  # noqa: PLC0415
-
-        merged_mh = builder.build(
-            [xxhash.xxh64(h.encode("utf-8")).intdigest() for h in sorted_hashes],
-            document_id=document_id,
-        )
+        merged_sig, unique_count = self.merge_hash_sets(partition_hash_sets)
+        merged_mh = self.merge_minhashes(partition_minhashes)
 
         status = "single-partition" if len(partition_hash_sets) <= 1 else "merged-partition"
         log.info(
             "partitions_merged",
             document_id=document_id,
             partition_count=len(partition_hash_sets),
-            unique_hash_count=len(unified),
+            unique_hash_count=unique_count,
             merge_status=status,
         )
         return merged_sig, merged_mh, status
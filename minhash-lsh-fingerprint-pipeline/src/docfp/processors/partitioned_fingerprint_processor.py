@@ -0,0 +1,203 @@
+"""
+File Name: partitioned_fingerprint_processor.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: PartitionedFingerprintProcessor — the large-document path.  A
+             document's tokens are split by DocumentPartitionProcessor, each
+             partition is shingled and hashed in a worker process, and the
+             partial hash sets and MinHashes are merged by
+             PartitionSignatureMerger (FR-025, FR-026, ADR-011).
+
+Note: Partitions overlap by shingle_size - 1 tokens, so each worker produces
+      exactly the shingles starting in its own token range and no window is
+      lost or repeated at a boundary.  Workers return their hash columns, the
+      sorted unique SHA-256 digests and a partial MinHash; the parent
+      concatenates the columns in partition order and merges the rest.  The
+      hashed ShingleBatch, hash signature and MinHash are bit-identical to the
+      unpartitioned path (hash_batch → compute → build_batch).
+
+Requirements:
+- datasketch>=1.6
+- numpy
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import numpy as np
+
+from docfp.interfaces.shingle_hasher import ShingleHasher
+from docfp.logging_config import get_logger
+from docfp.models.partitioned_fingerprint import PartitionedFingerprint
+from docfp.models.shingle_batch import ShingleBatch
+from docfp.processors.document_partition_processor import (
+    DEFAULT_PARTITION_SIZE,
+    DocumentPartitionProcessor,
+)
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+from docfp.processors.partition_signature_merger import PartitionSignatureMerger
+from docfp.processors.shingle_hash_processor import ShingleHashProcessor
+from docfp.processors.stage_timer import StageTimer, record_stage
+from docfp.processors.word_shingle_generator import WordShingleGenerator
+
+log = get_logger(__name__)
+
+
+def _fingerprint_partition(
+    document_id: str,
+    tokens: list[str],
+    partition_id: int,
+    partition_count: int,
+    shingle_size: int,
+    num_perm: int,
+    hasher: ShingleHasher,
+    normalization_version: str,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Shingle and hash one partition inside a worker process.
+
+    Args:
+        document_id: SHA-256 identifier for the source document.
+        tokens: The partition's tokens plus the overlap into the next one.
+        partition_id: Zero-based partition index.
+        partition_count: Total number of partitions.
+        shingle_size: Word-shingle window size.
+        num_perm: MinHash permutation count.
+        hasher: ShingleHasher applied to the partition's shingles.
+        normalization_version: Rule set that produced the tokens.
+
+    Returns:
+        Tuple of (shingle_hash64, shingle_hash_sha256, sorted unique
+        SHA-256 digests, partial MinHash hashvalues).
+    """
+    batch = hasher.hash_batch(
+        WordShingleGenerator(shingle_size=shingle_size).generate_batch(
+            document_id=document_id,
+            source_uri="",
+            file_name="",
+            tokens=tokens,
+            partition_id=partition_id,
+            partition_count=partition_count,
+            normalization_version=normalization_version,
+        )
+    )
+    builder = MinHashSignatureBuilder(num_perm=num_perm)
+    mh = builder.build_batch(batch.shingle_hash64, document_id)
+    return (
+        batch.shingle_hash64,
+        batch.shingle_hash_sha256,
+        np.unique(batch.shingle_hash_sha256),
+        mh.hashvalues,
+    )
+
+
+class PartitionedFingerprintProcessor:
+    """Hash a large document's shingles partition by partition in parallel.
+
+    Args:
+        shingle_size: Word-shingle window size (must match the batch). Default 5.
+        num_perm: MinHash permutation count. Default 128.
+        partition_size: Tokens per partition. Default 50 000.
+        hasher: ShingleHasher used in the workers (ShingleHashProcessor default).
+        max_workers: Worker processes; 0 uses os.cpu_count(), 1 hashes every
+                     partition in-process.
+
+    Returns:
+        PartitionedFingerprint from fingerprint_batch().
+    """
+
+    def __init__(
+        self,
+        shingle_size: int = 5,
+        num_perm: int = 128,
+        partition_size: int = DEFAULT_PARTITION_SIZE,
+        hasher: ShingleHasher | None = None,
+        max_workers: int = 0,
+    ) -> None:
+        if partition_size < shingle_size:
+            raise ValueError("partition_size must be at least shingle_size.")
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.partition_size = partition_size
+        self.hasher = hasher or ShingleHashProcessor()
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    @StageTimer("partitioned_fingerprint", unit="shingles", log_level="debug")
+    def fingerprint_batch(self, batch: ShingleBatch) -> PartitionedFingerprint:
+        """Hash an unhashed document ShingleBatch across token partitions.
+
+        Args:
+            batch: Output of WordShingleGenerator.generate_batch for the whole
+                   document (hash columns None).
+
+        Returns:
+            PartitionedFingerprint whose shingles are the input batch with
+            hash columns filled, plus the merged signatures.
+        """
+        if batch.shingle_size != self.shingle_size:
+            raise ValueError(
+                f"Batch was shingled with shingle_size={batch.shingle_size}, "
+                f"processor uses {self.shingle_size}."
+            )
+        tokens = batch.text.split(" ") if batch.text else []
+        partitions = DocumentPartitionProcessor(
+            partition_size=self.partition_size, overlap=self.shingle_size - 1
+        ).partition(tokens, batch.document_id)
+        task_args = [
+            (
+                batch.document_id,
+                part_tokens,
+                partition_id,
+                len(partitions),
+                self.shingle_size,
+                self.num_perm,
+                self.hasher,
+                batch.normalization_version,
+            )
+            for partition_id, part_tokens in partitions
+        ]
+        if self.max_workers == 1 or len(task_args) <= 1:
+            results = [_fingerprint_partition(*args) for args in task_args]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(task_args))) as pool:
+                results = list(pool.map(_fingerprint_partition, *zip(*task_args)))
+
+        hash64, sha256, unique_sha256, hashvalues = zip(*results)
+        hashed = replace(
+            batch,
+            shingle_hash64=np.concatenate(hash64),
+            shingle_hash_sha256=np.concatenate(sha256),
+        )
+        if len(hashed.shingle_hash64) != len(batch):
+            raise RuntimeError(
+                f"Partitions produced {len(hashed.shingle_hash64)} shingles, "
+                f"expected {len(batch)}."
+            )
+        builder = MinHashSignatureBuilder(num_perm=self.num_perm)
+        merger = PartitionSignatureMerger()
+        sig_sha256, unique_count = merger.merge_hash_sets(list(unique_sha256))
+        mh = merger.merge_minhashes([builder.from_hashvalues(values) for values in hashvalues])
+        status = "merged-partition" if len(partitions) > 1 else "single-partition"
+        record_stage(items=len(batch))
+        log.info(
+            "partitioned_fingerprint_completed",
+            document_id=batch.document_id,
+            token_count=len(tokens),
+            shingle_count=len(batch),
+            unique_hash_count=unique_count,
+            partition_count=len(partitions),
+            max_workers=self.max_workers,
+        )
+        return PartitionedFingerprint(
+            document_id=batch.document_id,
+            shingles=hashed,
+            partition_count=len(partitions),
+            partition_merge_status=status,
+            total_shingle_count=len(batch),
+            unique_shingle_hash_count=unique_count,
+            hash_signature_sha256=sig_sha256,
+            minhash=mh,
+        )
@@ -0,0 +1,332 @@
+"""
+File Name: sharded_lsh_index.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: ShardedLshIndex — the corpus LSH index split into shard_count
+             independent IncrementalLshIndex shards, partitioned by a stable
+             hash of document_id.  Appends, compactions and queries fan out
+             across shards on a process pool and the results are merged.
+
+Note: Each shard is a complete LSH index over its slice of the corpus,
+      persisted in its own lsh_shards/shard_NNN/ directory with its own
+      snapshot, log, manifest and lock, so shards build, compact and load
+      independently and no process ever maps the whole corpus.  A
+      query is answered by every shard and the candidate lists are unioned,
+      which is exactly the single-index answer.  Shard placement depends
+      only on document_id, so a shard (or a subset passed via shards=) can
+      be served from another node.  lsh_shards/manifest.json pins
+      shard_count, threshold and num_perm.
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+from docfp.processors.incremental_lsh_index import (
+    DEFAULT_COMPACTION_RATIO,
+    DEFAULT_MIN_COMPACTION_ENTRIES,
+    IncrementalLshIndex,
+)
+from docfp.processors.lsh_index_builder import DEFAULT_NUM_PERM, DEFAULT_THRESHOLD
+from docfp.processors.lsh_index_file import MappedLshIndex
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+
+if TYPE_CHECKING:
+    from datasketch import MinHash
+
+log = get_logger(__name__)
+
+LSH_SHARD_DIR = "lsh_shards"
+LSH_SHARD_MANIFEST_FILE = "manifest.json"
+DEFAULT_SHARD_COUNT = 8
+
+
+def shard_of(document_id: str, shard_count: int) -> int:
+    """Return the shard owning document_id (stable across processes and hosts).
+
+    Args:
+        document_id: Document identifier.
+        shard_count: Total number of shards.
+
+    Returns:
+        Shard number in [0, shard_count).
+    """
+    digest = hashlib.blake2b(document_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") % shard_count
+
+
+def _shard_index(
+    shard_dir: str, threshold: float, num_perm: int, compaction: tuple
+) -> IncrementalLshIndex:
+    return IncrementalLshIndex(
+        Path(shard_dir),
+        threshold=threshold,
+        num_perm=num_perm,
+        compaction_ratio=compaction[0],
+        min_compaction_entries=compaction[1],
+    )
+
+
+def _append_shard(
+    shard_dir: str,
+    threshold: float,
+    num_perm: int,
+    compaction: tuple,
+    document_ids: list[str],
+    hashvalues: np.ndarray,
+) -> int:
+    """Append one shard's signatures inside a worker process.
+
+    Args:
+        shard_dir: Shard directory.
+        threshold: Jaccard threshold of the index.
+        num_perm: MinHash permutation count.
+        compaction: (compaction_ratio, min_compaction_entries) of the shard.
+        document_ids: document_id of each hashvalues row.
+        hashvalues: (len(document_ids), num_perm) signature values.
+
+    Returns:
+        Number of signatures appended.
+    """
+    builder = MinHashSignatureBuilder(num_perm=num_perm)
+    _shard_index(shard_dir, threshold, num_perm, compaction).append(
+        {doc_id: builder.from_hashvalues(row) for doc_id, row in zip(document_ids, hashvalues)}
+    )
+    return len(document_ids)
+
+
+def _compact_shard(shard_dir: str, threshold: float, num_perm: int, compaction: tuple) -> str:
+    return str(_shard_index(shard_dir, threshold, num_perm, compaction).compact())
+
+
+def _query_shard(
+    shard_dir: str,
+    threshold: float,
+    num_perm: int,
+    compaction: tuple,
+    hashvalues: np.ndarray,
+) -> list[list[str]]:
+    """Map one shard and return the candidates of every query row.
+
+    Args:
+        shard_dir: Shard directory.
+        threshold: Jaccard threshold of the index.
+        num_perm: MinHash permutation count.
+        compaction: (compaction_ratio, min_compaction_entries) of the shard.
+        hashvalues: (queries, num_perm) query signature values.
+
+    Returns:
+        Candidate document_ids per query row, in row order.
+    """
+    if not Path(shard_dir).exists():  # no document has been routed here yet
+        return [[] for _ in range(len(hashvalues))]
+    return _shard_index(shard_dir, threshold, num_perm, compaction).load().query_batch(hashvalues)
+
+
+class ShardedLshIndex:
+    """Corpus LSH index partitioned by document_id hash into independent shards.
+
+    Args:
+        index_dir: Directory under which lsh_shards/ is created.
+        shard_count: Number of shards. Fixed once the index exists. Default 8.
+        threshold: Jaccard similarity threshold for LSH banding. Default 0.5.
+        num_perm: MinHash permutation count (must match signature builder).
+        max_workers: Worker processes for fan-out; 0 uses os.cpu_count(),
+                     1 runs every shard in-process.
+        compaction_ratio: Per-shard IncrementalLshIndex compaction ratio.
+        min_compaction_entries: Per-shard minimum log size before compaction.
+
+    Returns:
+        Merged candidate lists from query() / query_batch().
+    """
+
+    def __init__(
+        self,
+        index_dir: Path,
+        shard_count: int = DEFAULT_SHARD_COUNT,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        max_workers: int = 0,
+        compaction_ratio: float = DEFAULT_COMPACTION_RATIO,
+        min_compaction_entries: int = DEFAULT_MIN_COMPACTION_ENTRIES,
+    ) -> None:
+        if shard_count < 1:
+            raise ValueError(f"shard_count must be at least 1, got {shard_count}.")
+        self.index_dir = Path(index_dir)
+        self.shard_count = shard_count
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shard_root = self.index_dir / LSH_SHARD_DIR
+        self.manifest_path = self.shard_root / LSH_SHARD_MANIFEST_FILE
+        self._compaction = (compaction_ratio, min_compaction_entries)
+        self._check_manifest()
+
+    def _check_manifest(self) -> None:
+        if not self.manifest_path.exists():
+            return
+        manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        expected = {
+            "shard_count": self.shard_count,
+            "threshold": self.threshold,
+            "num_perm": self.num_perm,
+        }
+        if any(manifest[key] != value for key, value in expected.items()):
+            raise ValueError(
+                f"Sharded index at {self.shard_root} was built with "
+                f"shard_count={manifest['shard_count']}, threshold={manifest['threshold']}, "
+                f"num_perm={manifest['num_perm']}; got shard_count={self.shard_count}, "
+                f"threshold={self.threshold}, num_perm={self.num_perm}."
+            )
+
+    def _write_manifest(self) -> None:
+        self.shard_root.mkdir(parents=True, exist_ok=True)
+        if self.manifest_path.exists():
+            return
+        manifest = {
+            "shard_count": self.shard_count,
+            "threshold": self.threshold,
+            "num_perm": self.num_perm,
+            "partitioning": "blake2b64(document_id) % shard_count",
+        }
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+
+    def shard_dir(self, shard: int) -> Path:
+        """Return the directory of one shard."""
+        return self.shard_root / f"shard_{shard:03d}"
+
+    def shard(self, shard: int) -> IncrementalLshIndex:
+        """Return the IncrementalLshIndex backing one shard."""
+        return _shard_index(
+            str(self.shard_dir(shard)), self.threshold, self.num_perm, self._compaction
+        )
+
+    def _fan_out(self, fn, task_args: list[tuple]) -> Iterator:
+        """Run per-shard tasks inline or on the process pool, in task order."""
+        if self.max_workers == 1 or len(task_args) <= 1:
+            for args in task_args:
+                yield fn(*args)
+            return
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(task_args))) as pool:
+            yield from pool.map(fn, *zip(*task_args))
+
+    def append(self, signatures: dict[str, MinHash]) -> Path:
+        """Route signatures to their shards and append every shard in parallel.
+
+        Args:
+            signatures: Mapping of document_id → MinHash signature.
+
+        Returns:
+            Path of the sharded index manifest.
+        """
+        self._write_manifest()
+        grouped: dict[int, list[str]] = {}
+        for doc_id in signatures:
+            grouped.setdefault(shard_of(doc_id, self.shard_count), []).append(doc_id)
+        task_args = [
+            (
+                str(self.shard_dir(shard)),
+                self.threshold,
+                self.num_perm,
+                self._compaction,
+                doc_ids,
+                np.stack([signatures[doc_id].hashvalues for doc_id in doc_ids]),
+            )
+            for shard, doc_ids in sorted(grouped.items())
+        ]
+        appended = sum(self._fan_out(_append_shard, task_args))
+        log.info(
+            "sharded_lsh_index_appended",
+            index_dir=str(self.shard_root),
+            appended=appended,
+            shards_touched=len(task_args),
+        )
+        return self.manifest_path
+
+    def compact(self) -> Path:
+        """Fold every shard's append log into its snapshot, in parallel.
+
+        Args:
+            None.
+
+        Returns:
+            Path of the sharded index manifest.
+        """
+        self._write_manifest()
+        task_args = [
+            (str(self.shard_dir(shard)), self.threshold, self.num_perm, self._compaction)
+            for shard in range(self.shard_count)
+        ]
+        for _ in self._fan_out(_compact_shard, task_args):
+            pass
+        log.info("sharded_lsh_index_compacted", index_dir=str(self.shard_root))
+        return self.manifest_path
+
+    def query_batch(
+        self, signatures: dict[str, MinHash], shards: Optional[list[int]] = None
+    ) -> dict[str, list[str]]:
+        """Query every shard for every signature in parallel and merge.
+
+        Args:
+            signatures: Mapping of query key → MinHash signature.
+            shards: Shard numbers to query; None queries all of them.
+
+        Returns:
+            Mapping of query key → sorted candidate document_ids.
+        """
+        keys = list(signatures)
+        if not keys:
+            return {}
+        hashvalues = np.stack([signatures[key].hashvalues for key in keys])
+        task_args = [
+            (
+                str(self.shard_dir(shard)),
+                self.threshold,
+                self.num_perm,
+                self._compaction,
+                hashvalues,
+            )
+            for shard in (range(self.shard_count) if shards is None else shards)
+        ]
+        merged: list[list[str]] = [[] for _ in keys]
+        for shard_candidates in self._fan_out(_query_shard, task_args):
+            for candidates, found in zip(merged, shard_candidates):
+                candidates.extend(found)
+        return {key: sorted(candidates) for key, candidates in zip(keys, merged)}
+
+    def query(self, query_mh: MinHash) -> list[str]:
+        """Return candidate near-duplicates of one signature from all shards.
+
+        Args:
+            query_mh: MinHash signature of the query document.
+
+        Returns:
+            Sorted list of candidate document_ids.
+        """
+        return self.query_batch({"": query_mh})[""]
+
+    def load(self, shard: int) -> MappedLshIndex:
+        """Map one shard (snapshot plus un-compacted log).
+
+        Args:
+            shard: Shard number.
+
+        Returns:
+            MappedLshIndex over that shard's documents.
+        """
+        return self.shard(shard).load()
@@ -0,0 +1,167 @@
+"""
+File Name: stage_timer.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: StageTimer — context manager / decorator recording wall time,
+             CPU time, peak RSS growth, bytes read and written and items per
+             second for one pipeline stage, logged as a 'stage_completed'
+             structured event and kept as StageMetrics.
+
+Note: Code running inside a stage reports its work with record_stage()
+      (items, bytes_read, bytes_written); the call goes to the innermost
+      active StageTimer of the current thread / context and is a no-op when
+      none is active, so processors and writers can report unconditionally.
+      On exit a nested timer adds its bytes to the enclosing one, so a
+      writer timed on its own still counts towards the asset around it;
+      items are not propagated because their unit differs per stage.
+      CPU time is process-wide (os.times(), including reaped child
+      processes).  Peak RSS comes from getrusage(RUSAGE_SELF).ru_maxrss, a
+      high-water mark, so the delta is how far the stage raised the peak;
+      it is 0 where the resource module is unavailable.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Callable
+
+from docfp.logging_config import get_logger
+from docfp.models.stage_metrics import StageMetrics
+
+try:
+    import resource
+except ImportError:  # pragma: no cover — Windows
+    resource = None
+
+log = get_logger(__name__)
+
+_ACTIVE: ContextVar[StageTimer | None] = ContextVar("docfp_active_stage_timer", default=None)
+
+
+def _peak_rss_bytes() -> int:
+    """Return the process peak resident set size in bytes (0 if unknown)."""
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def _cpu_seconds() -> float:
+    """Return user + system CPU seconds of this process and its reaped children."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def record_stage(items: int = 0, bytes_read: int = 0, bytes_written: int = 0) -> None:
+    """Add work to the innermost active StageTimer; no-op when none is active.
+
+    Args:
+        items: Units of work processed (in the timer's unit).
+        bytes_read: Bytes read from input files.
+        bytes_written: Bytes written to output files.
+    """
+    timer = _ACTIVE.get()
+    if timer is not None:
+        timer.record(items=items, bytes_read=bytes_read, bytes_written=bytes_written)
+
+
+class StageTimer:
+    """Measure one pipeline stage.
+
+    Use as a context manager (``with StageTimer("normalize") as timer``) or
+    as a decorator (``@StageTimer("hash_batch", unit="shingles")``), which
+    times every call with a fresh timer.
+
+    Args:
+        stage: Stage name logged with the metrics.
+        unit: What the recorded items count. Default ''.
+        log_level: Level of the 'stage_completed' event; processor stages
+                   called per block or partition use 'debug'. Default 'info'.
+        **log_fields: Extra fields for the 'stage_completed' event
+                      (e.g. document_id, partition_key).
+
+    Returns:
+        StageTimer whose metrics attribute is set on exit.
+    """
+
+    def __init__(
+        self, stage: str, unit: str = "", log_level: str = "info", **log_fields: Any
+    ) -> None:
+        self.stage = stage
+        self.unit = unit
+        self.log_level = log_level
+        self.log_fields = log_fields
+        self.items = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.metrics: StageMetrics | None = None
+        self._started = 0.0
+        self._cpu_started = 0.0
+        self._rss_started = 0
+        self._token: Token | None = None
+
+    def record(self, items: int = 0, bytes_read: int = 0, bytes_written: int = 0) -> None:
+        """Add work done by this stage.
+
+        Args:
+            items: Units of work processed.
+            bytes_read: Bytes read from input files.
+            bytes_written: Bytes written to output files.
+        """
+        self.items += items
+        self.bytes_read += bytes_read
+        self.bytes_written += bytes_written
+
+    def __enter__(self) -> StageTimer:
+        self._rss_started = _peak_rss_bytes()
+        self._cpu_started = _cpu_seconds()
+        self._started = time.perf_counter()
+        self._token = _ACTIVE.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        wall = time.perf_counter() - self._started
+        cpu = _cpu_seconds() - self._cpu_started
+        peak = _peak_rss_bytes()
+        _ACTIVE.reset(self._token)
+
+        parent = _ACTIVE.get()
+        if parent is not None:
+            parent.record(bytes_read=self.bytes_read, bytes_written=self.bytes_written)
+
+        self.metrics = StageMetrics(
+            stage=self.stage,
+            wall_seconds=wall,
+            cpu_seconds=cpu,
+            peak_rss_bytes=peak,
+            peak_rss_delta_bytes=max(0, peak - self._rss_started),
+            bytes_read=self.bytes_read,
+            bytes_written=self.bytes_written,
+            items=self.items,
+            unit=self.unit,
+            items_per_second=self.items / wall if self.items and wall > 0 else 0.0,
+        )
+        getattr(log, self.log_level)(
+            "stage_completed",
+            **self.metrics.as_dict(),
+            **self.log_fields,
+            failed=exc_type is not None,
+        )
+        return False
+
+    def __call__(self, func: Callable) -> Callable:
+        """Decorate func so each call runs inside a new StageTimer."""
+
+        @functools.wraps(func)
+        def _timed(*args: Any, **kwargs: Any) -> Any:
+            with StageTimer(self.stage, self.unit, self.log_level, **self.log_fields):
+                return func(*args, **kwargs)
+
+        return _timed
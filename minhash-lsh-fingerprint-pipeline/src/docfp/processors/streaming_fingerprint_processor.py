@@ -0,0 +1,204 @@
+"""
+File Name: streaming_fingerprint_processor.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: StreamingFingerprintProcessor — fingerprints arbitrarily large
+             text in bounded memory.  Text is read in chunks, normalized and
+             tokenized lazily, shingled in fixed-size token blocks that overlap
+             by shingle_size-1 tokens, hashed, and folded straight into the
+             MinHash sketch and the SHA-256 hash-signature accumulator.
+
+Note: Output equals the in-memory path (normalize → tokenize → generate_batch
+      → hash_batch → hash signature + build_batch) on the same text: block
+      overlap reproduces every window exactly once, MinHash is a per-slot
+      minimum, and the hash signature is computed over the sorted unique set
+      (spilled to disk past spill_threshold digests).  No shingle Parquet is
+      produced on this path.
+
+Requirements:
+- datasketch>=1.6
+- numpy
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from docfp.interfaces.normalizer import Normalizer
+from docfp.interfaces.shingle_hasher import ShingleHasher
+from docfp.logging_config import get_logger
+from docfp.models.streaming_fingerprint import StreamingFingerprint
+from docfp.processors.hash_signature_processor import (
+    DEFAULT_SPILL_THRESHOLD,
+    StreamingHashSignature,
+)
+from docfp.processors.minhash_signature_builder import MinHashSignatureBuilder
+from docfp.processors.normalizer_factory import build_normalizer
+from docfp.processors.shingle_hash_processor import ShingleHashProcessor
+from docfp.processors.word_shingle_generator import DEFAULT_SHINGLE_SIZE, WordShingleGenerator
+
+log = get_logger(__name__)
+
+DEFAULT_CHUNK_CHARS = 1 << 20  # 1 Mi characters read per chunk
+DEFAULT_BLOCK_TOKENS = 65_536  # tokens shingled and hashed per block
+
+
+class StreamingFingerprintProcessor:
+    """Fingerprint a text stream without holding the whole document.
+
+    Args:
+        shingle_size: Word-shingle window size. Default 5.
+        num_perm: MinHash permutation count. Default 128.
+        normalizer: Normalizer providing iter_tokens (build_normalizer() default).
+        hasher: ShingleHasher providing hash_batch (ShingleHashProcessor default).
+        block_tokens: Tokens per shingle/hash block. Default 65,536.
+        spill_threshold: Unique digests buffered before spilling to disk.
+        spill_dir: Parent directory for digest spill runs.
+
+    Returns:
+        StreamingFingerprint from fingerprint_chunks() / fingerprint_file().
+    """
+
+    def __init__(
+        self,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        num_perm: int = 128,
+        normalizer: Normalizer | None = None,
+        hasher: ShingleHasher | None = None,
+        block_tokens: int = DEFAULT_BLOCK_TOKENS,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+        spill_dir: str | Path | None = None,
+    ) -> None:
+        if block_tokens < shingle_size:
+            raise ValueError("block_tokens must be at least shingle_size.")
+        self.shingle_size = shingle_size
+        self.num_perm = num_perm
+        self.normalizer = normalizer or build_normalizer()
+        self.hasher = hasher or ShingleHashProcessor()
+        self.block_tokens = block_tokens
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir
+
+    @staticmethod
+    def iter_file_chunks(
+        path: str | Path,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        encoding: str = "utf-8",
+    ) -> Iterator[str]:
+        """Read a text file as a sequence of decoded chunks.
+
+        Args:
+            path: Text file to read.
+            chunk_chars: Characters per chunk. Default 1 Mi.
+            encoding: Text encoding; undecodable bytes are replaced.
+
+        Returns:
+            Iterator of text chunks.
+        """
+        with open(path, encoding=encoding, errors="replace") as fh:
+            while chunk := fh.read(chunk_chars):
+                yield chunk
+
+    def fingerprint_chunks(
+        self,
+        chunks: Iterable[str],
+        document_id: str,
+        source_uri: str = "",
+        file_name: str = "",
+    ) -> StreamingFingerprint:
+        """Normalize, shingle and hash a chunk stream into document signatures.
+
+        Args:
+            chunks: Raw extracted text split at arbitrary positions.
+            document_id: SHA-256 identifier for the source document.
+            source_uri: Absolute path or URI of the source document.
+            file_name: Original file name with extension.
+
+        Returns:
+            StreamingFingerprint with MinHash and hash signature.
+        """
+        from datasketch import MinHash
+
+        generator = WordShingleGenerator(shingle_size=self.shingle_size)
+        mh_builder = MinHashSignatureBuilder(num_perm=self.num_perm)
+        mh = MinHash(num_perm=self.num_perm)
+        signature = StreamingHashSignature(self.spill_threshold, self.spill_dir)
+
+        tokens = self.normalizer.iter_tokens(chunks)
+        overlap = self.shingle_size - 1
+        carry: list[str] = []
+        token_count = shingle_count = block_count = 0
+        while True:
+            fresh = list(islice(tokens, self.block_tokens - len(carry)))
+            if not fresh:
+                break
+            token_count += len(fresh)
+            block = carry + fresh
+            batch = self.hasher.hash_batch(
+                generator.generate_batch(
+                    document_id=document_id,
+                    source_uri=source_uri,
+                    file_name=file_name,
+                    tokens=block,
+                    normalization_version=self.normalizer.normalization_version,
+                )
+            )
+            mh_builder.update(mh, batch.shingle_hash64)
+            signature.add(batch.shingle_hash_sha256)
+            shingle_count += len(batch)
+            block_count += 1
+            # Keep the last shingle_size-1 tokens so windows spanning the
+            # block boundary are generated exactly once, in the next block.
+            carry = block[len(block) - overlap :] if overlap else []
+
+        spill_runs = signature.spill_run_count
+        sig_sha256, unique_count = signature.finalize()
+        log.info(
+            "streaming_fingerprint_completed",
+            document_id=document_id,
+            token_count=token_count,
+            shingle_count=shingle_count,
+            unique_hash_count=unique_count,
+            block_count=block_count,
+            spill_run_count=spill_runs,
+        )
+        return StreamingFingerprint(
+            document_id=document_id,
+            source_uri=source_uri,
+            token_count=token_count,
+            total_shingle_count=shingle_count,
+            unique_shingle_hash_count=unique_count,
+            hash_signature_sha256=sig_sha256,
+            minhash=mh,
+            block_count=block_count,
+            spill_run_count=spill_runs,
+        )
+
+    def fingerprint_file(
+        self,
+        path: str | Path,
+        document_id: str,
+        chunk_chars: int = DEFAULT_CHUNK_CHARS,
+        encoding: str = "utf-8",
+    ) -> StreamingFingerprint:
+        """Fingerprint a plain-text file by streaming it in chunks.
+
+        Args:
+            path: Text file to fingerprint.
+            document_id: SHA-256 identifier for the source document.
+            chunk_chars: Characters per read chunk. Default 1 Mi.
+            encoding: Text encoding; undecodable bytes are replaced.
+
+        Returns:
+            StreamingFingerprint with MinHash and hash signature.
+        """
+        path = Path(path)
+        return self.fingerprint_chunks(
+            self.iter_file_chunks(path, chunk_chars, encoding),
+            document_id=document_id,
+            source_uri=str(path),
+            file_name=path.name,
+        )
@@ -0,0 +1,204 @@
+"""
+File Name: text_cache.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: ContentAddressedTextCache — on-disk cache of ExtractedDocumentText
+             and NormalizedText keyed by the content checksum (document_id),
+             so re-runs and byte-duplicate uploads skip Tika, OCR and
+             normalization entirely.
+
+Note: Keys:
+        extracted   (document_id, extraction_key)
+        normalized  (document_id, extraction_key, normalization_key)
+      extraction_key names the text source including anything that changes
+      its output (e.g. 'tika', 'tesseract-ocr/eng/300dpi'); normalization_key
+      names the normalizer rule set (e.g. 'v1', 'v1+stopwords').
+      Layout under cache_dir:
+        index.sqlite            key, size, last access (WAL; shared by
+                                batch worker processes)
+        objects/<ab>/<key>.json one entry, written atomically
+      After each put, least-recently-used entries are evicted until the
+      total payload is at most max_bytes.  A hit returns the cached artifact
+      with source_uri replaced by the caller's path, since duplicates live at
+      different paths.
+
+Requirements:
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Any, Optional
+
+from docfp.logging_config import get_logger
+from docfp.models.extracted_text import ExtractedDocumentText
+from docfp.models.normalized_text import NormalizedText
+
+log = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024**3  # 2 GiB of cached text
+_EXTRACTED = "extracted"
+_NORMALIZED = "normalized"
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key          TEXT PRIMARY KEY,
+    kind         TEXT NOT NULL,
+    document_id  TEXT NOT NULL,
+    size_bytes   INTEGER NOT NULL,
+    last_access  REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+"""
+
+
+class ContentAddressedTextCache:
+    """LRU-bounded cache of extracted and normalized text keyed by document_id.
+
+    Args:
+        cache_dir: Cache root (created if absent).
+        max_bytes: Payload size cap; LRU entries are evicted past it. Default 2 GiB.
+
+    Returns:
+        ContentAddressedTextCache instance.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._objects = self.cache_dir / "objects"
+        self._objects.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.cache_dir / "index.sqlite", timeout=30, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+
+    @staticmethod
+    def _key(kind: str, *parts: str) -> str:
+        return hashlib.sha256("\x1f".join((kind, *parts)).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._objects / key[:2] / f"{key}.json"
+
+    def _get(self, key: str) -> Optional[dict[str, Any]]:
+        try:
+            payload = json.loads(self._path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        self._db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        return payload
+
+    def _put(self, key: str, kind: str, document_id: str, payload: dict[str, Any]) -> None:
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (key, kind, document_id, len(data), time.time()),
+        )
+        self._evict()
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in self._db.execute(
+            "SELECT key, size_bytes FROM entries ORDER BY last_access"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._path(key).unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        log.info("text_cache_evicted", evicted_count=evicted, total_bytes=total)
+
+    def get_extracted(
+        self, document_id: str, extraction_key: str, source_uri: str
+    ) -> Optional[ExtractedDocumentText]:
+        """Return cached extracted text for a document, or None.
+
+        Args:
+            document_id: SHA-256 checksum of the source file.
+            extraction_key: Text source identity (engine and its settings).
+            source_uri: Path the caller is processing; stamped onto the hit.
+
+        Returns:
+            ExtractedDocumentText on a hit, otherwise None.
+        """
+        payload = self._get(self._key(_EXTRACTED, document_id, extraction_key))
+        if payload is None:
+            return None
+        return replace(ExtractedDocumentText(**payload), source_uri=source_uri)
+
+    def put_extracted(self, extracted: ExtractedDocumentText, extraction_key: str) -> None:
+        """Store extracted text under (document_id, extraction_key).
+
+        Args:
+            extracted: ExtractedDocumentText with document_id populated.
+            extraction_key: Text source identity (engine and its settings).
+
+        Returns:
+            None.
+        """
+        key = self._key(_EXTRACTED, extracted.document_id, extraction_key)
+        self._put(key, _EXTRACTED, extracted.document_id, asdict(extracted))
+
+    def get_normalized(
+        self,
+        document_id: str,
+        extraction_key: str,
+        normalization_key: str,
+        source_uri: str,
+    ) -> Optional[NormalizedText]:
+        """Return cached normalized text for a document, or None.
+
+        Args:
+            document_id: SHA-256 checksum of the source file.
+            extraction_key: Identity of the text source that was normalized.
+            normalization_key: Normalizer rule set identity.
+            source_uri: Path the caller is processing; stamped onto the hit.
+
+        Returns:
+            NormalizedText on a hit, otherwise None.
+        """
+        payload = self._get(self._key(_NORMALIZED, document_id, extraction_key, normalization_key))
+        if payload is None:
+            return None
+        return replace(NormalizedText(**payload), source_uri=source_uri)
+
+    def put_normalized(
+        self, normalized: NormalizedText, extraction_key: str, normalization_key: str
+    ) -> None:
+        """Store normalized text under (document_id, extraction_key, normalization_key).
+
+        Args:
+            normalized: NormalizedText to cache.
+            extraction_key: Identity of the text source that was normalized.
+            normalization_key: Normalizer rule set identity.
+
+        Returns:
+            None.
+        """
+        key = self._key(_NORMALIZED, normalized.document_id, extraction_key, normalization_key)
+        self._put(key, _NORMALIZED, normalized.document_id, asdict(normalized))
+
+    def close(self) -> None:
+        """Close the index connection.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        self._db.close()
@@ -6,39 +6,27 @@ Description: TextNormalizer — deterministic text normalization: lowercase,
              Unicode NFC, whitespace cleanup, punctuation stripping, and optional
              stopword removal (FR-010, ADR-004).
 
+Note: iter_tokens() applies the same rules to an iterable of text chunks and
+      yields tokens one at a time.  Chunks are cut at their last whitespace
+      character before normalizing; NFC composition, case mapping and the
+      punctuation rule never act across whitespace, so the token stream is
+      identical to normalize(...).text.split() on the joined text.
+
 Requirements:
 - Python 3.12+
 """
 
 from __future__ import annotations
 
-import logging
-import os
 import re
 import unicodedata
-from datetime import datetime
-
-import structlog
+from typing import Iterable, Iterator
 
 from docfp.interfaces.normalizer import Normalizer
+from docfp.logging_config import get_logger
 from docfp.models.normalized_text import NormalizedText
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
 
 NORMALIZATION_VERSION = "v1"
 
@@ -49,6 +37,9 @@ _STOPWORDS: frozenset[str] = frozenset(
     "with by from as and or but not".split()
 )
 
+# Last whitespace character of a string (start of the unfinished trailing token)
+_LAST_WHITESPACE = re.compile(r"\s\S*\Z")
+
 
 class TextNormalizer(Normalizer):
     """Deterministic text normalizer (FR-010, ADR-004).
@@ -69,6 +60,16 @@ class TextNormalizer(Normalizer):
     def __init__(self, remove_stopwords: bool = False) -> None:
         self.remove_stopwords = remove_stopwords
 
+    @property
+    def normalization_version(self) -> str:
+        """Rule set version stamped on NormalizedText: NORMALIZATION_VERSION."""
+        return NORMALIZATION_VERSION
+
+    @property
+    def normalization_key(self) -> str:
+        """Rule set identity: NORMALIZATION_VERSION, plus '+stopwords' when enabled."""
+        return f"{NORMALIZATION_VERSION}+stopwords" if self.remove_stopwords else NORMALIZATION_VERSION
+
     def normalize(self, document_id: str, source_uri: str, text: str) -> NormalizedText:
         """Normalize raw extracted text deterministically.
 
@@ -80,10 +81,7 @@ class TextNormalizer(Normalizer):
         Returns:
             NormalizedText with cleaned, lowercase, unicode-normalized text.
         """
-        normalized = unicodedata.normalize("NFC", text)
-        normalized = normalized.lower()
-        normalized = re.sub(r"[^\w\s]", " ", normalized)  # strip punctuation
-        normalized = re.sub(r"\s+", " ", normalized).strip()  # collapse whitespace
+        normalized = self._clean(text)
 
         if self.remove_stopwords:
             tokens = [t for t in normalized.split() if t not in _STOPWORDS]
@@ -106,3 +104,41 @@ class TextNormalizer(Normalizer):
             normalization_version=NORMALIZATION_VERSION,
             token_count=token_count,
         )
+
+    @staticmethod
+    def _clean(text: str) -> str:
+        normalized = unicodedata.normalize("NFC", text)
+        normalized = normalized.lower()
+        normalized = re.sub(r"[^\w\s]", " ", normalized)  # strip punctuation
+        return re.sub(r"\s+", " ", normalized).strip()  # collapse whitespace
+
+    def _tokens(self, text: str) -> list[str]:
+        """Return the normalized tokens of text (before stopword removal)."""
+        return self._clean(text).split()
+
+    def iter_tokens(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Normalize a stream of raw text chunks and yield tokens lazily.
+
+        Args:
+            chunks: Raw extracted text split at arbitrary positions.
+
+        Returns:
+            Iterator of normalized tokens, equal to the tokens of
+            normalize() applied to the concatenated chunks.
+        """
+        carry = ""
+        for chunk in chunks:
+            buf = carry + chunk
+            match = _LAST_WHITESPACE.search(buf)
+            if match is None:
+                carry = buf  # no token boundary yet
+                continue
+            head, carry = buf[: match.start()], buf[match.start() :]
+            yield from self._filter(self._tokens(head))
+        if carry:
+            yield from self._filter(self._tokens(carry))
+
+    def _filter(self, tokens: list[str]) -> list[str]:
+        if self.remove_stopwords:
+            return [t for t in tokens if t not in _STOPWORDS]
+        return tokens
@@ -11,28 +11,10 @@ Requirements:
 
 from __future__ import annotations
 
-import logging
-import os
-from datetime import datetime
-
-import structlog
-
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+from docfp.logging_config import get_logger
+
+
+log = get_logger(__name__)
 
 
 class TokenizerProcessor:
@@ -57,5 +39,5 @@ class TokenizerProcessor:
             List of non-empty token strings.
         """
         tokens = text.split() if text else []
-        log.info("tokenized", document_id=document_id, token_count=len(tokens))
+        log.debug("tokenized", document_id=document_id, token_count=len(tokens))
         return tokens
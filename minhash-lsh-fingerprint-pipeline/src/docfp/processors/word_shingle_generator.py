@@ -5,40 +5,36 @@ Date: 2026-05-03
 Description: WordShingleGenerator — sliding-window word shingle generation
              (FR-011, ADR-005).  Default shingle size is 5 words.
 
+Note: generate_batch() is the pipeline path: it returns a columnar
+      ShingleBatch (offset arrays computed with NumPy) instead of one
+      ShingleRecord per shingle.  generate() is kept for callers that need
+      row objects.  Optional per-token page_no / section_id arrays (see
+      PageSegmentProcessor.token_positions) give each shingle the page and
+      section of its first token; without them both are 0.  Callers pass the
+      normalization_version of the NormalizedText the tokens came from.
+
 Requirements:
+- numpy
 - Python 3.12+
 """
 
 from __future__ import annotations
 
-import logging
-import os
 from datetime import datetime, timezone
+from typing import Optional
 
-import structlog
+import numpy as np
 
 from docfp.interfaces.shingle_generator import ShingleGenerator
+from docfp.logging_config import get_logger
+from docfp.models.shingle_batch import ShingleBatch
 from docfp.models.shingle_record import ShingleRecord
+from docfp.processors.normalizer_factory import DEFAULT_NORMALIZATION_VERSION
+from docfp.processors.stage_timer import StageTimer, record_stage
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
 
 DEFAULT_SHINGLE_SIZE = 5
-NORMALIZATION_VERSION = "v1"
 
 
 class WordShingleGenerator(ShingleGenerator):
@@ -63,6 +59,9 @@ class WordShingleGenerator(ShingleGenerator):
         tokens: list[str],
         partition_id: int = 0,
         partition_count: int = 1,
+        token_page_no: Optional[np.ndarray] = None,
+        token_section_id: Optional[np.ndarray] = None,
+        normalization_version: str = DEFAULT_NORMALIZATION_VERSION,
     ) -> list[ShingleRecord]:
         """Slide a window of shingle_size tokens over the token list.
 
@@ -73,13 +72,20 @@ class WordShingleGenerator(ShingleGenerator):
             tokens: Normalized token list.
             partition_id: Zero-based index of this partition.
             partition_count: Total number of partitions.
+            token_page_no: Optional int32 source page of each token.
+            token_section_id: Optional int32 section of each token.
+            normalization_version: Rule set that produced the tokens
+                                   (NormalizedText.normalization_version).
 
         Returns:
             List of ShingleRecord with shingle_text, token_start, token_end,
-            char_start, char_end set.  shingle_hash64 and shingle_hash_sha256
-            are set to sentinel values (0 / '') until ShingleHashProcessor runs.
+            char_start, char_end, page_no and section_id set.  shingle_hash64
+            and shingle_hash_sha256 are set to sentinel values (0 / '') until
+            ShingleHashProcessor runs.
         """
         records: list[ShingleRecord] = []
+        pages = token_page_no.tolist() if token_page_no is not None else None
+        sections = token_section_id.tolist() if token_section_id is not None else None
         created_at = datetime.now(timezone.utc).isoformat()
 
         # Pre-compute cumulative char offsets for the token list
@@ -104,8 +110,8 @@ class WordShingleGenerator(ShingleGenerator):
                     partition_count=partition_count,
                     source_uri=source_uri,
                     file_name=file_name,
-                    page_no=0,
-                    section_id=0,
+                    page_no=pages[i] if pages is not None else 0,
+                    section_id=sections[i] if sections is not None else 0,
                     shingle_id=i,
                     shingle_text=shingle_text,
                     shingle_hash64=0,
@@ -114,12 +120,12 @@ class WordShingleGenerator(ShingleGenerator):
                     token_end=i + len(window) - 1,
                     char_start=char_start,
                     char_end=char_end,
-                    normalization_version=NORMALIZATION_VERSION,
+                    normalization_version=normalization_version,
                     created_at_utc=created_at,
                 )
             )
 
-        log.info(
+        log.debug(
             "shingles_generated",
             document_id=document_id,
             shingle_count=len(records),
@@ -127,3 +133,80 @@ class WordShingleGenerator(ShingleGenerator):
             partition_id=partition_id,
         )
         return records
+
+    @StageTimer("generate_batch", unit="shingles", log_level="debug")
+    def generate_batch(
+        self,
+        document_id: str,
+        source_uri: str,
+        file_name: str,
+        tokens: list[str],
+        partition_id: int = 0,
+        partition_count: int = 1,
+        token_page_no: Optional[np.ndarray] = None,
+        token_section_id: Optional[np.ndarray] = None,
+        normalization_version: str = DEFAULT_NORMALIZATION_VERSION,
+    ) -> ShingleBatch:
+        """Slide a window of shingle_size tokens and return columnar offsets.
+
+        Args:
+            document_id: SHA-256 identifier for the source document.
+            source_uri: Absolute path or URI of the source document.
+            file_name: Original file name with extension.
+            tokens: Normalized token list.
+            partition_id: Zero-based index of this partition.
+            partition_count: Total number of partitions.
+            token_page_no: Optional int32 source page of each token.
+            token_section_id: Optional int32 section of each token.
+            normalization_version: Rule set that produced the tokens
+                                   (NormalizedText.normalization_version).
+
+        Returns:
+            ShingleBatch with token/char offset and page/section columns set
+            and hash columns left as None until ShingleHashProcessor.hash_batch
+            runs.
+        """
+        n = len(tokens)
+        k = self.shingle_size
+        count = max(0, n - k + 1)
+
+        lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=n)
+        # Token i starts after the previous tokens plus one space each
+        starts = np.zeros(n, dtype=np.int64)
+        if n > 1:
+            np.cumsum(lengths[:-1] + 1, out=starts[1:])
+
+        batch = ShingleBatch(
+            document_id=document_id,
+            source_uri=source_uri,
+            file_name=file_name,
+            normalization_version=normalization_version,
+            created_at_utc=datetime.now(timezone.utc).isoformat(),
+            shingle_size=k,
+            text=" ".join(tokens),
+            token_start=np.arange(count, dtype=np.int64),
+            char_start=starts[:count].copy(),
+            char_end=starts[k - 1 : k - 1 + count] + lengths[k - 1 : k - 1 + count],
+            partition_id=partition_id,
+            partition_count=partition_count,
+            page_no=(
+                np.asarray(token_page_no[:count], dtype=np.int32)
+                if token_page_no is not None
+                else None
+            ),
+            section_id=(
+                np.asarray(token_section_id[:count], dtype=np.int32)
+                if token_section_id is not None
+                else None
+            ),
+        )
+
+        record_stage(items=count)
+        log.debug(
+            "shingles_generated",
+            document_id=document_id,
+            shingle_count=count,
+            shingle_size=k,
+            partition_id=partition_id,
+        )
+        return batch
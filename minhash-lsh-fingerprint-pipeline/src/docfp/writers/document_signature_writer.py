@@ -5,6 +5,10 @@ Date: 2026-05-03
 Description: DocumentSignatureWriter — writes {doc}.hash_signature.json and
              {doc}.minhash.json (FR-021, FR-023, ADR-012).
 
+Note: The corpus MinHashSignatureStore is the signature of record; these
+      per-document JSON files are an optional, human-readable export
+      (export_signature_json).
+
 Requirements:
 - datasketch>=1.6
 - Python 3.12+
@@ -13,31 +17,17 @@ Requirements:
 from __future__ import annotations
 
 import json
-import logging
-import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import structlog
-from datasketch import MinHash
+from docfp.logging_config import get_logger
+from docfp.processors.stage_timer import record_stage
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+if TYPE_CHECKING:
+    from datasketch import MinHash
 
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
 
 
 class DocumentSignatureWriter:
@@ -134,6 +124,7 @@ class DocumentSignatureWriter:
         with open(minhash_path, "w", encoding="utf-8") as fh:
             json.dump(minhash_doc, fh, indent=2)
 
+        record_stage(bytes_written=sig_path.stat().st_size + minhash_path.stat().st_size)
         log.info(
             "document_signature_written",
             document_id=document_id,
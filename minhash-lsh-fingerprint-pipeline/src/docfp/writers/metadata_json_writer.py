@@ -13,32 +13,14 @@ from __future__ import annotations
 
 import dataclasses
 import json
-import logging
-import os
-from datetime import datetime
 from pathlib import Path
 
-import structlog
-
 from docfp.interfaces.artifact_writer import ArtifactWriter
+from docfp.logging_config import get_logger
 from docfp.models.document_metadata import DocumentMetadata
+from docfp.processors.stage_timer import record_stage
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
 
 
 class MetadataJsonWriter(ArtifactWriter):
@@ -67,5 +49,6 @@ class MetadataJsonWriter(ArtifactWriter):
         out_path = output_dir / f"{stem}.metadata.json"
         with open(out_path, "w", encoding="utf-8") as fh:
             json.dump(dataclasses.asdict(artifact), fh, indent=2)
+        record_stage(bytes_written=out_path.stat().st_size)
         log.info("metadata_json_written", path=str(out_path), document_id=artifact.document_id)
         return out_path
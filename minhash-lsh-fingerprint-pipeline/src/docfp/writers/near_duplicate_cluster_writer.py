@@ -0,0 +1,114 @@
+"""
+File Name: near_duplicate_cluster_writer.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: NearDuplicateClusterWriter — writes near-duplicate cluster
+             assignments to near_duplicate_clusters.parquet, one row per
+             document, grouped by cluster.
+
+Note: cluster_id is the document_id of the cluster's representative (its
+      lowest signature-store row).  Rows are written in row groups of
+      ROW_GROUP_SIZE so the file streams out in bounded memory.
+
+Requirements:
+- numpy
+- pyarrow>=18
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from docfp.logging_config import get_logger
+from docfp.processors.stage_timer import record_stage
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+log = get_logger(__name__)
+
+CLUSTER_FILE = "near_duplicate_clusters.parquet"
+ROW_GROUP_SIZE = 1_048_576
+
+
+@functools.cache
+def cluster_schema() -> pa.Schema:
+    """Return the Arrow schema of near_duplicate_clusters.parquet."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            pa.field("cluster_id", pa.string()),
+            pa.field("document_id", pa.string()),
+            pa.field("signature_row", pa.int64()),
+            pa.field("cluster_size", pa.int64()),
+            pa.field("is_representative", pa.bool_()),
+        ]
+    )
+
+
+class NearDuplicateClusterWriter:
+    """Write cluster assignments produced by NearDuplicateClusterProcessor.
+
+    Returns:
+        Path of the written near_duplicate_clusters.parquet file.
+    """
+
+    def write(
+        self,
+        document_ids: list[str],
+        cluster_rows: np.ndarray,
+        cluster_sizes: np.ndarray,
+        output_dir: Path,
+        include_singletons: bool = False,
+    ) -> Path:
+        """Write one row per clustered document, grouped by cluster.
+
+        Args:
+            document_ids: document_id of every signature-store row.
+            cluster_rows: Representative row of each row's cluster.
+            cluster_sizes: Size of each row's cluster.
+            output_dir: Target directory (created if absent).
+            include_singletons: Also write documents in clusters of one.
+
+        Returns:
+            Path of the written Parquet file.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = cluster_schema()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        out_path = output_dir / CLUSTER_FILE
+        rows = np.arange(len(cluster_rows), dtype=np.int64)
+        if not include_singletons:
+            rows = rows[cluster_sizes > 1]
+        rows = rows[np.lexsort((rows, cluster_rows[rows]))]
+
+        tmp_path = out_path.with_suffix(".parquet.tmp")
+        with pq.ParquetWriter(str(tmp_path), schema) as writer:
+            for start in range(0, len(rows), ROW_GROUP_SIZE):
+                block = rows[start : start + ROW_GROUP_SIZE]
+                representatives = cluster_rows[block]
+                writer.write_table(
+                    pa.Table.from_arrays(
+                        [
+                            pa.array([document_ids[r] for r in representatives.tolist()]),
+                            pa.array([document_ids[r] for r in block.tolist()]),
+                            pa.array(block),
+                            pa.array(cluster_sizes[block].astype(np.int64)),
+                            pa.array(representatives == block),
+                        ],
+                        schema=schema,
+                    )
+                )
+        os.replace(tmp_path, out_path)
+        record_stage(bytes_written=out_path.stat().st_size)
+        log.info("near_duplicate_clusters_written", path=str(out_path), row_count=len(rows))
+        return out_path
@@ -2,111 +2,278 @@
 File Name: shingle_parquet_writer.py
 Author: Senthilnathan Karuppaiah
 Date: 2026-05-03
-Description: ShingleParquetWriter — writes a list of ShingleRecord objects to a
-             temporary {doc}_shingle.parquet file using PyArrow (FR-014, ADR-006).
+Description: ShingleParquetWriter — streams a columnar ShingleBatch (or a list
+             of ShingleRecord objects) to a temporary {doc}_shingle.parquet
+             file using PyArrow (FR-014, ADR-006).
+
+Note: Every column is built as an Arrow array directly, never as per-row
+      dicts.  For a ShingleBatch, uint64 hashes are reinterpreted as int64
+      without copying, and the 'S64' SHA-256 column is wrapped as a
+      fixed-offset string array.  Shingle text is gathered from the UTF-8
+      encoded token string by byte offset in one NumPy pass per row group.
+      Document constants are single-value dictionary arrays.  They are
+      written dictionary-encoded, as are page_no and section_id.  The
+      ascending offset columns use DELTA_BINARY_PACKED.  The file
+      keeps the plain shingle_schema() types (store_schema=False), so
+      readers see string / int32 columns as before.  Rows go through
+      pq.ParquetWriter one row group at a time, so memory is bounded by
+      row_group_size rows.  The file is renamed into place once complete.
 
 Requirements:
+- numpy
 - pyarrow>=18
 - Python 3.12+
 """
 
 from __future__ import annotations
 
-import dataclasses
-import logging
+import functools
 import os
-from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
+from typing import TYPE_CHECKING, Iterator
 
-import pyarrow as pa
-import pyarrow.parquet as pq
-import structlog
+import numpy as np
 
 from docfp.interfaces.artifact_writer import ArtifactWriter
+from docfp.logging_config import get_logger
+from docfp.models.shingle_batch import ShingleBatch
 from docfp.models.shingle_record import ShingleRecord
+from docfp.processors.shingle_hash_processor import utf8_offsets
+from docfp.processors.stage_timer import record_stage
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
-
-SHINGLE_SCHEMA = pa.schema(
-    [
-        pa.field("document_id", pa.string()),
-        pa.field("partition_id", pa.int32()),
-        pa.field("partition_count", pa.int32()),
-        pa.field("source_uri", pa.string()),
-        pa.field("file_name", pa.string()),
-        pa.field("page_no", pa.int32()),
-        pa.field("section_id", pa.int32()),
-        pa.field("shingle_id", pa.int64()),
-        pa.field("shingle_text", pa.string()),
-        pa.field("shingle_hash64", pa.int64()),
-        pa.field("shingle_hash_sha256", pa.string()),
-        pa.field("token_start", pa.int64()),
-        pa.field("token_end", pa.int64()),
-        pa.field("char_start", pa.int64()),
-        pa.field("char_end", pa.int64()),
-        pa.field("normalization_version", pa.string()),
-        pa.field("created_at_utc", pa.string()),
-    ]
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+log = get_logger(__name__)
+
+DEFAULT_COMPRESSION = "zstd"
+DEFAULT_ROW_GROUP_SIZE = 131_072  # rows per Parquet row group
+CONSTANT_COLUMNS = (
+    "document_id",
+    "partition_id",
+    "partition_count",
+    "source_uri",
+    "file_name",
+    "normalization_version",
+    "created_at_utc",
 )
+DICTIONARY_COLUMNS = CONSTANT_COLUMNS + ("page_no", "section_id")
+# Ascending offsets: delta-encoded to a few bits per row before compression.
+DELTA_COLUMNS = ("shingle_id", "token_start", "token_end", "char_start", "char_end")
+_MAX_STRING_BYTES = (1 << 31) - 1  # int32 offsets of a pa.string() array
+
+
+@functools.cache
+def shingle_schema() -> pa.Schema:
+    """Return the Arrow schema of {doc}_shingle.parquet."""
+    import pyarrow as pa
+
+    return pa.schema(
+        [
+            pa.field("document_id", pa.string()),
+            pa.field("partition_id", pa.int32()),
+            pa.field("partition_count", pa.int32()),
+            pa.field("source_uri", pa.string()),
+            pa.field("file_name", pa.string()),
+            pa.field("page_no", pa.int32()),
+            pa.field("section_id", pa.int32()),
+            pa.field("shingle_id", pa.int64()),
+            pa.field("shingle_text", pa.string()),
+            pa.field("shingle_hash64", pa.int64()),
+            pa.field("shingle_hash_sha256", pa.string()),
+            pa.field("token_start", pa.int64()),
+            pa.field("token_end", pa.int64()),
+            pa.field("char_start", pa.int64()),
+            pa.field("char_end", pa.int64()),
+            pa.field("normalization_version", pa.string()),
+            pa.field("created_at_utc", pa.string()),
+        ]
+    )
+
+
+@functools.cache
+def _write_schema() -> pa.Schema:
+    """Return shingle_schema() with CONSTANT_COLUMNS as int32-indexed dictionaries."""
+    import pyarrow as pa
+
+    schema = shingle_schema()
+    for name in CONSTANT_COLUMNS:
+        index = schema.get_field_index(name)
+        field = schema.field(index)
+        schema = schema.set(index, field.with_type(pa.dictionary(pa.int32(), field.type)))
+    return schema
+
+
+def _gather_text(raw: np.ndarray, byte_start: np.ndarray, byte_end: np.ndarray) -> pa.Array:
+    """Build a string array whose i-th value is raw[byte_start[i]:byte_end[i]]."""
+    import pyarrow as pa
+
+    # int32 positions halve the memory traffic of the gather whenever they fit.
+    index_type = np.int32 if len(raw) <= _MAX_STRING_BYTES else np.int64
+    lengths = byte_end - byte_start
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    total = int(offsets[-1])
+    if total > _MAX_STRING_BYTES:
+        raise ValueError(f"Row group holds {total} bytes of shingle text; lower row_group_size.")
+    positions = np.arange(total, dtype=index_type)
+    positions += np.repeat((byte_start - offsets[:-1]).astype(index_type), lengths)
+    return pa.StringArray.from_buffers(
+        len(lengths), pa.py_buffer(offsets.astype(np.int32)), pa.py_buffer(raw[positions])
+    )
+
+
+def _batch_row_groups(batch: ShingleBatch, row_group_size: int) -> Iterator[list[pa.Array]]:
+    """Yield the _write_schema() columns of a hashed ShingleBatch, one row group at a time."""
+    import pyarrow as pa
+
+    raw = np.frombuffer(batch.text.encode("utf-8"), dtype=np.uint8)
+    byte_start, byte_end = utf8_offsets(batch.text, batch.char_start, batch.char_end)
+    constants = {
+        "document_id": pa.array([batch.document_id], pa.string()),
+        "partition_id": pa.array([batch.partition_id], pa.int32()),
+        "partition_count": pa.array([batch.partition_count], pa.int32()),
+        "source_uri": pa.array([batch.source_uri], pa.string()),
+        "file_name": pa.array([batch.file_name], pa.string()),
+        "normalization_version": pa.array([batch.normalization_version], pa.string()),
+        "created_at_utc": pa.array([batch.created_at_utc], pa.string()),
+    }
+    names = _write_schema().names
+    for start in range(0, len(batch), row_group_size):
+        rows = slice(start, min(start + row_group_size, len(batch)))
+        n = rows.stop - rows.start
+        zeros = np.zeros(n, dtype=np.int32)
+        indices = pa.array(zeros)
+        sha_hex = np.ascontiguousarray(batch.shingle_hash_sha256[rows], dtype="S64")
+        token_start = batch.token_start[rows]
+        columns = {
+            name: pa.DictionaryArray.from_arrays(indices, dictionary)
+            for name, dictionary in constants.items()
+        }
+        columns.update(
+            {
+                "page_no": pa.array(
+                    batch.page_no[rows] if batch.page_no is not None else zeros, pa.int32()
+                ),
+                "section_id": pa.array(
+                    batch.section_id[rows] if batch.section_id is not None else zeros,
+                    pa.int32(),
+                ),
+                "shingle_id": pa.array(np.arange(rows.start, rows.stop, dtype=np.int64)),
+                "shingle_text": _gather_text(raw, byte_start[rows], byte_end[rows]),
+                # xxhash64 is unsigned; Parquet column is signed int64 (same bits).
+                "shingle_hash64": pa.array(batch.shingle_hash64[rows].view(np.int64)),
+                "shingle_hash_sha256": pa.StringArray.from_buffers(
+                    n,
+                    pa.py_buffer(np.arange(0, 64 * (n + 1), 64, dtype=np.int32)),
+                    pa.py_buffer(sha_hex),
+                ),
+                "token_start": pa.array(token_start),
+                "token_end": pa.array(token_start + (batch.shingle_size - 1)),
+                "char_start": pa.array(batch.char_start[rows]),
+                "char_end": pa.array(batch.char_end[rows]),
+            }
+        )
+        yield [columns[name] for name in names]
+
+
+def _record_row_groups(
+    records: list[ShingleRecord], row_group_size: int
+) -> Iterator[list[pa.Array]]:
+    """Yield the _write_schema() columns of ShingleRecord objects, one row group at a time."""
+    import pyarrow as pa
+
+    fields = list(shingle_schema())
+    getters = [attrgetter(field.name) for field in fields]
+    for start in range(0, len(records), row_group_size):
+        chunk = records[start : start + row_group_size]
+        columns = []
+        for field, getter in zip(fields, getters):
+            values = list(map(getter, chunk))
+            if field.name == "shingle_hash64":
+                # xxhash64 is unsigned; reinterpret as signed int64 with the same bits.
+                array = pa.array(np.array(values, dtype=np.uint64).view(np.int64))
+            else:
+                array = pa.array(values, field.type)
+            if field.name in CONSTANT_COLUMNS:
+                array = array.dictionary_encode()
+            columns.append(array)
+        yield columns
 
 
 class ShingleParquetWriter(ArtifactWriter):
-    """Write ShingleRecord list to {doc}_shingle.parquet using PyArrow.
+    """Write a ShingleBatch or ShingleRecord list to {doc}_shingle.parquet.
 
     Args:
-        artifact: List of ShingleRecord objects.
-        output_dir: Destination directory.
+        compression: Parquet codec ('zstd', 'snappy', 'gzip', 'lz4',
+                     'brotli' or 'none'). Default 'zstd'.
+        compression_level: Codec level; None uses the codec default.
+        row_group_size: Rows per row group (and per Arrow batch built in
+                        memory). Default 131 072.
 
     Returns:
         Path of the written {doc}_shingle.parquet file.
     """
 
-    def write(self, artifact: list[ShingleRecord], output_dir: Path) -> Path:
-        """Convert ShingleRecord list to PyArrow table and write Parquet.
+    def __init__(
+        self,
+        compression: str = DEFAULT_COMPRESSION,
+        compression_level: int | None = None,
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+    ) -> None:
+        if row_group_size < 1:
+            raise ValueError(f"row_group_size must be positive, got {row_group_size}")
+        self.compression = compression
+        self.compression_level = compression_level
+        self.row_group_size = row_group_size
+
+    def write(self, artifact: ShingleBatch | list[ShingleRecord], output_dir: Path) -> Path:
+        """Stream shingles to Parquet one row group at a time.
 
         Args:
-            artifact: List of ShingleRecord instances.
+            artifact: Hashed ShingleBatch, or a list of ShingleRecord instances.
             output_dir: Target directory (created if absent).
 
         Returns:
             Path of the written Parquet file.
         """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
         output_dir.mkdir(parents=True, exist_ok=True)
-        if not artifact:
+        if not len(artifact):
             raise ValueError("Cannot write an empty shingle list to Parquet.")
 
-        rows = []
-        for r in artifact:
-            row = dataclasses.asdict(r)
-            # xxhash.xxh64 returns unsigned uint64; PyArrow int64 is signed.
-            # Reinterpret as signed so values >2^63-1 don't overflow.
-            h = row["shingle_hash64"]
-            if h >= (1 << 63):
-                row["shingle_hash64"] = h - (1 << 64)
-            rows.append(row)
-        table = pa.Table.from_pylist(rows, schema=SHINGLE_SCHEMA)
-        file_name = Path(artifact[0].file_name).stem
+        if isinstance(artifact, ShingleBatch):
+            row_groups = _batch_row_groups(artifact, self.row_group_size)
+            file_name = Path(artifact.file_name).stem
+            document_id = artifact.document_id
+        else:
+            row_groups = _record_row_groups(artifact, self.row_group_size)
+            file_name = Path(artifact[0].file_name).stem
+            document_id = artifact[0].document_id
         out_path = output_dir / f"{file_name}_shingle.parquet"
-        pq.write_table(table, str(out_path))
+        tmp_path = out_path.with_suffix(".parquet.tmp")
+        schema = _write_schema()
+        with pq.ParquetWriter(
+            str(tmp_path),
+            schema,
+            compression=self.compression,
+            compression_level=self.compression_level,
+            use_dictionary=list(DICTIONARY_COLUMNS),
+            column_encoding=dict.fromkeys(DELTA_COLUMNS, "DELTA_BINARY_PACKED"),
+            store_schema=False,
+        ) as writer:
+            for columns in row_groups:
+                writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=schema))
+        os.replace(tmp_path, out_path)
+        record_stage(bytes_written=out_path.stat().st_size)
         log.info(
             "shingle_parquet_written",
             path=str(out_path),
             row_count=len(artifact),
-            document_id=artifact[0].document_id,
+            document_id=document_id,
+            compression=self.compression,
         )
         return out_path
@@ -11,33 +11,15 @@ Requirements:
 
 from __future__ import annotations
 
-import logging
-import os
-from datetime import datetime
 from pathlib import Path
 
-import structlog
-
 from docfp.interfaces.artifact_writer import ArtifactWriter
+from docfp.logging_config import get_logger
 from docfp.models.extracted_text import ExtractedDocumentText
 from docfp.models.normalized_text import NormalizedText
+from docfp.processors.stage_timer import record_stage
 
-script_name = os.path.splitext(os.path.basename(__file__))[0]
-log_filename = f"{script_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(filename=log_filename, level=logging.INFO, format="%(message)s")
-structlog.configure(
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer(),
-    ],
-)
-log = structlog.get_logger()
+log = get_logger(__name__)
 
 
 class RawTextWriter(ArtifactWriter):
@@ -65,6 +47,7 @@ class RawTextWriter(ArtifactWriter):
         stem = Path(artifact.source_uri).stem
         out_path = output_dir / f"{stem}.extracted.txt"
         out_path.write_text(artifact.text, encoding="utf-8")
+        record_stage(bytes_written=out_path.stat().st_size)
         log.info("raw_text_written", path=str(out_path), document_id=artifact.document_id)
         return out_path
 
@@ -94,5 +77,6 @@ class NormalizedTextWriter(ArtifactWriter):
         stem = Path(artifact.source_uri).stem
         out_path = output_dir / f"{stem}.normalized.txt"
         out_path.write_text(artifact.text, encoding="utf-8")
+        record_stage(bytes_written=out_path.stat().st_size)
         log.info("normalized_text_written", path=str(out_path), document_id=artifact.document_id)
         return out_path
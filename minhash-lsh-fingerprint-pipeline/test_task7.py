@@ -1,4 +1,4 @@
-"""Verify Dagster Definitions loads with all 12 assets."""
+"""Verify Dagster Definitions loads the 12 pipeline assets and the corpus-level assets."""
 from docfp.dagster_defs import defs
 assets = list(defs.resolve_all_asset_keys())
 expected = {
@@ -7,6 +7,7 @@ expected = {
     "document_shingle_hashes", "document_shingle_parquet",
     "document_hash_signature", "document_minhash_signature",
     "lsh_index", "document_fingerprint_summary",
+    "corpus_fingerprint_batch", "near_duplicate_clusters",
 }
 found = {k.path[-1] for k in assets}
 assert found == expected, f"Missing: {expected - found}, Extra: {found - expected}"
@@ -0,0 +1,75 @@
+"""
+File Name: test_import_time.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: Cold-start checks for the Dagster code location — loading
+             docfp.dagster_defs must not import the heavy extraction,
+             MinHash and Arrow dependencies, start logging threads, and must
+             stay within an import-time budget.
+
+Note: Each check runs in a fresh interpreter.  dagster is imported first
+      and excluded from the measurement, so the budget covers docfp's own
+      modules and the asset definitions.  Override the budget with
+      DOCFP_IMPORT_BUDGET_SECONDS on slow CI runners.
+
+Requirements:
+- pytest>=8
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+DEFAULT_BUDGET_SECONDS = 0.75
+LAZY_MODULES = (
+    "datasketch",
+    "scipy",
+    "pyarrow",
+    "tika",
+    "requests",
+    "magic",
+    "pdfplumber",
+    "structlog",
+)
+
+_PROBE = """
+import json, sys, threading, time
+import dagster
+started = time.perf_counter()
+import docfp.dagster_defs
+seconds = time.perf_counter() - started
+from docfp import logging_config
+print(json.dumps({
+    "seconds": seconds,
+    "loaded": sorted(m for m in %r if m in sys.modules),
+    "threads": threading.active_count(),
+    "listener": logging_config._listener is not None,
+}))
+""" % (LAZY_MODULES,)
+
+
+def _probe() -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_heavy_dependencies_are_not_imported():
+    assert _probe()["loaded"] == []
+
+
+def test_import_starts_no_logging_thread():
+    result = _probe()
+    assert result["threads"] == 1
+    assert not result["listener"]
+
+
+def test_import_time_budget():
+    budget = float(os.environ.get("DOCFP_IMPORT_BUDGET_SECONDS", DEFAULT_BUDGET_SECONDS))
+    best = min(_probe()["seconds"] for _ in range(3))
+    assert best <= budget, f"docfp.dagster_defs imported in {best:.3f}s (budget {budget}s)"
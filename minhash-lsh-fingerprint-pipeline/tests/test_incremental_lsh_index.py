@@ -0,0 +1,106 @@
+"""
+File Name: test_incremental_lsh_index.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: IncrementalLshIndex checks — log replay, compaction, duplicate
+             appends, and recovery from a torn last line in the append log.
+
+Note: Signatures are small synthetic MinHashes; min_compaction_entries is
+      raised so appends after the first stay in the log.
+
+Requirements:
+- datasketch>=1.6
+- pytest>=8
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from datasketch import MinHash
+
+from docfp.processors.incremental_lsh_index import IncrementalLshIndex
+
+
+def _minhash(seed: int) -> MinHash:
+    mh = MinHash(num_perm=128)
+    for token in range(seed * 10, seed * 10 + 20):
+        mh.update(f"token-{token}".encode("utf-8"))
+    return mh
+
+
+def _signatures(seeds) -> dict[str, MinHash]:
+    return {f"doc-{seed}": _minhash(seed) for seed in seeds}
+
+
+def _log_count(index: IncrementalLshIndex) -> int:
+    return json.loads(index.manifest_path.read_text(encoding="utf-8"))["log_count"]
+
+
+@pytest.fixture
+def index(tmp_path) -> IncrementalLshIndex:
+    return IncrementalLshIndex(tmp_path, min_compaction_entries=100)
+
+
+def test_first_append_compacts_and_later_appends_replay_from_log(index):
+    index.append(_signatures(range(5)))
+    assert index.snapshot_path.exists()
+    assert not index.log_path.exists()
+
+    index.append(_signatures(range(5, 8)))
+    assert _log_count(index) == 3
+    loaded = index.load()
+    assert len(loaded) == 8
+    assert "doc-6" in loaded.query(_minhash(6))
+
+
+def test_compact_folds_log_into_snapshot(index):
+    index.append(_signatures(range(5)))
+    index.append(_signatures(range(5, 8)))
+    index.compact()
+    assert not index.log_path.exists()
+    assert _log_count(index) == 0
+    assert len(index.load()) == 8
+
+
+def test_log_count_ignores_documents_already_in_snapshot(index):
+    index.append(_signatures(range(5)))
+    index.append(_signatures(range(3, 8)))
+    assert _log_count(index) == 3
+    assert index.log_path.read_text(encoding="utf-8").count("\n") == 3
+    assert len(index.load()) == 8
+
+
+def test_torn_last_line_is_skipped_on_load_and_cut_on_append(index):
+    index.append(_signatures(range(5)))
+    index.append(_signatures([5]))
+    with open(index.log_path, "a", encoding="utf-8") as fh:
+        fh.write('{"document_id": "doc-torn", "hashval')
+
+    loaded = index.load()
+    assert len(loaded) == 6
+    assert "doc-torn" not in loaded
+
+    index.append(_signatures([6]))
+    lines = index.log_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["document_id"] for line in lines] == ["doc-5", "doc-6"]
+    assert _log_count(index) == 2
+
+    index.compact()
+    assert len(index.load()) == 7
+
+
+def test_torn_only_line_leaves_an_empty_log(index):
+    index.append(_signatures(range(5)))
+    index.log_path.write_text('{"document_id": "doc-torn"', encoding="utf-8")
+    index.append(_signatures([9]))
+    lines = index.log_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["document_id"] for line in lines] == ["doc-9"]
+
+
+def test_mismatched_parameters_are_rejected(index, tmp_path):
+    index.append(_signatures(range(2)))
+    with pytest.raises(ValueError, match="threshold"):
+        IncrementalLshIndex(tmp_path, threshold=0.8).load()
@@ -0,0 +1,159 @@
+"""
+File Name: test_lsh_index_file.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: MappedLshIndex / .lshx checks — write/open round trip, queries on
+             written plus pending documents against datasketch MinHashLSH,
+             LshIndexBuilder.save() of a built index, legacy pickle migration,
+             and header validation.
+
+Note: Documents come in near-duplicate families (shared token prefix) so
+      queries return non-trivial candidate sets.
+
+Requirements:
+- datasketch>=1.6
+- pytest>=8
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import pickle
+import struct
+
+import numpy as np
+import pytest
+from datasketch import MinHash, MinHashLSH
+
+from docfp.processors.incremental_lsh_index import IncrementalLshIndex
+from docfp.processors.lsh_index_builder import LEGACY_LSH_INDEX_FILE, LshIndexBuilder
+from docfp.processors.lsh_index_file import LSH_INDEX_FORMAT_VERSION, MappedLshIndex
+
+THRESHOLD = 0.5
+NUM_PERM = 128
+
+
+def _minhash(family: int, variant: int) -> MinHash:
+    mh = MinHash(num_perm=NUM_PERM)
+    for token in range(40):
+        mh.update(f"family-{family}-token-{token}".encode("utf-8"))
+    for token in range(variant * 4):
+        mh.update(f"variant-{family}-{variant}-{token}".encode("utf-8"))
+    return mh
+
+
+def _signatures(families: range, variants: int = 4) -> dict[str, MinHash]:
+    return {
+        f"doc-{family}-{variant}": _minhash(family, variant)
+        for family in families
+        for variant in range(variants)
+    }
+
+
+def _mapped(signatures: dict[str, MinHash]) -> MappedLshIndex:
+    index = MappedLshIndex(threshold=THRESHOLD, num_perm=NUM_PERM)
+    index.insert_batch(list(signatures), np.stack([mh.hashvalues for mh in signatures.values()]))
+    return index
+
+
+def _reference(signatures: dict[str, MinHash]) -> MinHashLSH:
+    lsh = MinHashLSH(threshold=THRESHOLD, num_perm=NUM_PERM)
+    for doc_id, mh in signatures.items():
+        lsh.insert(doc_id, mh)
+    return lsh
+
+
+def _assert_same_candidates(index, reference: MinHashLSH, queries: dict[str, MinHash]) -> None:
+    for doc_id, mh in queries.items():
+        assert sorted(index.query(mh)) == sorted(reference.query(mh)), doc_id
+
+
+def test_write_open_round_trip(tmp_path):
+    signatures = _signatures(range(10))
+    path = _mapped(signatures).write(tmp_path / "corpus_lsh_index.lshx")
+
+    opened = MappedLshIndex.open(path)
+    assert len(opened) == len(signatures)
+    assert (opened.threshold, opened.num_perm) == (THRESHOLD, NUM_PERM)
+    for doc_id in signatures:
+        assert doc_id in opened
+        assert opened.document_id(opened.row_of(doc_id)) == doc_id
+    assert "doc-missing" not in opened
+    assert opened.known(["doc-3-1", "doc-missing"]) == [True, False]
+    _assert_same_candidates(opened, _reference(signatures), signatures)
+
+
+def test_written_plus_pending_queries_match_minhashlsh(tmp_path):
+    written = _signatures(range(6))
+    pending = _signatures(range(4, 10))  # families 4-5 overlap the written ones
+    path = _mapped(written).write(tmp_path / "corpus_lsh_index.lshx")
+
+    opened = MappedLshIndex.open(path)
+    inserted = opened.insert_batch(
+        list(pending), np.stack([mh.hashvalues for mh in pending.values()])
+    )
+    assert inserted == len(set(pending) - set(written))
+    everything = {**written, **pending}
+    reference = _reference(everything)
+    _assert_same_candidates(opened, reference, everything)
+
+    rewritten = MappedLshIndex.open(opened.write(tmp_path / "rewritten.lshx"))
+    assert len(rewritten) == len(everything)
+    _assert_same_candidates(rewritten, reference, everything)
+
+
+def test_builder_saves_a_built_index(tmp_path):
+    signatures = _signatures(range(5))
+    builder = LshIndexBuilder(threshold=THRESHOLD, num_perm=NUM_PERM)
+    lsh = builder.build(signatures)
+
+    loaded = builder.load(builder.save(lsh, tmp_path / "from_lsh"))
+    _assert_same_candidates(loaded, lsh, signatures)
+
+    resaved = builder.load(builder.save(loaded, tmp_path / "from_mapped"))
+    assert len(resaved) == len(signatures)
+    _assert_same_candidates(resaved, lsh, signatures)
+
+
+def test_builder_load_rejects_other_parameters(tmp_path):
+    builder = LshIndexBuilder(threshold=THRESHOLD, num_perm=NUM_PERM)
+    path = builder.save(builder.build(_signatures(range(2))), tmp_path)
+    with pytest.raises(ValueError, match="threshold"):
+        LshIndexBuilder(threshold=0.8, num_perm=NUM_PERM).load(path)
+
+
+def test_legacy_pickle_is_migrated(tmp_path):
+    signatures = _signatures(range(5))
+    lsh = _reference(signatures)
+    with open(tmp_path / LEGACY_LSH_INDEX_FILE, "wb") as fh:
+        pickle.dump(lsh, fh)
+
+    index = IncrementalLshIndex(tmp_path, threshold=THRESHOLD, num_perm=NUM_PERM)
+    _assert_same_candidates(index.load(), lsh, signatures)
+    index.compact()
+    assert not (tmp_path / LEGACY_LSH_INDEX_FILE).exists()
+    _assert_same_candidates(index.load(), lsh, signatures)
+
+
+def test_open_rejects_bad_magic(tmp_path):
+    path = _mapped(_signatures(range(2))).write(tmp_path / "corpus_lsh_index.lshx")
+    with open(path, "r+b") as fh:
+        fh.write(b"NOTANIDX")
+    with pytest.raises(ValueError, match="not a docfp LSH index"):
+        MappedLshIndex.open(path)
+
+
+def test_open_rejects_truncated_header(tmp_path):
+    path = tmp_path / "corpus_lsh_index.lshx"
+    path.write_bytes(b"DOCFPLSH")
+    with pytest.raises(ValueError, match="not a docfp LSH index"):
+        MappedLshIndex.open(path)
+
+
+def test_open_rejects_unknown_version(tmp_path):
+    path = _mapped(_signatures(range(2))).write(tmp_path / "corpus_lsh_index.lshx")
+    with open(path, "r+b") as fh:
+        fh.seek(8)
+        fh.write(struct.pack("<I", LSH_INDEX_FORMAT_VERSION + 1))
+    with pytest.raises(ValueError, match="format version"):
+        MappedLshIndex.open(path)
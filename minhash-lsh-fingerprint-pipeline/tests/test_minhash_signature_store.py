@@ -0,0 +1,105 @@
+"""
+File Name: test_minhash_signature_store.py
+Author: Senthilnathan Karuppaiah
+Date: 2026-05-03
+Description: MinHashSignatureStore checks — append/read round trip, duplicate
+             appends, visibility across instances, parameter validation and
+             recovery from a crash between the data and ids writes.
+
+Requirements:
+- datasketch>=1.6
+- numpy>=1.24
+- pytest>=8
+- Python 3.12+
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from datasketch import MinHash
+
+from docfp.processors.minhash_signature_store import MinHashSignatureStore
+
+
+def _minhash(seed: int, num_perm: int = 128) -> MinHash:
+    mh = MinHash(num_perm=num_perm)
+    for token in range(20):
+        mh.update(f"doc-{seed}-token-{token}".encode("utf-8"))
+    return mh
+
+
+def _signatures(seeds) -> dict[str, MinHash]:
+    return {f"doc-{seed}": _minhash(seed) for seed in seeds}
+
+
+def test_append_and_read_round_trip(tmp_path):
+    signatures = _signatures(range(5))
+    store = MinHashSignatureStore(tmp_path)
+    rows = store.append(signatures)
+
+    assert rows == {f"doc-{seed}": seed for seed in range(5)}
+    assert len(store) == 5
+    assert store.document_ids == list(signatures)
+    matrix = store.matrix()
+    assert matrix.shape == (5, 128)
+    for doc_id, mh in signatures.items():
+        assert np.array_equal(matrix[store.row_of(doc_id)], mh.hashvalues)
+        assert store.minhash(doc_id).jaccard(mh) == 1.0
+    assert store.row_of("doc-missing") is None
+    assert store.minhash("doc-missing") is None
+    with pytest.raises(IndexError):
+        store.get(5)
+
+
+def test_reappending_known_documents_is_a_no_op(tmp_path):
+    store = MinHashSignatureStore(tmp_path)
+    store.append(_signatures(range(3)))
+    rows = store.append(_signatures(range(2, 5)))
+
+    assert rows == {"doc-2": 2, "doc-3": 3, "doc-4": 4}
+    assert len(store) == 5
+    assert store.data_path.stat().st_size == 5 * store.row_bytes
+
+
+def test_other_instances_see_appended_rows(tmp_path):
+    reader = MinHashSignatureStore(tmp_path)
+    MinHashSignatureStore(tmp_path).append(_signatures(range(3)))
+    assert len(reader) == 0
+    assert reader.refresh() == 3
+    assert "doc-1" in reader
+    assert np.array_equal(reader.get(1), _minhash(1).hashvalues)
+
+
+def test_mismatched_num_perm_is_rejected(tmp_path):
+    MinHashSignatureStore(tmp_path).append(_signatures(range(2)))
+    with pytest.raises(ValueError, match="num_perm=128"):
+        MinHashSignatureStore(tmp_path, num_perm=64)
+    with pytest.raises(ValueError, match="permutations"):
+        MinHashSignatureStore(tmp_path).append({"doc-short": _minhash(9, num_perm=64)})
+
+
+def test_rows_written_without_ids_are_truncated(tmp_path):
+    store = MinHashSignatureStore(tmp_path)
+    store.append(_signatures(range(2)))
+    with open(store.data_path, "ab") as fh:  # crash after the data write
+        fh.write(b"\xff" * (store.row_bytes + 17))
+
+    reopened = MinHashSignatureStore(tmp_path)
+    assert len(reopened) == 2
+    reopened.append(_signatures([7]))
+    assert reopened.data_path.stat().st_size == 3 * reopened.row_bytes
+    assert np.array_equal(reopened.get(2), _minhash(7).hashvalues)
+
+
+def test_torn_id_line_is_ignored_and_replaced(tmp_path):
+    store = MinHashSignatureStore(tmp_path)
+    store.append(_signatures(range(2)))
+    with open(store.ids_path, "ab") as fh:  # crash mid ids write
+        fh.write(b"doc-to")
+
+    reopened = MinHashSignatureStore(tmp_path)
+    assert reopened.document_ids == ["doc-0", "doc-1"]
+    reopened.append(_signatures([7]))
+    assert store.ids_path.read_text(encoding="ascii").splitlines() == ["doc-0", "doc-1", "doc-7"]
+    assert MinHashSignatureStore(tmp_path).row_of("doc-7") == 2